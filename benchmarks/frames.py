@@ -0,0 +1,94 @@
+#=========================================================================================================
+# File:        frames.py
+# Case:        VUT, FIT, IPP, project
+# Description: Benchmark of the frame instructions of interpret.py, runs the programs of the frames tests
+#              and measures how the time of a recursive call of the recursion workload of workloads.py scales
+#              with the depth of the recursion and with the number of variables in each frame. The time of a call
+#              includes the definition of its variables, compare interprets by --interpret to see the cost of
+#              moving the frames.
+#==========================================================================================================
+
+import sys
+import os
+import tempfile
+import workloads
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+INTERPRET = os.path.join(ROOT, "interpret.py")
+FRAMES_TESTS = os.path.join(ROOT, "FIT_tests", "interpret-only", "frames")
+TESTS = sorted(os.path.join(FRAMES_TESTS, name[:-4]) for name in os.listdir(FRAMES_TESTS) if name.endswith(".src"))
+TESTS.append(os.path.join(ROOT, "tests", "int_only", "frames_recursion"))
+DEPTHS = [1000, 10000, 100000]
+VARIABLES = [1, 10, 100]
+
+def run_tests(interpret):
+    """
+    Runs the programs of the frames tests and of the recursion test and checks their return codes and outputs.
+
+    Return
+    -------
+    bool
+        All tests passed.
+    """
+    passed = True
+    for test in TESTS:
+        elapsed, code, output, _ = workloads.run([sys.executable, interpret, "--source=" + test + ".src"],
+                                                 test + ".in")
+        with open(test + ".rc") as f:
+            expected_code = int(f.read())
+        with open(test + ".out", "rb") as f:
+            expected_output = f.read()
+
+        result = "ok" if code == expected_code and (code != 0 or output == expected_output) else "FAILED"
+        passed = passed and result == "ok"
+        print("%-20s %10.3f   %s" % (os.path.basename(test), elapsed, result))
+
+    return passed
+
+def main():
+    opts = workloads.parse_arguments(["help", "interpret=", "depths=", "variables="])
+
+    interpret = INTERPRET
+    depths = DEPTHS
+    variables = VARIABLES
+    for opt, value in opts:
+        if opt == "--help":
+            print(
+"""Usage: frames.py [option] ...
+Options:
+--help              Display help message.
+--interpret=<file>  The interpret to be measured (default ../interpret.py).
+--depths=<n,...>    Comma separated depths of the recursion (default 1000,10000,100000).
+--variables=<n,...> Comma separated numbers of variables in each frame (default 1,10,100).""")
+            exit(0)
+        elif opt == "--interpret":
+            interpret = value
+        elif opt == "--depths":
+            depths = workloads.positive_numbers(value)
+        elif opt == "--variables":
+            variables = workloads.positive_numbers(value)
+
+    print("test                   time [s]")
+    if not run_tests(interpret):
+        exit(1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "empty.xml")
+        workloads.write_program(path, workloads.recursion(1)[0])
+        startup = workloads.run([sys.executable, interpret, "--source=" + path], os.devnull)[0]
+
+        print()
+        print("variables      depth   time [s]   per call [us]")
+        for count in variables:
+            for depth in depths:
+                path = os.path.join(directory, "%d_%d.xml" % (count, depth))
+                lines, _, expected = workloads.recursion(depth, count)
+                workloads.write_program(path, lines)
+                elapsed, code, output, _ = workloads.run([sys.executable, interpret, "--source=" + path], os.devnull)
+                os.unlink(path)
+                if code != 0 or output != expected.encode():
+                    print("interpret failed on", path, file=sys.stderr)
+                    exit(1)
+                print("%9d %10d %10.3f %15.2f" % (count, depth, elapsed, (elapsed - startup) / depth * 1e6))
+
+main()
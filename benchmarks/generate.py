@@ -0,0 +1,116 @@
+#=========================================================================================================
+# File:        generate.py
+# Case:        VUT, FIT, IPP, project
+# Description: Generator of synthetic workloads of interpret.py, writes the programs of workloads.py in the XML
+#              representation with their input, expected output and return code in the layout of the tests (.src,
+#              .in, .out, .rc), so they can be run by test.php as well as measured. Each workload is scaled by its
+#              size, which is the number of iterations of its loop, the depth of its recursion, the length of its
+#              string or the number of its input lines, the static workload has ten times as many instructions.
+#              Given an interpret by --interpret, every test is run and its load and total time are printed, so the
+#              scaling of parse_XML_input and of the main loop can be compared over the sizes.
+#==========================================================================================================
+
+import sys
+import os
+import tempfile
+import workloads
+
+SIZES = [100000]
+
+# workloads by their names with the multipliers of their sizes
+WORKLOADS = {"arithmetic": (workloads.arithmetic, 1), "recursion": (workloads.recursion, 1),
+             "strings": (workloads.strings, 1), "stack": (workloads.stack, 1), "read": (workloads.read, 1),
+             "static": (workloads.static, 10)}
+
+def generate(directory, name, size):
+    """
+    Writes a workload of a size as a test, the program, its input, expected output and return code.
+
+    Return
+    -------
+    string
+        The path to the test without the extension.
+    """
+    build, multiplier = WORKLOADS[name]
+    lines, inpt, expected = build(size * multiplier)
+    test = os.path.join(directory, "%s_%d" % (name, size))
+    workloads.write_program(test + ".src", lines)
+    with open(test + ".in", "w") as f:
+        f.write(inpt)
+    with open(test + ".out", "w") as f:
+        f.write(expected)
+    with open(test + ".rc", "w") as f:
+        f.write("0")
+    return test
+
+def measure(interpret, test):
+    """
+    Runs an interpret on a test and checks its output. The load time is measured by the --save-image option of the
+    interpret, which loads the whole program and ends without executing it.
+
+    Return
+    -------
+    (float, float, bool)
+        The load time and the total time in seconds and whether the output and the return code were expected.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        load = workloads.run([sys.executable, interpret, "--source=" + test + ".src",
+                              "--save-image=" + os.path.join(directory, "image")], os.devnull)[0]
+    total, code, output, _ = workloads.run([sys.executable, interpret, "--source=" + test + ".src"], test + ".in")
+    with open(test + ".out", "rb") as f:
+        return load, total, code == 0 and output == f.read()
+
+def main():
+    opts = workloads.parse_arguments(["help", "directory=", "sizes=", "workloads=", "interpret="])
+
+    directory = None
+    interpret = None
+    sizes = SIZES
+    names = list(WORKLOADS)
+    for opt, value in opts:
+        if opt == "--help":
+            print(
+"""Usage: generate.py --directory=<dir> [option] ...
+Options:
+--help              Display help message.
+--directory=<dir>   Directory, where the workloads are written as tests <workload>_<size>.src, .in, .out and .rc.
+--sizes=<n,...>     Comma separated sizes of the workloads (default 100000).
+--workloads=<name,...>
+                    Comma separated workloads to be written (default arithmetic,recursion,strings,stack,read,static).
+                    arithmetic  a loop of the size of iterations of integer arithmetic
+                    recursion   a recursion to the depth of the size with a frame in each call
+                    strings     a string of the length of the size built by CONCAT and edited by SETCHAR
+                    stack       the data stack grown to the size by PUSHS and emptied by POPS
+                    read        an input of the size of lines of integers, strings and bools read by READ
+                    static      a program of ten times the size of instructions, each of them executed once
+--interpret=<file>  Runs each written test by the interpret and prints its load time and total time.""")
+            exit(0)
+        elif opt == "--directory":
+            directory = value
+        elif opt == "--sizes":
+            sizes = workloads.positive_numbers(value)
+        elif opt == "--workloads":
+            names = value.split(",")
+            if any(name not in WORKLOADS for name in names):
+                print("Unknown workload, see --help.", file=sys.stderr)
+                exit(10)
+        elif opt == "--interpret":
+            interpret = value
+
+    if directory == None:
+        print("The directory must be given, see --help.", file=sys.stderr)
+        exit(10)
+
+    os.makedirs(directory, exist_ok=True)
+    if interpret != None:
+        print("workload        size   load [s]  total [s]  result")
+    for name in names:
+        for size in sizes:
+            test = generate(directory, name, size)
+            if interpret == None:
+                print(test)
+            else:
+                load, total, ok = measure(interpret, test)
+                print("%-10s %9d %10.3f %10.3f  %s" % (name, size, load, total, "ok" if ok else "FAILED"))
+
+main()
@@ -0,0 +1,92 @@
+#=========================================================================================================
+# File:        loader.py
+# Case:        VUT, FIT, IPP, project
+# Description: Benchmark of the XML program loader of interpret.py, measures how the load time and the memory
+#              usage scale with the number of instructions.
+#==========================================================================================================
+
+import sys
+import os
+import tempfile
+import workloads
+
+INTERPRET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "interpret.py")
+SIZES = [1000, 10000, 100000, 1000000]
+
+# instructions repeated to fill the program, {0} is replaced by an unique number
+BODY = ('<instruction order="{order}" opcode="DEFVAR"><arg1 type="var">GF@v{0}</arg1></instruction>\n'
+        '<instruction order="{order}" opcode="MOVE"><arg1 type="var">GF@v{0}</arg1>'
+        '<arg2 type="string">line\\032number\\032{0}\\010</arg2></instruction>\n'
+        '<instruction order="{order}" opcode="LABEL"><arg1 type="label">l{0}</arg1></instruction>\n'
+        '<instruction order="{order}" opcode="ADD"><arg1 type="var">GF@v{0}</arg1>'
+        '<arg2 type="int">{0}</arg2><arg3 type="int">-1</arg3></instruction>\n'
+        '<instruction order="{order}" opcode="JUMPIFEQ"><arg1 type="label">l{0}</arg1>'
+        '<arg2 type="var">GF@v{0}</arg2><arg3 type="bool">true</arg3></instruction>\n').split("\n")[:-1]
+
+def write_program(path, size):
+    """
+    Writes a program with the given number of instructions, which exits right after it is loaded.
+
+    Parameters
+    ----------
+    path: string
+        The path to the created XML file.
+    size: int
+        The number of instructions.
+    """
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<program language="IPPcode21">\n')
+        f.write('<instruction order="1" opcode="EXIT"><arg1 type="int">0</arg1></instruction>\n')
+        for order in range(2, size + 1):
+            f.write(BODY[order % len(BODY)].format((order - 2) // len(BODY), order=order) + "\n")
+        f.write('</program>\n')
+
+def run_interpret(interpret, path):
+    """
+    Runs the interpret on a program.
+
+    Return
+    -------
+    (float, int)
+        The wall time in seconds and the peak resident set size in KiB.
+    """
+    elapsed, code, _, rss = workloads.run([sys.executable, interpret, "--source=" + path], os.devnull)
+    if code != 0:
+        print("interpret failed on", path, file=sys.stderr)
+        exit(1)
+    
+    return elapsed, rss
+
+def main():
+    opts = workloads.parse_arguments(["help", "interpret=", "sizes="])
+
+    interpret = INTERPRET
+    sizes = SIZES
+    for opt, value in opts:
+        if opt == "--help":
+            print(
+"""Usage: loader.py [option] ...
+Options:
+--help              Display help message.
+--interpret=<file>  The interpret to be measured (default ../interpret.py).
+--sizes=<n,...>     Comma separated numbers of instructions of the loaded programs (default 1000,10000,100000,1000000).""")
+            exit(0)
+        elif opt == "--interpret":
+            interpret = value
+        elif opt == "--sizes":
+            sizes = workloads.positive_numbers(value)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "empty.xml")
+        write_program(path, 1)
+        startup, _ = run_interpret(interpret, path)
+
+        print("instructions   time [s]   per instruction [us]   peak RSS [MiB]")
+        for size in sizes:
+            path = os.path.join(directory, str(size) + ".xml")
+            write_program(path, size)
+            elapsed, rss = run_interpret(interpret, path)
+            os.unlink(path)
+            print("%12d %10.3f %22.2f %16.1f" % (size, elapsed, (elapsed - startup) / size * 1e6, rss / 1024))
+
+main()
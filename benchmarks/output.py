@@ -0,0 +1,103 @@
+#=========================================================================================================
+# File:        output.py
+# Case:        VUT, FIT, IPP, project
+# Description: Benchmark of the output of interpret.py, runs programs with millions of WRITE instructions and
+#              measures the throughput of the writes, both to the standard output and to a file given by --output.
+#              Compare interprets by --interpret to see the cost of writing each value separately.
+#==========================================================================================================
+
+import sys
+import os
+import tempfile
+import workloads
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+INTERPRET = os.path.join(ROOT, "interpret.py")
+WRITES = [1000000, 2000000, 4000000]
+
+def write_program(path, writes):
+    """
+    Writes a program, which writes the numbers from 0 in a loop, each of them followed by a new line, so every
+    iteration executes two WRITE instructions, one with a variable and one with a literal operand.
+
+    Parameters
+    ----------
+    path: string
+        The path to the created XML file.
+    writes: int
+        The number of executed WRITE instructions.
+    """
+    workloads.write_program(path, ["DEFVAR GF@i", "MOVE GF@i int@0", "LABEL loop", "WRITE GF@i",
+                                   "WRITE string@\\010", "ADD GF@i GF@i int@1",
+                                   "JUMPIFNEQ loop GF@i int@%d" % (writes // 2)])
+
+def expected_output(writes):
+    """
+    Computes the output of the program written by write_program.
+
+    Return
+    -------
+    bytes
+        The expected output.
+    """
+    return "".join("%d\n" % i for i in range(writes // 2)).encode()
+
+def run_interpret(interpret, path, output_path, to_file):
+    """
+    Runs the interpret on a program, its output is redirected to a file or written to the file by --output.
+
+    Return
+    -------
+    (float, int)
+        The wall time in seconds and the return code.
+    """
+    args = [sys.executable, interpret, "--source=" + path]
+    if to_file:
+        elapsed, code, _, _ = workloads.run(args + ["--output=" + output_path], os.devnull, os.devnull)
+    else:
+        elapsed, code, _, _ = workloads.run(args, os.devnull, output_path)
+    return elapsed, code
+
+def main():
+    opts = workloads.parse_arguments(["help", "interpret=", "writes=", "stdout-only"])
+
+    interpret = INTERPRET
+    writes = WRITES
+    targets = [False, True]
+    for opt, value in opts:
+        if opt == "--help":
+            print(
+"""Usage: output.py [option] ...
+Options:
+--help              Display help message.
+--interpret=<file>  The interpret to be measured (default ../interpret.py).
+--writes=<n,...>    Comma separated numbers of executed WRITE instructions (default 1000000,2000000,4000000).
+--stdout-only       Measures only the standard output, for interprets without the --output option.""")
+            exit(0)
+        elif opt == "--interpret":
+            interpret = value
+        elif opt == "--writes":
+            writes = workloads.positive_numbers(value)
+        elif opt == "--stdout-only":
+            targets = [False]
+
+    with tempfile.TemporaryDirectory() as directory:
+        output_path = os.path.join(directory, "output.txt")
+        print("target        writes   time [s]   writes/s   MB/s")
+        for count in writes:
+            path = os.path.join(directory, "%d.xml" % count)
+            write_program(path, count)
+            expected = expected_output(count)
+            for to_file in targets:
+                elapsed, code = run_interpret(interpret, path, output_path, to_file)
+                with open(output_path, "rb") as f:
+                    output = f.read()
+                os.unlink(output_path)
+                if code != 0 or output != expected:
+                    print("interpret failed on", path, file=sys.stderr)
+                    exit(1)
+                print("%-8s %11d %10.3f %10.0f %6.1f" % ("--output" if to_file else "stdout", count, elapsed,
+                                                        count / elapsed, len(output) / elapsed / 1e6))
+            os.unlink(path)
+
+main()
@@ -0,0 +1,240 @@
+#=========================================================================================================
+# File:        suite.py
+# Case:        VUT, FIT, IPP, project
+# Description: Benchmark suite of interpret.py, runs a set of programs, the koule test and the workloads of
+#              workloads.py dominated by recursive calls with frames, string building, stack arithmetic and
+#              reading of the input, and compares the interpret with the reference interpret ic20int, which runs
+#              the same programs in the IFJcode20 source code and computes with 32 bit integers.
+#              The wall time, the load and the execution time, the executed instructions per second and the peak
+#              memory of each run are printed and saved to the stats directory, a JSON file for each run of the
+#              suite and a line for each benchmark in benchmarks.csv, which keeps the history of the runs. The runs
+#              of the reference interpret, which fail, are only reported and they are not saved.
+#==========================================================================================================
+
+import sys
+import os
+import tempfile
+import time
+import json
+import workloads
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+INTERPRET = os.path.join(ROOT, "interpret.py")
+REFERENCE = os.path.join(ROOT, "ic20int")
+RESULTS = os.path.join(ROOT, "stats")
+KOULE = os.path.join(ROOT, "FIT_tests", "interpret-only", "koule", "koule_JohnyK")
+KOULE_TEXT = os.path.join(ROOT, "FIT_tests", "parse-only", "koule", "koule_JohnyK.src")
+HISTORY_COLUMNS = ["date", "benchmark", "interpret", "wall", "load", "execution", "instructions", "ips", "rss_kib",
+                   "ok"]
+
+# generated benchmarks by their names with the workloads and their sizes at the scale 1
+BENCHMARKS = {"koule": None, "recursion": (workloads.recursion, 20000), "strings": (workloads.strings, 20000),
+              "stack": (workloads.stack, 50000), "read": (workloads.read, 50000)}
+
+def prepare(name, scale, directory):
+    """
+    Writes the source files, the input and the expected output of a benchmark, the koule test is taken from the
+    FIT tests and it is not scaled, only the header of its source code is changed for the reference interpret.
+
+    Return
+    -------
+    (string, string, string, bytes)
+        The path to the XML source, to the source code, to the input and the expected output.
+    """
+    if name == "koule":
+        text = os.path.join(directory, name + ".src")
+        with open(KOULE_TEXT) as f:
+            workloads.write_text(text, f.read().split("\n", 1)[1].rstrip("\n").split("\n"))
+        with open(KOULE + ".out", "rb") as f:
+            return KOULE + ".src", text, KOULE + ".in", f.read()
+
+    build, size = BENCHMARKS[name]
+    lines, inpt, expected = build(size * scale)
+    source = os.path.join(directory, name + ".xml")
+    text = os.path.join(directory, name + ".src")
+    input_path = os.path.join(directory, name + ".in")
+    workloads.write_program(source, lines)
+    workloads.write_text(text, lines)
+    with open(input_path, "w") as f:
+        f.write(inpt)
+    return source, text, input_path, expected.encode()
+
+def measure(args, input_path, expected, repeat):
+    """
+    Runs an interpret repeatedly, the shortest time of the runs is taken.
+
+    Return
+    -------
+    dict
+        The wall time, the peak memory, whether all runs ended by 0 with the expected output and the return code of
+        the last run, which did not.
+    """
+    wall = None
+    rss = 0
+    result = {"ok": True, "code": 0}
+    for _ in range(repeat):
+        elapsed, code, output, peak = workloads.run(args, input_path)
+        if code != 0 or output != expected:
+            result = {"ok": False, "code": code}
+        wall = elapsed if wall == None else min(wall, elapsed)
+        rss = max(rss, peak)
+    result.update(wall=round(wall, 6), rss_kib=rss)
+    return result
+
+def count_instructions(interpret, source, input_path):
+    """
+    Counts the executed instructions of a program by the --stats option of the interpret.
+
+    Return
+    -------
+    int
+        The number of executed instructions without LABEL, DPRINT and BREAK, None when it cannot be counted.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stats.txt")
+        args = [sys.executable, interpret, "--source=" + source, "--stats=" + path, "--insts"]
+        _, code, _, _ = workloads.run(args, input_path)
+        if code != 0 or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return int(f.read())
+
+def load_time(interpret, source, repeat):
+    """
+    Measures the load time of a program by the --save-image option of the interpret, which loads and checks the
+    whole program and then ends without executing it. The time includes the start of the interpret.
+
+    Return
+    -------
+    float
+        The shortest load time in seconds.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        args = [sys.executable, interpret, "--source=" + source, "--save-image=" + os.path.join(directory, "image")]
+        return round(min(workloads.run(args, os.devnull)[0] for _ in range(repeat)), 6)
+
+def benchmark(name, scale, repeat, interpret, reference):
+    """
+    Runs a benchmark on the interpret and on the reference interpret.
+
+    Return
+    -------
+    list
+        The results of the interprets.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source, text, input_path, expected = prepare(name, scale, directory)
+        instructions = count_instructions(interpret, source, input_path)
+
+        result = measure([sys.executable, interpret, "--source=" + source], input_path, expected, repeat)
+        result["load"] = load_time(interpret, source, repeat)
+        result["execution"] = round(max(result["wall"] - result["load"], 0.0), 6)
+        result["interpret"] = "interpret.py"
+        results = [result]
+
+        if reference != None:
+            result = measure([reference, text], input_path, expected, repeat)
+            result["load"] = result["execution"] = None    # the reference interpret does not separate them
+            result["interpret"] = "ic20int"
+            if result["ok"]:
+                results.append(result)
+            else:
+                print("The reference interpret failed on %s with %d, it is left out." % (name, result["code"]),
+                      file=sys.stderr)
+
+    for result in results:
+        result["benchmark"] = name
+        result["instructions"] = instructions
+        result["ips"] = round(instructions / result["wall"]) if instructions != None and result["ok"] else None
+    return results
+
+def save_results(directory, date, scale, results):
+    """
+    Saves the results to a JSON file of this run and appends them to the history in benchmarks.csv.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "benchmark_%s.json" % date.replace(":", "-")), "w") as f:
+        json.dump({"date": date, "scale": scale, "python": sys.version.split()[0], "results": results}, f, indent=1)
+        f.write("\n")
+
+    path = os.path.join(directory, "benchmarks.csv")
+    new = not os.path.exists(path)
+    with open(path, "a") as f:
+        if new:
+            f.write(",".join(HISTORY_COLUMNS) + "\n")
+        for result in results:
+            row = dict(result, date=date)
+            f.write(",".join("" if row[column] == None else str(row[column]) for column in HISTORY_COLUMNS) + "\n")
+
+def format_value(value, fmt):
+    """
+    Formats a measured value for the printed table, a missing value is printed as -.
+    """
+    return "-" if value == None else fmt % value
+
+def main():
+    opts = workloads.parse_arguments(["help", "interpret=", "reference=", "no-reference", "scale=", "repeat=",
+                                      "benchmarks=", "results=", "no-save"])
+
+    interpret = INTERPRET
+    reference = REFERENCE
+    scale = 1
+    repeat = 3
+    names = list(BENCHMARKS)
+    results_directory = RESULTS
+    for opt, value in opts:
+        if opt == "--help":
+            print(
+"""Usage: suite.py [option] ...
+Options:
+--help              Display help message.
+--interpret=<file>  The interpret to be measured (default ../interpret.py).
+--reference=<file>  The reference interpret compared with it (default ../ic20int).
+--no-reference      Measures only the interpret.
+--scale=<n>         Multiplies the sizes of the generated benchmarks, the koule test is not scaled (default 1).
+--repeat=<n>        Number of runs of each benchmark, the shortest time is taken (default 3).
+--benchmarks=<name,...>
+                    Comma separated benchmarks to be run (default koule,recursion,strings,stack,read).
+--results=<dir>     Directory, where the results are saved (default ../stats).
+--no-save           Only prints the results.""")
+            exit(0)
+        elif opt == "--interpret":
+            interpret = value
+        elif opt == "--reference":
+            reference = value
+        elif opt == "--no-reference":
+            reference = None
+        elif opt == "--scale":
+            scale = workloads.positive_number(value)
+        elif opt == "--repeat":
+            repeat = workloads.positive_number(value)
+        elif opt == "--benchmarks":
+            names = value.split(",")
+            if any(name not in BENCHMARKS for name in names):
+                print("Unknown benchmark, see --help.", file=sys.stderr)
+                exit(10)
+        elif opt == "--results":
+            results_directory = value
+        elif opt == "--no-save":
+            results_directory = None
+
+    if reference != None and not os.access(reference, os.X_OK):
+        print("The reference interpret %s is not executable, it is left out." % reference, file=sys.stderr)
+        reference = None
+
+    date = time.strftime("%Y-%m-%dT%H:%M:%S")
+    results = []
+    print("benchmark    interpret     wall [s]   load [s]   exec [s]   instructions     inst/s   RSS [KiB]  ok")
+    for name in names:
+        for result in benchmark(name, scale, repeat, interpret, reference):
+            results.append(result)
+            print("%-12s %-12s %9s %10s %10s %14s %10s %11d  %s" % (
+                  name, result["interpret"], format_value(result["wall"], "%.3f"),
+                  format_value(result["load"], "%.3f"), format_value(result["execution"], "%.3f"),
+                  format_value(result["instructions"], "%d"), format_value(result["ips"], "%.0f"),
+                  result["rss_kib"], "ok" if result["ok"] else "FAILED"))
+
+    if results_directory != None:
+        save_results(results_directory, date, scale, results)
+
+main()
@@ -0,0 +1,294 @@
+#=========================================================================================================
+# File:        workloads.py
+# Case:        VUT, FIT, IPP, project
+# Description: Shared parts of the benchmarks of interpret.py, writes programs given in the IPPcode21 source code
+#              in the XML representation and in the IFJcode20 source code of the reference interpret, runs
+#              interprets, parses the options of the benchmarks and builds the synthetic workloads. Each workload
+#              is scaled by its size and keeps its values in 32 bit integers, so its output is the same in the
+#              reference interpret.
+#==========================================================================================================
+
+import sys
+import os
+import getopt
+import subprocess
+import tempfile
+import time
+
+MODULUS = 1000003
+
+def write_program(path, lines):
+    """
+    Writes a program in the XML representation, the instructions are written as they are generated, so programs
+    with millions of instructions are never held in the memory.
+
+    Parameters
+    ----------
+    path: string
+        The path to the created XML file.
+    lines: iterable
+        The instructions of the program in the IPPcode21 source code, one instruction by line.
+    """
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<program language="IPPcode21">\n')
+        for order, line in enumerate(lines, 1):
+            opcode, *args = line.split(" ")
+            f.write('<instruction order="%d" opcode="%s">' % (order, opcode))
+            for i, arg in enumerate(args, 1):
+                if arg[:3] in ("GF@", "LF@", "TF@"):
+                    typ, value = "var", arg
+                elif "@" in arg:
+                    typ, value = arg.split("@", 1)
+                elif opcode == "READ":
+                    typ, value = "type", arg
+                else:
+                    typ, value = "label", arg
+                value = value.replace("&", "&amp;").replace("<", "&lt;")
+                f.write('<arg%d type="%s">%s</arg%d>' % (i, typ, value, i))
+            f.write('</instruction>\n')
+        f.write('</program>\n')
+
+def write_text(path, lines):
+    """
+    Writes a program in the IFJcode20 source code read by the reference interpret, which differs from the
+    IPPcode21 source code only in its header.
+
+    Parameters
+    ----------
+    path: string
+        The path to the created source file.
+    lines: iterable
+        The instructions of the program in the IPPcode21 source code, one instruction by line.
+    """
+    with open(path, "w") as f:
+        f.write(".IFJcode20\n")
+        for line in lines:
+            f.write(line + "\n")
+
+def run(args, input_path, output_path = None):
+    """
+    Runs an interpret with the input file as its standard input.
+
+    Parameters
+    ----------
+    args: list
+        The command line of the interpret.
+    input_path: string
+        The path to the standard input.
+    output_path: string
+        The path to a file, where the standard output is written instead of returning it.
+
+    Return
+    -------
+    (float, int, bytes, int)
+        The wall time in seconds, the return code, the standard output, None when it is written to the file, and
+        the peak resident set size in KiB.
+    """
+    with open(input_path, "rb") as inpt, \
+         (open(output_path, "wb") if output_path != None else tempfile.TemporaryFile()) as output:
+        start = time.perf_counter()
+        process = subprocess.Popen(args, stdin=inpt, stdout=output, stderr=subprocess.DEVNULL)
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        if output_path != None:
+            return elapsed, os.waitstatus_to_exitcode(status), None, usage.ru_maxrss
+        output.seek(0)
+        return elapsed, os.waitstatus_to_exitcode(status), output.read(), usage.ru_maxrss
+
+def invalid_arguments():
+    """
+    Ends a benchmark by 10 on invalid arguments.
+    """
+    print("Invalid arguments, see --help.", file=sys.stderr)
+    exit(10)
+
+def parse_arguments(options):
+    """
+    Parses the long options of a benchmark, no other arguments are allowed.
+
+    Parameters
+    ----------
+    options: list
+        The long options in the format of getopt.
+
+    Return
+    -------
+    list
+        The pairs of the given options and their values.
+    """
+    try:
+        opts, rest = getopt.getopt(sys.argv[1:], '', options)
+        if len(rest):
+            raise getopt.GetoptError("unexpected argument")
+    except getopt.GetoptError:
+        invalid_arguments()
+    return opts
+
+def positive_number(value):
+    """
+    Converts the value of an option to a positive number, ends by 10, when it is not one.
+
+    Return
+    -------
+    int
+        The number.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        invalid_arguments()
+    return number
+
+def positive_numbers(value):
+    """
+    Converts the comma separated value of an option to positive numbers, ends by 10, when any of them is not one.
+
+    Return
+    -------
+    list
+        The numbers.
+    """
+    return [positive_number(number) for number in value.split(",")]
+
+def arithmetic(size):
+    """
+    A tight loop of the size of iterations of integer arithmetic, which computes a hash of the iteration numbers
+    modulo a prime by MUL, IDIV and SUB.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    lines = ["DEFVAR GF@i", "DEFVAR GF@hash", "DEFVAR GF@t", "DEFVAR GF@q", "MOVE GF@i int@0", "MOVE GF@hash int@1",
+             "LABEL loop", "MUL GF@t GF@hash int@31", "ADD GF@t GF@t GF@i",
+             "IDIV GF@q GF@t int@%d" % MODULUS, "MUL GF@q GF@q int@%d" % MODULUS, "SUB GF@hash GF@t GF@q",
+             "ADD GF@i GF@i int@1", "JUMPIFNEQ loop GF@i int@%d" % size,
+             "WRITE GF@i", "WRITE string@\\032", "WRITE GF@hash"]
+    value = 1
+    for i in range(size):
+        value = (value * 31 + i) % MODULUS
+    return lines, "", "%d %d" % (size, value)
+
+def recursion(size, variables = 1):
+    """
+    A recursion to the depth of the size, each call creates a frame with the given number of variables. After the
+    nested call returns, the global counter is restored and checked against the last variable of the frame, the
+    program exits by 1 on a mismatch.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    lines = ["DEFVAR GF@n", "MOVE GF@n int@%d" % size, "CALL f", "WRITE GF@n", "EXIT int@0", "LABEL f",
+             "CREATEFRAME"]
+    for i in range(variables):
+        lines += ["DEFVAR TF@v%d" % i, "MOVE TF@v%d GF@n" % i]
+    lines += ["PUSHFRAME", "SUB GF@n GF@n int@1", "JUMPIFEQ end GF@n int@0", "CALL f", "LABEL end",
+              "ADD GF@n GF@n int@1", "JUMPIFNEQ error LF@v%d GF@n" % (variables - 1), "POPFRAME", "RETURN",
+              "LABEL error", "EXIT int@1"]
+    return lines, "", "%d" % size
+
+def strings(size):
+    """
+    Builds a string of the length of the size by CONCAT of single characters and then changes every other
+    character to upper case by STRI2INT, INT2CHAR and SETCHAR.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    lines = ["DEFVAR GF@s", "DEFVAR GF@i", "DEFVAR GF@j", "DEFVAR GF@c", "DEFVAR GF@b", "DEFVAR GF@a",
+             "MOVE GF@a string@abcdefghijklmnopqrstuvwxyz", "MOVE GF@s string@", "MOVE GF@i int@0",
+             "LABEL build", "IDIV GF@j GF@i int@26", "MUL GF@j GF@j int@26", "SUB GF@j GF@i GF@j",
+             "GETCHAR GF@c GF@a GF@j", "CONCAT GF@s GF@s GF@c", "ADD GF@i GF@i int@1",
+             "JUMPIFNEQ build GF@i int@%d" % size, "MOVE GF@i int@0",
+             "LABEL upper", "STRI2INT GF@j GF@s GF@i", "SUB GF@j GF@j int@32", "INT2CHAR GF@c GF@j",
+             "SETCHAR GF@s GF@i GF@c", "ADD GF@i GF@i int@2", "LT GF@b GF@i int@%d" % size,
+             "JUMPIFEQ upper GF@b bool@true", "STRLEN GF@j GF@s", "WRITE GF@j", "WRITE string@\\010", "WRITE GF@s"]
+    chars = [chr(ord("a") + i % 26) for i in range(size)]
+    chars[::2] = [char.upper() for char in chars[::2]]
+    return lines, "", "%d\n%s" % (size, "".join(chars))
+
+def stack(size):
+    """
+    Loops, which compute in the data stack only. The numbers up to the size are pushed, so the stack grows to the
+    size, then they are popped back to a hash modulo a prime.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    lines = ["DEFVAR GF@i", "DEFVAR GF@x", "DEFVAR GF@hash", "MOVE GF@i int@0", "MOVE GF@hash int@0",
+             "LABEL push", "PUSHS GF@i", "PUSHS GF@i", "PUSHS int@1", "ADDS", "POPS GF@i",
+             "PUSHS GF@i", "PUSHS int@%d" % size, "JUMPIFNEQS push",
+             "LABEL pop", "POPS GF@x", "PUSHS GF@hash", "PUSHS int@7", "MULS", "PUSHS GF@x", "ADDS", "POPS GF@x",
+             "PUSHS GF@x", "PUSHS GF@x", "PUSHS int@%d" % MODULUS, "IDIVS", "PUSHS int@%d" % MODULUS, "MULS",
+             "SUBS", "POPS GF@hash", "PUSHS GF@i", "PUSHS int@1", "SUBS", "POPS GF@i",
+             "PUSHS GF@i", "PUSHS int@0", "JUMPIFNEQS pop", "WRITE GF@hash"]
+    value = 0
+    for x in reversed(range(size)):
+        value = (value * 7 + x) % MODULUS
+    return lines, "", "%d" % value
+
+def read(size):
+    """
+    Reads an input of the size of lines, an integer smaller than 1000, a string and a bool repeatedly, until the
+    end of the input. The integers are summed, the lengths of the strings are summed and the true bools are counted.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    lines = ["DEFVAR GF@x", "DEFVAR GF@t", "DEFVAR GF@sum", "DEFVAR GF@chars", "DEFVAR GF@trues",
+             "MOVE GF@sum int@0", "MOVE GF@chars int@0", "MOVE GF@trues int@0",
+             "LABEL loop", "READ GF@x int", "TYPE GF@t GF@x", "JUMPIFEQ end GF@t string@nil",
+             "ADD GF@sum GF@sum GF@x",
+             "READ GF@x string", "TYPE GF@t GF@x", "JUMPIFEQ end GF@t string@nil",
+             "STRLEN GF@x GF@x", "ADD GF@chars GF@chars GF@x",
+             "READ GF@x bool", "TYPE GF@t GF@x", "JUMPIFEQ end GF@t string@nil",
+             "JUMPIFNEQ loop GF@x bool@true", "ADD GF@trues GF@trues int@1", "JUMP loop",
+             "LABEL end", "WRITE GF@sum", "WRITE string@\\032", "WRITE GF@chars", "WRITE string@\\032",
+             "WRITE GF@trues"]
+    inpt = []
+    total = chars = trues = 0
+    for i in range(size):
+        if i % 3 == 0:
+            inpt.append("%d" % (i % 1000))
+            total += i % 1000
+        elif i % 3 == 1:
+            inpt.append("line %d" % i)
+            chars += len(inpt[-1])
+        else:
+            inpt.append("true" if i % 2 else "false")
+            trues += i % 2
+    return lines, "".join(line + "\n" for line in inpt), "%d %d %d" % (total, chars, trues)
+
+def static(size):
+    """
+    A straight-line program of the size of instructions, each executed once. Every block of four adds a number to
+    a sum and jumps over a WRITE to its own label, so the program has a label for each block. The instructions are
+    generated, when the program is written.
+
+    Return
+    -------
+    (iterable, string, string)
+        The instructions, the input and the expected output of the program.
+    """
+    blocks = size // 4
+    def lines():
+        yield "DEFVAR GF@sum"
+        yield "MOVE GF@sum int@0"
+        for k in range(blocks):
+            yield "ADD GF@sum GF@sum int@%d" % (k % 1000)
+            yield "JUMP skip%d" % k
+            yield "WRITE string@unreachable"
+            yield "LABEL skip%d" % k
+        yield "WRITE GF@sum"
+    return lines(), "", "%d" % sum(k % 1000 for k in range(blocks))
@@ -1,4 +1,3 @@
-
 #=========================================================================================================
 # File:        interpret.py
 # Case:        VUT, FIT, IPP, project
@@ -12,14 +11,32 @@
 import sys
 import os
 import getopt
+import io
 import xml.etree.ElementTree as ET
 import re
+import hashlib
+import marshal
+import tempfile
+import threading
+import mmap
+import struct
+import array
+import functools
+import operator
+import json
+import time
+import signal
 from enum import Enum
 
+VERSION = "1.2"     # version of the interpreter, any change of the decoded program format must change it
+
 class Error(Enum):
     ARG_ERR = 10
     IN_FILE_ERR = 11
     OUT_FILE_ERR = 12
+    HEADER_ERR = 21
+    INSTRUCTION_ERR = 22
+    LEX_SYN_ERR = 23
     FORMAT_ERR = 31
     XML_STRUCTURE_ERR = 32
     SEMANTIC_ERR = 52
@@ -32,10 +49,14 @@ class Error(Enum):
 
 class Frames:
     def __init__(self):
-        self.global_frame = {}      # dictonary of variables in global frame {name: [type, value], ...}
-        self.local_frame = []       # list of local frame dictonaries
-        self.temporary_frame = {}   # dictonary of variables in temporary frame {name: [type, value], ...}
-        self.current_frame = {}     # dictonary of variables in current local frame {name: [type, value], ...}
+        self.global_frame = []      # list of variables in global frame indexed by slots [(type, value), None, ...]
+        self.local_frame = []       # list of local frame lists below the current local frame
+        self.no_frame = []          # frame standing in for a missing local or temporary frame, it is never assigned
+        self.frames = [self.global_frame, self.no_frame, self.no_frame] # global, current local and temporary frame
+        self.global_slots = {}      # slots of global variables {name: slot, ...}
+        self.local_slots = {}       # slots of local and temporary variables {name without the frame: slot, ...}
+        self.global_names = []      # names of global variables by slots
+        self.local_names = []       # names of local and temporary variables without the frame by slots
         self.LF = 0                 # immersion of local frame
         self.TF = False             # activation of temporary frame
 
@@ -43,25 +64,322 @@ class Program:
     def __init__(self):
         self.labels = {}            # dicotnary of labels and corresponding IP values {label: value, ...}
         self.jumps = []             # list of jumps to be checked, if corresponding label exists
-        self.data_stack = []        # list of values represented as [type, value]
+        self.orders = None          # orders of the instructions by their indexes, None when the source has no orders
+        self.data_stack = []        # list of values represented as (type, value)
         self.return_stack = []      # list of retrun IP values
         self.IP = 0                 # instruction pointer
         self.IC = 0                 # instruction counter
+        self.counted = False        # the executed instructions are counted, only BREAK needs the count
+        self.superinstructions = {} # numbers of fused sequences by their patterns {pattern: count, ...}
+        self.unchecked = 0          # number of instructions compiled without type checks
+        self.eliminated_checks = 0  # number of type checks left out of them
+
+class Options:
+    def __init__(self):
+        self.cache = None           # directory with cached decoded programs, caching is disabled when None
+        self.cache_size = 64 << 20  # size cap of the cache directory in bytes
+        self.pipeline = False       # execution of the program starts while it is still being loaded
+        self.ippcode = False        # the source is the IPPcode21 source code instead of its XML representation
+        self.image = None           # program image executed instead of the source
+        self.save_image = None      # the program is only compiled to this program image
+        self.translate = False      # the program is translated to Python functions ahead of time
+        self.report = None          # file with the statistics of the load time optimizations
+        self.output = None          # file written instead of the standard output
+        self.profile = None         # file with the execution counts and times of the instructions
+        self.sample = None          # file with the numbers of samples of the call stacks
+        self.sample_interval = 0.001    # processor time between two samples in seconds
+        self.stats = []             # files with the statistics of the interpretation and their statistics in their 
+                                    # order [(file, ["insts", "hot", "vars", ...]), ...]
+
+class Image:
+    def __init__(self, view):
+        self.view = view            # read only memory map of the program image
+        self.opcodes = None         # opcode number of each instruction
+        self.offsets = None         # start of the operands of each instruction in the operand pool, and its end
+        self.operands = None        # operand pool, the constant index of each operand
+        self.labels = None          # label table, pairs of the constant index of a label and its instruction index
+        self.data_offsets = None    # start of each constant in the constant data, and its end
+        self.data = None            # constant data, each constant is a marshaled pair (type, value)
+        self.constants = []         # constants decoded so far, None when not yet decoded
+        self.program = []           # instructions decoded so far, the decoding stub when not yet decoded
+
+class Pipeline:
+    def __init__(self):
+        self.condition = threading.Condition()  # notified, when an instruction is loaded or the loading ends
+        self.program = []           # list of instructions loaded so far, the whole program once loaded
+        self.loaded = False         # the whole program was loaded and checked
+        self.ordered = True         # the instructions were loaded in the ascending order
+        self.last_order = 0         # order of the last loaded instruction
+        self.output = io.StringIO() # output deferred until the program is loaded
+        self.stderr = io.StringIO()
+
+class Profile:
+    def __init__(self, opcodes):
+        self.opcodes = opcodes      # opcode of each instruction
+        self.counts = [0] * len(opcodes)    # number of executions of each instruction
+        self.times = [0] * len(opcodes)     # cumulative wall time of each instruction in nanoseconds
+
+class Sampler:
+    def __init__(self, names, loops):
+        self.names = names          # name of each instruction, the nearest preceding label
+        self.loops = loops          # code of the dispatch loops, which hold the index of the executed instruction in ip
+        self.stacks = {}            # numbers of samples by the collapsed call stacks {"label;label": count, ...}
+
+class Statistics:
+    def __init__(self, opcodes, orders, destinations):
+        self.opcodes = opcodes      # opcode of each instruction
+        self.orders = orders        # order of each instruction
+        self.destinations = destinations    # destination variable of each instruction bound by bind_var, the slot is 
+                                            # None for instructions, which discard the temporary frame
+        self.counts = [0] * len(opcodes)    # number of executions of each instruction
+        self.variables = 0          # number of initialized variables in all frames
+        self.peak_variables = 0     # highest number of initialized variables in all frames
+
+class PendingLabels(dict):
+    """
+    Dictonary of labels, which is filled while the program is being executed. A label, which was not loaded yet, 
+    is waited for.
+    """
+    def __missing__(self, label):
+        with PIPELINE.condition:
+            while label not in self and not PIPELINE.loaded:
+                PIPELINE.condition.wait()
+        
+        return PROGRAM.labels[label] # the labels can be replaced by a cached table once loaded
+
+class Input:
+    """
+    Input of the interpreted program, which is read line by line, so each READ takes only its own line and the input 
+    is never held in the memory as a whole.
+    """
+    def __init__(self, file, from_file):
+        self.file = file            # text file the lines are read from by its buffered reads
+        self.from_file = from_file  # the input is the --input file, which is split to lines like the whole file by
+                                    # str.split, so the text after the last new line is a line, even when it is empty
+        self.ended = False          # the last line was read
+    
+    def read_line(self):
+        """
+        Reads the next line without its new line character. Raises EOFError, when there are no more lines.
+
+        Return
+        -------
+        string
+            The read line.
+        """
+        line = self.file.readline()
+        if line[-1:] == "\n":
+            return line[:-1]
+        if self.ended or line == "" and not self.from_file:
+            raise EOFError()
+        
+        self.ended = True
+        return line
+
+class Text:
+    """
+    Long string value stored in a mutable buffer of characters, so CONCAT appends to the buffer and SETCHAR replaces
+    a character in it instead of copying the whole string. Each modification creates a new version of the string,
+    which takes the buffer over, while the previous version keeps only the difference to it. Older versions, which
+    are still referenced, e.g. by another variable or by the data stack, never see the modification, the buffer is
+    moved back to them, when they are used again. The string is materialized only for WRITE and the
+    comparisons.
+    """
+    __slots__ = ("data", "length", "string")
+    
+    def __init__(self, buffer, length):
+        self.data = buffer          # list of characters when this version holds the buffer, otherwise the difference
+                                    # to a newer version (newer version, index, character), the index is -1 when only
+                                    # the length differs
+        self.length = length        # number of characters, the buffer may be longer after appends by other versions
+        self.string = None          # materialized string, the characters of a version never change
+    
+    def buffer(self):
+        """
+        Moves the buffer to this version by applying the differences of the versions between it and the version,
+        which holds the buffer.
+        
+        Return
+        -------
+        list
+            The buffer, the characters of this version are at its start.
+        """
+        if self.data.__class__ is list:
+            return self.data
+        
+        versions = []
+        version = self
+        while version.data.__class__ is not list:
+            versions.append(version)
+            version = version.data[0]
+        buffer = version.data
+        
+        for version in reversed(versions):
+            newer, index, char = version.data
+            if index >= 0:
+                newer.data = (version, index, buffer[index])
+                buffer[index] = char
+            else:
+                newer.data = (version, -1, None)
+            version.data = buffer
+        return buffer
+    
+    def append(self, string):
+        """
+        Creates a version with a string appended, the buffer is copied only when another version already appended
+        to it.
+        
+        Return
+        -------
+        Text
+            The new version.
+        """
+        buffer = self.buffer()
+        if len(buffer) != self.length:
+            buffer = buffer[:self.length]
+            buffer.extend(string)
+            return Text(buffer, len(buffer))
+        
+        buffer.extend(string)
+        text = Text(buffer, len(buffer))
+        self.data = (text, -1, None)
+        return text
+    
+    def replace(self, index, char):
+        """
+        Creates a version with the character at an index replaced.
+        
+        Return
+        -------
+        Text
+            The new version.
+        """
+        buffer = self.buffer()
+        text = Text(buffer, self.length)
+        self.data = (text, index, buffer[index])
+        buffer[index] = char
+        return text
+    
+    def __str__(self):
+        if self.string is None:
+            buffer = self.buffer()
+            self.string = "".join(buffer if len(buffer) == self.length else buffer[:self.length])
+        return self.string
+    
+    def __len__(self):
+        return self.length
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("string index out of range")
+        return self.buffer()[index]
+    
+    def __hash__(self):
+        return hash(str(self))
+    
+    def __eq__(self, other):
+        return str(self) == (str(other) if other.__class__ is Text else other)
+    
+    def __lt__(self, other):
+        return str(self) < (str(other) if other.__class__ is Text else other)
+    
+    def __gt__(self, other):
+        return str(self) > (str(other) if other.__class__ is Text else other)
+
+class RestartProgram(Exception):
+    """
+    Raised, when the speculatively executed prefix of the program was not its real beginning.
+    """
+
+class UndecodedInstruction(Exception):
+    """
+    Raised by the decoding stub of an instruction of a program image, which was not decoded yet.
+    """
 
-IN_BUFFER = None
+INST_OPERANDS = {"MOVE" : ("var", "symb"), "CREATEFRAME" : (), "PUSHFRAME" : (), "POPFRAME" : (),
+                 "DEFVAR" : ("var",), "CALL" : ("label",), "RETURN" : (), "PUSHS" : ("symb",), "POPS" : ("var",),
+                 "ADD" : ("var", "symb", "symb"), "SUB" : ("var", "symb", "symb"), "DIV": ("var", "symb", "symb"),
+                 "MUL" : ("var", "symb", "symb"), "IDIV" : ("var", "symb", "symb"), "LT" : ("var", "symb", "symb"),
+                 "GT" : ("var", "symb", "symb"), "EQ" : ("var", "symb", "symb"), "AND" : ("var", "symb", "symb"),
+                 "OR" : ("var", "symb", "symb"), "NOT" : ("var", "symb"), "INT2CHAR" : ("var", "symb"),
+                 "STRI2INT" : ("var", "symb", "symb"), "READ" : ("var", "type"), "WRITE" : ("symb",),
+                 "CONCAT" : ("var", "symb", "symb"), "GETCHAR" : ("var", "symb", "symb"),
+                 "SETCHAR" : ("var", "symb", "symb"), "TYPE" : ("var", "symb"), "LABEL": ("label",),
+                 "JUMP" : ("label",), "JUMPIFEQ": ("label", "symb", "symb"), "JUMPIFNEQ" : ("label", "symb", "symb"),
+                 "EXIT" : ("symb",), "DPRINT": ("symb",), "BREAK" : (), "STRLEN" : ("var", "symb"), "ADDS": (),
+                 "SUBS": (), "MULS": (), "DIVS": (), "IDIVS": (), "GTS": (), "LTS": (), "EQS": (), "ANDS": (),
+                 "ORS": (), "NOTS": (), "INT2CHARS": (), "STRI2INTS": (), "JUMPIFEQS": ("label",),
+                 "JUMPIFNEQS": ("label",), "FLOAT2INTS": (), "INT2FLOATS": (), "CLEARS": (),
+                 "INT2FLOAT": ("var", "symb"), "FLOAT2INT": ("var", "symb")}   # kinds of operands of each instruction
+
+INST_COUNTS = {opcode: len(operands) for opcode, operands in INST_OPERANDS.items()} # number of arguments of each instruction
+INST_SIGNATURES = {opcode: {"arg" + str(i + 1): i for i in range(count)} 
+                   for opcode, count in INST_COUNTS.items()}    # argument elements of each instruction {tag: index, ...}
+ARG_TYPES = {"int", "bool", "string", "nil", "label", "type", "var", "float"}
+JUMP_OPCODES = {"CALL", "JUMP", "JUMPIFEQ", "JUMPIFNEQ"}    # instructions, which label must be defined
+TARGET_OPCODES = JUMP_OPCODES | {"JUMPIFEQS", "JUMPIFNEQS"} # instructions, which records hold the jump target
+FRAME_OPCODES = {"CREATEFRAME", "PUSHFRAME", "POPFRAME"}    # instructions, which move frames between their roles
+ARG_VALIDATORS = {"var" : re.compile(r"^(GF|LF|TF)@[A-Za-z_\-$&%*!?][A-Za-z_\-$&%*!?0-9]*$").match,
+                  "label" : re.compile(r"^[A-Za-z_\-$&%*!?][A-Za-z_\-$&%*!?0-9]*$").match,
+                  "type" : re.compile("^(int|string|bool|float)$").match}
+FRAME_ROLES = {"GF": 0, "LF": 1, "TF": 2}   # index of the frame of each prefix in FRAMES.frames
+UNSET, NIL, BOOL, INT, FLOAT, STRING = range(6) # type tags of values
+TYPE_NAMES = ("", "nil", "bool", "int", "float", "string", "label", "type") # names of types by tags
+TYPE_TAGS = {name: tag for tag, name in enumerate(TYPE_NAMES)}  # tags of types by names
+VALUE_TAGS = {NIL, BOOL, INT, FLOAT, STRING} # tags of assigned values
+DEFINED = -1                                # inferred type of a defined variable, which type is not known
+STACK = "stack"                             # key of the inferred types of the top of the data stack, not a variable
+UNDEFINED = (UNSET, "")                     # value of a defined variable, which was not assigned yet
+NIL_VALUE = (NIL, None)                     # shared values of the nil and bool types
+TRUE_VALUE = (BOOL, True)
+FALSE_VALUE = (BOOL, False)
+STRING_INVALID = re.compile(r"[\x00-\x20#]|\\(?![0-9]{3})").search  # white spaces, # or \ not followed by 3 digits
+STRING_ESCAPES = re.compile(r"\\([0-9]{3})").sub
+EQUAL_TYPES = {(typ1, typ2) for typ1 in (INT, BOOL, STRING, FLOAT, NIL) 
+               for typ2 in (INT, BOOL, STRING, FLOAT, NIL) 
+               if typ1 == typ2 or typ1 == NIL or typ2 == NIL}  # tags of defined values, which can be compared for equality
+SYMB_TYPES = {"int", "bool", "string", "nil", "float", "GF", "LF", "TF"}  # prefixes of a symbol operand in the source code
+HEADER = ".ippcode21"
+IMAGE_MAGIC = b"IPPI"
+IMAGE_HEADER = struct.Struct("=4s8sIIIII")  # magic, version, number of instructions, operands, constants, labels and size of constant data
+IMAGE_OPCODES = tuple(INST_OPERANDS)        # opcode of each opcode number
+OUTPUT_BUFFER_SIZE = 1 << 20                # size of the output buffer, which is written out when full
+INPUT_BLOCK_SIZE = 1 << 20                  # number of characters decoded at once, when the input file is checked
+UNCOUNTED_OPCODES = {"LABEL", "DPRINT", "BREAK"}    # instructions left out of the statistics of --insts and --hot
+SAMPLE_DEPTH = 256                          # number of the innermost calls in a sampled call stack
+SAMPLE_ROOT = "[program]"                   # name of the instructions before the first label, not a valid label
+TEXT_LENGTH = 256                           # length, from which CONCAT and SETCHAR create strings stored as Text
+
+INPUT = None        # input of the interpreted program, the standard input unless --input is given
+XML_EVENTS = None   # iterator over the streamed XML source, while it is being loaded
+SOURCE_LINES = None # iterator over the lines of the IPPcode21 source code, while it is being loaded
+INTERNED = {}       # intern table of strings loaded from the source, so repeated literals and names share one object
+IMAGE = None        # mapped program image, its instructions are decoded when first executed
+PIPELINE = None     # state of the pipelined loading, while the program is being loaded in the background
+OUTPUT = None       # buffered output of the interpreted program
+PROFILE = None      # execution counts and times of the instructions, while the program is profiled
+SAMPLER = None      # samples of the call stacks, while the program is sampled
+STATS = None        # statistics of the interpretation, while they are collected
+OPTIONS = Options()
 FRAMES = Frames()
 PROGRAM = Program()
 
 # =========================================== functions ==============================================
 
 def parse_prog_arguments():
-    global IN_BUFFER
+    global INPUT, OUTPUT
     try:
-        opts, rest = getopt.getopt(sys.argv[1:], '', ["source=", "input=", "help"])
+        opts, rest = getopt.getopt(sys.argv[1:], '', ["source=", "input=", "help", "cache=", "cache-size=", 
+                                                       "pipeline", "ippcode", "image=", "save-image=", 
+                                                       "translate", "report=", "output=", "profile=",
+                                                       "sample=", "sample-interval=", "stats=", "insts", "hot",
+                                                       "vars"])
         if len(opts) > 1 and ("--help", '') in opts or len(rest):
-            os._exit(Error.ARG_ERR.value)
+            terminate(Error.ARG_ERR.value)
     except:
-        os._exit(Error.ARG_ERR.value)
+        terminate(Error.ARG_ERR.value)
     
     if ("--help", '') in opts:
         print(
@@ -70,9 +388,40 @@ Options:
 --help              Display help message.
 --source=<file>     Uses the <file> as the source of the interpreted program.
 --input=<file>      Uses the <file> as the input of the interpreted program.
+--output=<file>     Writes the output of the interpreted program to the <file> instead of the standard output.
+--cache=<dir>       Caches the decoded program in the <dir> directory, repeated runs of the same program skip
+                    the XML parsing.
+--cache-size=<MiB>  Size cap of the cache directory, the least recently used programs are evicted (default 64).
+--pipeline          Starts the execution while the program is still being loaded, the output is written only 
+                    after the whole program was loaded and checked.
+--ippcode           The source is the IPPcode21 source code itself instead of its XML representation.
+--save-image=<file> Compiles the checked program to the <file> program image without executing it.
+--image=<file>      Executes the <file> program image instead of the source, the image is mapped to memory and 
+                    its instructions are decoded when first executed.
+--translate         Translates the program to Python functions before executing it, which speeds up long running
+                    programs.
+--report=<file>     Writes the statistics of the load time optimizations to the <file>, the numbers of instruction 
+                    sequences fused to superinstructions and of type checks eliminated by the type inference.
+--profile=<file>    Writes the execution count and the cumulative wall time of each instruction and of each opcode 
+                    to the <file> as JSON sorted by the time, the instructions are not fused to superinstructions 
+                    and --pipeline and --translate are ignored.
+--sample=<file>     Samples the executed instruction and the call stack in intervals of the processor time and
+                    writes the numbers of samples of the call stacks to the <file> in the collapsed format of flame 
+                    graph tools, each call is named by the label nearest before it.
+--sample-interval=<ms>
+                    Interval of the sampling in milliseconds (default 1).
+--stats=<file>      Writes the statistics of the interpretation to the <file>, a line for each of the following 
+                    options given after it in their order. More files can be given, each followed by its own 
+                    options. The statistics are collected by a slower execution without superinstructions, the cache,
+                    --pipeline and --translate are ignored.
+--insts             The number of executed instructions without LABEL, DPRINT and BREAK.
+--hot               The order of the most executed instruction without LABEL, DPRINT and BREAK, the lowest order of 
+                    them, when more are executed the most times. It is the position of the instruction from 1 for 
+                    a program image, which does not keep the orders.
+--vars              The highest number of initialized variables in all frames at once.
 
 Either source file or input file must be specified.""")
-        os._exit(0)
+        terminate(0)
 
     inpt = None
     source = None
@@ -81,68 +430,203 @@ Either source file or input file must be specified.""")
             source = tpl[1]
         elif tpl[0] == "--input":
             inpt = tpl[1]
+        elif tpl[0] == "--pipeline":
+            OPTIONS.pipeline = True
+        elif tpl[0] == "--ippcode":
+            OPTIONS.ippcode = True
+        elif tpl[0] == "--translate":
+            OPTIONS.translate = True
+        elif tpl[0] == "--image":
+            OPTIONS.image = tpl[1]
+        elif tpl[0] == "--report":
+            OPTIONS.report = tpl[1]
+        elif tpl[0] == "--output":
+            OPTIONS.output = tpl[1]
+        elif tpl[0] == "--profile":
+            OPTIONS.profile = tpl[1]
+        elif tpl[0] == "--sample":
+            OPTIONS.sample = tpl[1]
+        elif tpl[0] == "--stats":
+            if tpl[1] == "":
+                terminate(Error.ARG_ERR.value)
+            if any(tpl[1] == path for path, _ in OPTIONS.stats):
+                terminate(Error.OUT_FILE_ERR.value) # the file was already given for other statistics
+            OPTIONS.stats.append((tpl[1], []))
+        elif tpl[0] in ("--insts", "--hot", "--vars"):
+            if not OPTIONS.stats:
+                terminate(Error.ARG_ERR.value)  # the statistics must follow their file
+            OPTIONS.stats[-1][1].append(tpl[0][2:])
+        elif tpl[0] == "--sample-interval":
+            try:
+                OPTIONS.sample_interval = float(tpl[1]) / 1000
+            except:
+                terminate(Error.ARG_ERR.value)
+            if not OPTIONS.sample_interval > 0:
+                terminate(Error.ARG_ERR.value)
+        elif tpl[0] == "--save-image":
+            OPTIONS.save_image = tpl[1]
+        elif tpl[0] == "--cache":
+            OPTIONS.cache = tpl[1]
+        elif tpl[0] == "--cache-size":
+            try:
+                OPTIONS.cache_size = int(tpl[1]) << 20
+            except ValueError:
+                terminate(Error.ARG_ERR.value)
+            if OPTIONS.cache_size < 0:
+                terminate(Error.ARG_ERR.value)
     
-    if inpt == None and source == None:
-        os._exit(Error.ARG_ERR.value)
+    if inpt == None and source == None and OPTIONS.image == None:
+        terminate(Error.ARG_ERR.value)
+    if OPTIONS.image != None and (source != None or OPTIONS.save_image != None):
+        terminate(Error.ARG_ERR.value)
+    if OPTIONS.sample != None and not hasattr(signal, "setitimer"):
+        terminate(Error.ARG_ERR.value)  # the timer signals are available only on Unix
+    if OPTIONS.stats and OPTIONS.profile != None:
+        terminate(Error.ARG_ERR.value)  # each of them needs its own execution
     
-    if source == None:
+    if source == None and OPTIONS.image == None:
         source = sys.stdin
+    
+    OUTPUT = open_output(OPTIONS.output)
 
     if inpt != None:
-        try:
-            f = open(inpt, "r")
-            IN_BUFFER = f.read().split("\n")
-        except:
-            os._exit(Error.IN_FILE_ERR.value)
-        finally:
-            f.close()
+        INPUT = Input(open_input(inpt), True)
+    else:
+        INPUT = Input(sys.stdin, False)
     
     return source
 
-def parse_XML_input(xml_input):
+def open_input(path):
     """
-    Parses the XML representation of the source code. Terminates the execution with an error when the XML file 
-    is not well-formated (31) or the XML structure does not meet the specification (32).
+    Opens the input file of the interpreted program. The whole file is decoded in blocks before the program is 
+    executed, so an input, which cannot be decoded, is detected before any output is written, even when the program 
+    never reads it. Terminates the execution with an error (11), when the file cannot be opened or decoded.
 
     Parameters
     ----------
-    xml_input : string
-        The name and path to a file containing the source code, can be also sys.stdin
+    path: string
+        The path to the input file.
     
     Return
     -------
-    program : dict
-        A dictonary cointaining all loaded instructions with integer keys representing their order
-        {key: [OPCODE, arguments...]}
-    """
-    inst_counts = {"MOVE" : 2, "CREATEFRAME" : 0, "PUSHFRAME" : 0, "POPFRAME" : 0, "DEFVAR" : 1,
-                   "CALL" : 1, "RETURN" : 0, "PUSHS" : 1, "POPS" : 1, "ADD" : 3, "SUB" : 3, "DIV": 3,
-                   "MUL" : 3, "IDIV" : 3, "LT" : 3, "GT" : 3, "EQ" : 3, "AND" : 3, "OR" : 3,
-                   "NOT" : 2, "INT2CHAR" : 2, "STRI2INT" : 3, "READ" : 2, "WRITE" : 1, "CONCAT" : 3,
-                   "GETCHAR" : 3, "SETCHAR" : 3, "TYPE" : 2, "LABEL": 1, "JUMP" : 1, "JUMPIFEQ": 3,
-                   "JUMPIFNEQ" : 3, "EXIT" : 1, "DPRINT": 1, "BREAK" : 0, "STRLEN" : 2, "ADDS": 0,
-                   "SUBS": 0, "MULS": 0, "DIVS": 0, "IDIVS": 0, "GTS": 0, "LTS": 0, "EQS": 0,
-                   "ANDS": 0, "ORS": 0, "NOTS": 0, "INT2CHARS": 0, "STRI2INTS": 0, "JUMPIFEQS": 1,
-                   "JUMPIFNEQS": 1, "FLOAT2INTS": 0, "INT2FLOATS": 0, "CLEARS": 0, "INT2FLOAT": 2,
-                   "FLOAT2INT": 2}
-    program = []
+    TextIOWrapper
+        The input file at its beginning.
+    """
+    try:
+        file = open(path, "r")
+        while file.read(INPUT_BLOCK_SIZE):
+            pass
+        file.seek(0)
+    except (OSError, UnicodeDecodeError):
+        terminate(Error.IN_FILE_ERR.value)
+    
+    return file
+
+def open_output(path):
+    """
+    Opens the output of the interpreted program. The output is buffered, the buffer is written out when it is full, 
+    when the program ends and before the interpret terminates with an error, see terminate. Terminates the execution 
+    with an error (12), when the file cannot be opened.
 
+    Parameters
+    ----------
+    path: string, None
+        The path to the output file, the standard output is used when None.
+    
+    Return
+    -------
+    TextIOWrapper
+        The buffered output.
+    """
     try:
-        xml = ET.parse(xml_input)
-    except:
-        os._exit(Error.FORMAT_ERR.value)
+        if path == None:
+            raw = open(sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False)
+        else:
+            raw = open(path, "wb", buffering=OUTPUT_BUFFER_SIZE)
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
+    
+    return io.TextIOWrapper(raw, encoding=sys.stdout.encoding, errors=sys.stdout.errors, newline="\n")
 
-    root = xml.getroot()
+def terminate(code):
+    """
+    Terminates the interpret immediately, the buffered output is written out first, as the buffers of the Python 
+    interpret are not flushed, and so are the profile, the samples and the statistics of the program, when they
+    are collected.
+
+    Parameters
+    ----------
+    code: int
+        The exit code.
+    """
+    if PROFILE != None:
+        write_profile(OPTIONS.profile)
+    if SAMPLER != None:
+        write_samples(OPTIONS.sample)
+    if STATS != None:
+        write_statistics()
+    
+    if OUTPUT != None:
+        try:
+            OUTPUT.flush()
+        except (OSError, ValueError):
+            pass
+    
+    os._exit(code)
+
+def exit_load_error(error):
+    """
+    Terminates the execution with a load time error. The rest of the XML source is read first, when it is being 
+    streamed, so a document that is not well-formated is always reported as such (31), even if the error was found 
+    in an earlier instruction. Likewise the rest of the IPPcode21 source code is lexically checked first, so its 
+    lexical and syntactic errors (22, 23) are reported before the errors found while decoding.
+
+    Parameters
+    ----------
+    error: Error
+        The error to terminate with.
+    """
+    global XML_EVENTS, SOURCE_LINES
+    if XML_EVENTS != None:
+        try:
+            for event, elem in XML_EVENTS:
+                if event == "end":
+                    elem.clear()
+        except (ET.ParseError, OSError):
+            terminate(Error.FORMAT_ERR.value)
+    
+    if SOURCE_LINES != None:
+        lines, SOURCE_LINES = SOURCE_LINES, None
+        try:
+            for line in lines:
+                tokens = line.partition("#")[0].split()
+                if tokens:
+                    lex_instruction(tokens)
+        except (OSError, UnicodeDecodeError):
+            terminate(Error.IN_FILE_ERR.value)
+    
+    terminate(error.value)
+
+def check_root(root):
+    """
+    Checks the root element of the XML representation. Terminates the execution with an error (32) when the root element
+    does not meet the specification.
+
+    Parameters
+    ----------
+    root: Element
+        The root element, only its tag and attributes have to be loaded.
+    """
     if root.tag != "program":
-        os._exit(Error.XML_STRUCTURE_ERR.value)
+        exit_load_error(Error.XML_STRUCTURE_ERR)
     
     att = 1
 
     if  "language" in root.attrib:
         if root.attrib["language"] != "IPPcode21":
-            os._exit(Error.XML_STRUCTURE_ERR.value)
+            exit_load_error(Error.XML_STRUCTURE_ERR)
     else:
-        os._exit(Error.XML_STRUCTURE_ERR.value)
+        exit_load_error(Error.XML_STRUCTURE_ERR)
     
     if "name" in root.attrib:
         att += 1
@@ -150,374 +634,3473 @@ def parse_XML_input(xml_input):
         att += 1
     
     if att != len(root.attrib):
-        os._exit(Error.XML_STRUCTURE_ERR.value)
+        exit_load_error(Error.XML_STRUCTURE_ERR)
 
-    ints_max = 0
-    for inst in root:
-        if inst.tag != "instruction":
-            os._exit(Error.XML_STRUCTURE_ERR.value)
+def load_instruction(inst, program, orders):
+    """
+    Checks and decodes a single fully loaded instruction element and stores it to the program. Terminates the execution 
+    with an error when the instruction does not meet the specification (32) or redefines a label (52).
+
+    Parameters
+    ----------
+    inst: Element
+        The instruction element with all of its arguments.
+    program: list
+        The list of already loaded instructions in the order of their elements.
+    orders: dict
+        The orders of already loaded instructions and their indexes in the program {order: index, ...}.
+    
+    Return
+    -------
+    int
+        The order of the instruction.
+    """
+    if inst.tag != "instruction":
+        exit_load_error(Error.XML_STRUCTURE_ERR)
+    
+    attrib = inst.attrib
+    if "order" not in attrib or "opcode" not in attrib or len(attrib) != 2:
+        exit_load_error(Error.XML_STRUCTURE_ERR) # wrong instruction element
+
+    opcode = attrib["opcode"].upper()
+    signature = INST_SIGNATURES.get(opcode)
+    if signature == None:
+        exit_load_error(Error.XML_STRUCTURE_ERR) # not existing opcode
         
-        if "order" not in inst.attrib or "opcode" not in inst.attrib or len(inst.attrib) != 2:
-            os._exit(Error.XML_STRUCTURE_ERR.value) # wrong instruction element
+    try:
+        order = int(attrib["order"])
+    except:
+        exit_load_error(Error.XML_STRUCTURE_ERR) # order in not an inteeger format
+    if order <= 0 or order in orders:
+        exit_load_error(Error.XML_STRUCTURE_ERR) # order not a natural number or duplicit order
+    orders[order] = len(program)
+
+    if len(inst) != len(signature):
+        exit_load_error(Error.XML_STRUCTURE_ERR) # invalid number of arguments
+
+    args = [None] * len(signature)
+    for arg in inst:
+        index = signature.get(arg.tag)
+        if index == None or args[index] != None:
+            exit_load_error(Error.XML_STRUCTURE_ERR) # unexpected or duplicit argument
+        args[index] = arg
+
+    arg_arr = [INTERNED.setdefault(opcode, opcode)]
+    for arg in args:
+        typ = arg.attrib.get("type")
+        if len(arg.attrib) != 1 or typ not in ARG_TYPES:
+            exit_load_error(Error.XML_STRUCTURE_ERR) # invalid type of an instruction argument
+
+        if opcode == "LABEL" and arg.text in PROGRAM.labels:
+            exit_load_error(Error.SEMANTIC_ERR)
+
+        arg_arr.append(INTERNED.setdefault(typ, typ))
+        arg_arr.append(check_arg_text(arg.text, typ))
+        if opcode == "LABEL":
+            PROGRAM.labels[arg_arr[2]] = len(program)
+
+    if opcode in JUMP_OPCODES:
+        PROGRAM.jumps.append(arg_arr[2])
+
+    program.append(arg_arr)
+    return order
+
+def compact_program(program, orders):
+    """
+    Sorts the loaded instructions by their order into a dense list, gaps in the order sequence are left out. Label 
+    targets are remapped to the new positions of the labels.
 
-        inst.attrib["opcode"] = inst.attrib["opcode"].upper()
-        if inst.attrib["order"] in program or inst.attrib["opcode"] not in inst_counts:
-            os._exit(Error.XML_STRUCTURE_ERR.value) # duplicit instruction with the same order or not existing opcode
-            
-        try:
-            order = int(inst.attrib["order"])
-            if order <= 0:
-                os._exit(Error.XML_STRUCTURE_ERR.value) # order not a natural number
-            order -= 1
-            while order >= ints_max:
-                program.append(["NOP"])
-                ints_max += 1
-        except:
-            os._exit(Error.XML_STRUCTURE_ERR.value) # order in not an inteeger format
-
-        arg_num = inst_counts[inst.attrib["opcode"]]
-        arg_arr = [inst.attrib["opcode"]]
-        arg_count = 1
-        inst[:] = sorted(inst, key= lambda arg: arg.tag) 
-        for arg in inst:
-            if arg_num == 0:
-                os._exit(Error.XML_STRUCTURE_ERR.value) # more arguments than required by an instruction
-
-            if re.match("^arg" + str(arg_count) + "$", arg.tag) == None:
-                os._exit(Error.XML_STRUCTURE_ERR.value)
-
-            arg_count += 1
-            arg_num -= 1
-            if len(arg.attrib) != 1 or "type" not in arg.attrib or re.match("^(int|bool|string|nil|label|type|var|float)$", arg.attrib["type"]) == None:
-                os._exit(Error.XML_STRUCTURE_ERR.value) # invalid type of an instruction argument
-
-            if inst.attrib["opcode"] == "LABEL":
-                if arg.text in PROGRAM.labels:
-                    os._exit(Error.SEMANTIC_ERR.value)
-                PROGRAM.labels[arg.text] = order
-
-            arg.text = check_arg_text(arg.text, arg.attrib["type"])
-            arg_arr.append(arg.attrib["type"])
-            arg_arr.append(arg.text)
-
-        if arg_num != 0:
-            os._exit(Error.XML_STRUCTURE_ERR.value) # invalid number of arguments
-
-        if re.match("^(CALL|JUMPIFEQ|JUMPIFNEQ|JUMP)$", inst.attrib["opcode"]):
-            PROGRAM.jumps.append(arg_arr[2])
-
-        if program[order][0] != "NOP":
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-        program[order] = arg_arr
+    Parameters
+    ----------
+    program: list
+        The list of loaded instructions in the order of their elements.
+    orders: dict
+        The orders of the loaded instructions and their indexes in the program {order: index, ...}.
+    
+    Return
+    -------
+    list
+        The list of instructions sorted by their order.
+    """
+    sorted_orders = PROGRAM.orders = sorted(orders)
+    if sorted_orders == list(orders):
+        return program # already sorted, which is the usual case
+    
+    program = [program[orders[order]] for order in sorted_orders]
+    for index, inst in enumerate(program):
+        if inst[0] == "LABEL":
+            PROGRAM.labels[inst[2]] = index
+    
+    return program
+
+def parse_XML_input(xml_input):
+    """
+    Parses the XML representation of the source code. Terminates the execution with an error when the XML file 
+    is not well-formated (31) or the XML structure does not meet the specification (32).
+    The source is streamed, each instruction is decoded as soon as its element is complete and the element is then 
+    dropped, so only the decoded instructions are kept in memory.
+
+    Parameters
+    ----------
+    xml_input : string
+        The name and path to a file containing the source code, can be also sys.stdin
+    
+    Return
+    -------
+    program : list
+        A list cointaining all loaded instructions sorted by their order
+        [[OPCODE, arguments...], ...]
+    """
+    global XML_EVENTS
+    program = []
+    orders = {}
+    if PIPELINE != None:
+        PIPELINE.program = program # the instructions can be executed as soon as they are loaded
+
+    if xml_input == sys.stdin:
+        xml_input = sys.stdin.buffer
+
+    try:
+        XML_EVENTS = ET.iterparse(xml_input, events=("start", "end"))
+        root = None
+        depth = 0
+        for event, elem in XML_EVENTS:
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = elem
+                    check_root(root)
+            else:
+                depth -= 1
+                if depth == 1:
+                    order = load_instruction(elem, program, orders)
+                    root.clear() # the decoded instruction element is not needed anymore
+                    if PIPELINE != None:
+                        publish_instruction(order)
+    except (ET.ParseError, OSError):
+        terminate(Error.FORMAT_ERR.value)
+    
+    XML_EVENTS = None
+    INTERNED.clear() # the loaded strings are already shared by the instructions
+    program = compact_program(program, orders)
    
     for jump in PROGRAM.jumps:
         if jump not in PROGRAM.labels:
-            os._exit(Error.SEMANTIC_ERR.value)
+            terminate(Error.SEMANTIC_ERR.value)
     
     return program
 
-def check_arg_text(text, typ):
+def lex_instruction(tokens):
     """
-    Checks if an instruction argument is in the right format based on its type. Terminates the execution with an error (32) 
-    if not.
+    Checks the lexical and syntactic rules of a single line of the IPPcode21 source code with the same rules as the 
+    parser of the source code. Terminates the execution with an error when the opcode does not exist (22) or when the 
+    operands are wrong (23). Values of integers and floats are checked only when decoded.
 
     Parameters
-    -----------
-    text: string
-        The text of the instruction argument.
-    typ: {"var", "int", "nil", "bool", "label", "type", "string"}
-        The type of the instruction argument.
+    ----------
+    tokens: list
+        The white space separated tokens of the line without the comment, the first token is the opcode.
     
     Return
     -------
-    string
-        The checked and formated text of the instruction argument.
+    opcode: string
+        The upper case opcode.
+    operands: list
+        The types and the texts of the operands [type, text, ...].
+    """
+    opcode = tokens[0].upper()
+    kinds = INST_OPERANDS.get(opcode)
+    if kinds == None:
+        terminate(Error.INSTRUCTION_ERR.value)
+    if len(tokens) != len(kinds) + 1:
+        terminate(Error.LEX_SYN_ERR.value)
+    
+    operands = []
+    for kind, token in zip(kinds, tokens[1:]):
+        typ, text = kind, token
+        if kind == "symb":
+            typ, _, text = token.partition("@")
+            if typ not in SYMB_TYPES:
+                terminate(Error.LEX_SYN_ERR.value)
+            if typ in ("GF", "LF", "TF"):
+                typ, text = "var", token
+        
+        if typ in ARG_VALIDATORS:
+            valid = ARG_VALIDATORS[typ](text) != None
+        elif typ == "string":
+            valid = STRING_INVALID(text) == None
+        elif typ == "bool":
+            valid = text == "true" or text == "false"
+        elif typ == "nil":
+            valid = text == "nil"
+        else:
+            valid = text != ""
+        if not valid:
+            terminate(Error.LEX_SYN_ERR.value)
+        operands += (typ, text)
+    
+    return opcode, operands
+
+def load_text_instruction(tokens, program):
     """
+    Checks and decodes a single line of the IPPcode21 source code and stores it to the program. Terminates the 
+    execution with an error when the instruction is wrong (22, 23), an integer or a float has a wrong format (32) or 
+    a label is redefined (52).
 
-    regexes = {"var" : r"^(GF|LF|TF)@[A-Za-z_\-$&%*!?][A-Za-z_\-$&%*!?0-9]*$", 
-               "label" : r"^[A-Za-z_\-$&%*!?][A-Za-z_\-$&%*!?0-9]*$", "type" : "^(int|string|bool|float)$"}
+    Parameters
+    ----------
+    tokens: list
+        The white space separated tokens of the line without the comment.
+    program: list
+        The list of already loaded instructions.
+    """
+    opcode, operands = lex_instruction(tokens)
+    arg_arr = [INTERNED.setdefault(opcode, opcode)]
+    for i in range(0, len(operands), 2):
+        typ = operands[i]
+        arg_arr.append(INTERNED.setdefault(typ, typ))
+        arg_arr.append(check_arg_text(operands[i + 1], typ))
+
+    if opcode == "LABEL":
+        if arg_arr[2] in PROGRAM.labels:
+            exit_load_error(Error.SEMANTIC_ERR)
+        PROGRAM.labels[arg_arr[2]] = len(program)
+    elif opcode in JUMP_OPCODES:
+        PROGRAM.jumps.append(arg_arr[2])
+
+    program.append(arg_arr)
+
+def parse_IPPcode21(source):
+    """
+    Parses the IPPcode21 source code directly, without its XML representation. The source is lexed line by line in 
+    a single pass and the same instructions as from the XML representation are built. Terminates the execution with 
+    an error when the source cannot be read (11), the header is missing (21), the code is lexically or syntactically 
+    wrong (22, 23) or with the same errors as the XML representation of the code.
 
-    if typ == "string":
-        if text == None:
-            return ""
-        i = 0
-        while i < len(text):
-            if ord(text[i]) <= 32:
-                os._exit(Error.XML_STRUCTURE_ERR.value) # wrong string format
-            elif text[i] == '#':
-                os._exit(Error.XML_STRUCTURE_ERR.value) # wrong string format
-            elif text[i] == '\\':
-                if re.match("^[0-9][0-9][0-9]$", text[i+1:i+4]) == None:
-                    os._exit(Error.XML_STRUCTURE_ERR.value) # wrong string format
-                text = text[:i] + chr(int(text[i+1:i+4])) + text[i+4:]
-            i += 1
-    elif typ == "int":
+    Parameters
+    ----------
+    source : string
+        The name and path to a file containing the source code, can be also sys.stdin or a binary file object.
+    
+    Return
+    -------
+    program : list
+        A list cointaining all loaded instructions [[OPCODE, arguments...], ...]
+    """
+    global SOURCE_LINES
+    program = []
+    if PIPELINE != None:
+        PIPELINE.program = program
+
+    try:
+        if source == sys.stdin:
+            lines = sys.stdin
+        elif isinstance(source, str):
+            lines = open(source, "r", encoding="utf-8")
+        else:
+            lines = io.TextIOWrapper(source, encoding="utf-8")
+        
+        SOURCE_LINES = lines
+        for line in lines:
+            tokens = line.partition("#")[0].split()
+            if tokens:
+                if len(tokens) != 1 or tokens[0].lower() != HEADER:
+                    terminate(Error.HEADER_ERR.value)
+                break
+        else:
+            terminate(Error.HEADER_ERR.value) # empty source code
+        
+        for line in lines:
+            tokens = line.partition("#")[0].split()
+            if tokens:
+                load_text_instruction(tokens, program)
+                if PIPELINE != None:
+                    publish_instruction(len(program))
+    except (OSError, UnicodeDecodeError):
+        terminate(Error.IN_FILE_ERR.value)
+    
+    SOURCE_LINES = None
+    INTERNED.clear()
+
+    for jump in PROGRAM.jumps:
+        if jump not in PROGRAM.labels:
+            terminate(Error.SEMANTIC_ERR.value)
+    
+    return program
+
+def parse_source(source):
+    """
+    Parses the source in the format selected by the options, see parse_XML_input and parse_IPPcode21.
+    """
+    if OPTIONS.ippcode:
+        return parse_IPPcode21(source)
+    
+    return parse_XML_input(source)
+
+def load_program(source):
+    """
+    Loads the program either from the cache directory, when caching is enabled and the same source was already 
+    decoded by the same version of the interpreter, or by parsing it. A newly decoded program is stored to the cache.
+
+    Parameters
+    ----------
+    source : string
+        The name and path to a file containing the source code, can be also sys.stdin
+    
+    Return
+    -------
+    list
+        The list of decoded instructions, see parse_source.
+    """
+    if OPTIONS.cache == None:
+        return parse_source(source)
+    
+    digest = hashlib.sha256(VERSION.encode() + sys.version.encode() + bytes([OPTIONS.ippcode]))
+    try:
+        if source == sys.stdin:
+            source = io.BytesIO(sys.stdin.buffer.read()) # the source can be read only once, so it is kept in memory
+            digest.update(source.getbuffer())
+        else:
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+    except OSError:
+        return parse_source(source) # the error is reported by the parser
+    
+    path = os.path.join(OPTIONS.cache, digest.hexdigest())
+    instructions = read_cache_entry(path)
+    if instructions != None:
+        return instructions
+
+    instructions = parse_source(source)
+    write_cache_entry(path, instructions)
+    return instructions
+
+def read_cache_entry(path):
+    """
+    Reads a decoded program from the cache. Any entry, which cannot be read, is treated as a cache miss.
+
+    Parameters
+    ----------
+    path : string
+        The path to the cache entry.
+    
+    Return
+    -------
+    list, None
+        The list of decoded instructions or None on a cache miss.
+    """
+    try:
+        with open(path, "rb") as f:
+            entry = marshal.load(f)
+        os.utime(path) # the modification time is used as the time of last use by the eviction
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    
+    if type(entry) != dict or entry.get("version") != VERSION:
+        return None
+
+    PROGRAM.labels = entry["labels"]
+    return entry["instructions"]
+
+def write_cache_entry(path, instructions):
+    """
+    Stores a decoded program, which passed all load time checks, to the cache. The entry is written to a temporary 
+    file, which is then atomically renamed, so concurrently running interpreters never read a partially written entry.
+    Least recently used entries are then evicted until the size of the cache fits the size cap. Failures are ignored, 
+    the cache is only an optimization.
+
+    Parameters
+    ----------
+    path : string
+        The path to the cache entry.
+    instructions : list
+        The list of decoded instructions.
+    """
+    entry = {"version": VERSION, "labels": PROGRAM.labels, "instructions": instructions}
+    try:
+        os.makedirs(OPTIONS.cache, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=OPTIONS.cache, prefix=".tmp-")
         try:
-            text = int(text)
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(entry, f)
+            os.replace(tmp_path, path)
         except:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-    elif typ == "float":
+            os.unlink(tmp_path)
+            raise
+        evict_cache_entries()
+    except (OSError, ValueError):
+        pass
+
+def evict_cache_entries():
+    """
+    Removes the least recently used entries from the cache until its size fits the size cap. Entries removed 
+    concurrently by another interpreter are skipped.
+    """
+    entries = []
+    size = 0
+    with os.scandir(OPTIONS.cache) as it:
+        for entry in it:
+            if entry.name.startswith(".tmp-") or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            size += stat.st_size
+    
+    entries.sort()
+    for mtime, entry_size, entry_path in entries:
+        if size <= OPTIONS.cache_size:
+            break
         try:
-            text = float.fromhex(text)
+            os.unlink(entry_path)
+        except OSError:
+            pass
+        size -= entry_size
+
+def write_image(path, instructions):
+    """
+    Writes a checked program to a program image. The image consists of a header, the operand offsets of each 
+    instruction, the operand pool, the label table, the constant offsets, the opcode array and the constant data. 
+    Equal constants are stored only once. Terminates the execution with an error (12) when the image cannot be written.
+
+    Parameters
+    ----------
+    path : string
+        The path to the program image.
+    instructions : list
+        The list of decoded instructions.
+    """
+    opcode_numbers = {opcode: number for number, opcode in enumerate(IMAGE_OPCODES)}
+    constants = {}
+    opcodes = array.array("B")
+    offsets = array.array("I", [0])
+    operands = array.array("I")
+    for inst in instructions:
+        opcodes.append(opcode_numbers[inst[0]])
+        for i in range(1, len(inst), 2):
+            data = marshal.dumps((inst[i], inst[i + 1]))
+            operands.append(constants.setdefault(data, len(constants)))
+        offsets.append(len(operands))
+    
+    labels = array.array("I")
+    for label, index in PROGRAM.labels.items():
+        data = marshal.dumps(("label", label))
+        labels.append(constants.setdefault(data, len(constants)))
+        labels.append(index)
+
+    data_offsets = array.array("I", [0])
+    for data in constants:
+        data_offsets.append(data_offsets[-1] + len(data))
+
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(IMAGE_HEADER.pack(IMAGE_MAGIC, VERSION.encode(), len(instructions), len(operands), 
+                                          len(constants), len(labels) // 2, data_offsets[-1]))
+                for section in (offsets, operands, labels, data_offsets, opcodes):
+                    f.write(section.tobytes())
+                for data in constants:
+                    f.write(data)
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask) # the image is shared, unlike the temporary file
+            os.replace(tmp_path, path)
         except:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-    elif typ == "bool":
-        if text == "true":
-            text = True
-        elif text == "false":
-            text = False
-        else:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-    elif typ == "nil":
-        if text == "nil":
-            text = None
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
+
+def load_image(path):
+    """
+    Maps a program image to memory. Only the label table is decoded, instructions are decoded when first executed. 
+    Terminates the execution with an error when the image cannot be opened (11) or when it is not a program image 
+    of this version of the interpreter (31).
+
+    Parameters
+    ----------
+    path : string
+        The path to the program image.
+    
+    Return
+    -------
+    list
+        The list of compiled instructions, each of them is the decoding stub until it is executed.
+    """
+    global IMAGE
+    try:
+        with open(path, "rb") as f:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # the mapping stays valid after closing
+    except (OSError, ValueError):
+        terminate(Error.IN_FILE_ERR.value)
+    
+    image = IMAGE = Image(view)
+    try:
+        magic, version, inst_count, operand_count, const_count, label_count, data_size = IMAGE_HEADER.unpack_from(view)
+        if magic != IMAGE_MAGIC or version.rstrip(b"\0") != VERSION.encode():
+            terminate(Error.FORMAT_ERR.value)
+        
+        memory = memoryview(view)
+        sections = []
+        position = IMAGE_HEADER.size
+        for count, fmt in ((inst_count + 1, "I"), (operand_count, "I"), (2 * label_count, "I"), 
+                           (const_count + 1, "I"), (inst_count, "B")):
+            size = count * struct.calcsize(fmt)
+            sections.append(memory[position:position + size].cast(fmt))
+            position += size
+        image.offsets, image.operands, image.labels, image.data_offsets, image.opcodes = sections
+        image.data = memory[position:position + data_size]
+        if len(image.data) != data_size or len(image.opcodes) != inst_count:
+            terminate(Error.FORMAT_ERR.value) # truncated image
+        
+        image.constants = [None] * const_count
+        for i in range(0, len(image.labels), 2):
+            PROGRAM.labels[image_constant(image.labels[i])[1]] = image.labels[i + 1]
+    except (struct.error, TypeError, ValueError, IndexError, EOFError):
+        terminate(Error.FORMAT_ERR.value)
+    
+    PROGRAM.counted = IMAGE_OPCODES.index("BREAK") in image.opcodes
+    image.program = [DECODE] * inst_count
+    return image.program
+
+def image_constant(index):
+    """
+    Decodes a constant of the program image, each constant is decoded only once and then shared by all operands.
+
+    Parameters
+    ----------
+    index : int
+        The index of the constant.
+    
+    Return
+    -------
+    tuple
+        The type and the value of the constant.
+    """
+    constant = IMAGE.constants[index]
+    if constant == None:
+        start = IMAGE.data_offsets[index]
+        constant = IMAGE.constants[index] = marshal.loads(IMAGE.data[start:IMAGE.data_offsets[index + 1]])
+    
+    return constant
+
+def image_instruction(index):
+    """
+    Decodes an instruction of the program image.
+    
+    Parameters
+    ----------
+    index : int
+        The index of the instruction.
+    
+    Return
+    -------
+    list
+        The decoded instruction [OPCODE, arguments...].
+    """
+    try:
+        inst = [IMAGE_OPCODES[IMAGE.opcodes[index]]]
+        for constant in IMAGE.operands[IMAGE.offsets[index]:IMAGE.offsets[index + 1]]:
+            inst.extend(image_constant(constant))
+    except (TypeError, ValueError, IndexError, EOFError):
+        terminate(Error.FORMAT_ERR.value)
+    
+    return inst
+
+def DECODE():
+    """
+    Decoding stub of an instruction of a program image, the executing loop decodes and compiles the instruction and 
+    executes it.
+    """
+    raise UndecodedInstruction()
+
+def run_pipelined(source):
+    """
+    Loads the program in a background thread and meanwhile executes its already loaded prefix. The output of the 
+    program is deferred until the whole program is loaded and checked, so load errors are always reported before any 
+    output. Reading of the input waits for the whole program as well. When the instructions turn out not to be 
+    ordered, the executed prefix was not the real beginning of the program and the execution is restarted.
+
+    Parameters
+    ----------
+    source : string
+        The name and path to a file containing the source code, can be also sys.stdin
+    
+    Return
+    -------
+    list
+        The list of all decoded instructions, the execution continues from PROGRAM.IP.
+    """
+    global PIPELINE, FRAMES, OUTPUT
+    pipeline = PIPELINE = Pipeline()
+    PROGRAM.labels = PendingLabels()
+    OUTPUT, pipeline.output = pipeline.output, OUTPUT
+    sys.stderr, pipeline.stderr = pipeline.stderr, sys.stderr
+    threading.Thread(target=load_in_background, args=(source,), daemon=True).start()
+
+    try:
+        execute_prefix()
+    except RestartProgram:
+        FRAMES = Frames()
+        PROGRAM.data_stack = []
+        PROGRAM.return_stack = []
+        PROGRAM.IP = 0
+        PROGRAM.IC = 0
+    
+    return pipeline.program
+
+def load_in_background(source):
+    """
+    Loads the program and marks the end of the loading. Load errors terminate the whole interpret.
+
+    Parameters
+    ----------
+    source : string
+        The name and path to a file containing the source code, can be also sys.stdin
+    """
+    program = load_program(source)
+    with PIPELINE.condition:
+        PIPELINE.program = program
+        PIPELINE.loaded = True
+        PIPELINE.condition.notify_all()
+
+def publish_instruction(order):
+    """
+    Makes the lastly loaded instruction available to the execution.
+
+    Parameters
+    ----------
+    order : int
+        The order of the loaded instruction.
+    """
+    with PIPELINE.condition:
+        if order < PIPELINE.last_order:
+            PIPELINE.ordered = False
+        PIPELINE.last_order = order
+        PIPELINE.condition.notify_all()
+
+def execute_prefix():
+    """
+    Executes the loaded instructions until the whole program is loaded. Raises RestartProgram, when the program has to 
+    be executed again from its beginning.
+    """
+    try:
+        while PIPELINE != None:
+            if PIPELINE.loaded or not PIPELINE.ordered:
+                wait_for_program()
+            elif PROGRAM.IP < len(PIPELINE.program):
+                PROGRAM.IC += 1
+                inst = decode_instruction(PIPELINE.program[PROGRAM.IP], PROGRAM.IP)
+                target = inst[0](inst)
+                PROGRAM.IP = PROGRAM.IP + 1 if target == None else target
+            else:
+                with PIPELINE.condition:
+                    while PROGRAM.IP >= len(PIPELINE.program) and not PIPELINE.loaded:
+                        PIPELINE.condition.wait()
+    except SystemExit:
+        if PIPELINE != None:
+            wait_for_program()
+        raise
+
+def wait_for_program():
+    """
+    Waits until the whole program is loaded and ends the pipelined execution, the deferred output is written out. 
+    Raises RestartProgram, when the instructions were not loaded in the ascending order.
+    """
+    global PIPELINE, OUTPUT
+    pipeline = PIPELINE
+    with pipeline.condition:
+        while not pipeline.loaded:
+            pipeline.condition.wait()
+    
+    PIPELINE = None
+    OUTPUT, pipeline.output = pipeline.output, OUTPUT
+    sys.stderr, pipeline.stderr = pipeline.stderr, sys.stderr
+    if not pipeline.ordered:
+        raise RestartProgram() # the deferred output is dropped
+
+    OUTPUT.write(pipeline.output.getvalue())
+    sys.stderr.write(pipeline.stderr.getvalue())
+
+def decode_instruction(inst, index):
+    """
+    Decodes an instruction to its record, which holds the handler of the instruction in place of its opcode. Records
+    of jumps are extended by the index of the instruction following the target label, or by None, when the label is
+    not known yet. The record of CALL is further extended by the index of the instruction following the call.
+    
+    Parameters
+    ----------
+    inst : list
+        The decoded instruction [OPCODE, arguments...].
+    index : int
+        The index of the instruction.
+    
+    Return
+    -------
+    list
+        The record of the instruction [handler, arguments..., target, return index].
+    """
+    record = inst[:]
+    record[0] = functions[inst[0]]
+    if inst[0] in TARGET_OPCODES:
+        label = PROGRAM.labels.get(inst[2]) # labels, which are not loaded yet, are not waited for
+        record.append(None if label == None else label + 1)
+        if inst[0] == "CALL":
+            record.append(index + 1)
+    
+    return record
+
+def label_target(label):
+    """
+    Looks up the target of a jump, which was not known when its instruction was decoded.
+    
+    Parameters
+    ----------
+    label : string
+        The name of the label.
+    
+    Return
+    -------
+    int
+        The index of the instruction following the label.
+    """
+    return PROGRAM.labels[label] + 1
+
+def execute(program, ip):
+    """
+    Executes the program from the instruction at the index ip to its end. The instruction pointer is kept in a local
+    variable, compiled instructions return the index of the next instruction only when they jump. Decoding stubs of 
+    a program image are replaced by the compiled instructions, when they are reached.
+    
+    Parameters
+    ----------
+    program : list
+        The list of compiled instructions.
+    ip : int
+        The index of the first executed instruction.
+    """
+    end = len(program)
+    while True:
+        try:
+            while ip < end:
+                target = program[ip]()
+                if target is None:
+                    ip += 1
+                else:
+                    ip = target
+            return
+        except UndecodedInstruction:
+            program[ip] = compile_instruction(decode_instruction(image_instruction(ip), ip))
+
+def execute_counted(program, ip):
+    """
+    Executes the program like execute and counts the executed instructions in PROGRAM.IC.
+    
+    Parameters
+    ----------
+    program : list
+        The list of compiled instructions.
+    ip : int
+        The index of the first executed instruction.
+    """
+    end = len(program)
+    while True:
+        try:
+            while ip < end:
+                PROGRAM.IC += 1
+                target = program[ip]()
+                if target is None:
+                    ip += 1
+                else:
+                    ip = target
+            return
+        except UndecodedInstruction:
+            PROGRAM.IC -= 1
+            program[ip] = compile_instruction(decode_instruction(image_instruction(ip), ip))
+
+def execute_profiled(program, ip):
+    """
+    Executes the program like execute_counted and records the execution count and the cumulative wall time of each
+    instruction in PROFILE. It is a loop of its own, so the execution without --profile does not check for it.
+    
+    Parameters
+    ----------
+    program : list
+        The list of compiled instructions.
+    ip : int
+        The index of the first executed instruction.
+    """
+    end = len(program)
+    counts = PROFILE.counts
+    times = PROFILE.times
+    clock = time.perf_counter_ns
+    while True:
+        try:
+            while ip < end:
+                PROGRAM.IC += 1
+                counts[ip] += 1
+                start = clock()
+                target = program[ip]()
+                times[ip] += clock() - start
+                if target is None:
+                    ip += 1
+                else:
+                    ip = target
+            return
+        except UndecodedInstruction:
+            PROGRAM.IC -= 1
+            counts[ip] -= 1
+            program[ip] = compile_instruction(decode_instruction(image_instruction(ip), ip))
+
+def execute_statistics(program, ip):
+    """
+    Executes the program like execute_counted and collects the statistics of --stats in STATS, the number of 
+    executions of each instruction and the number of initialized variables. Only the destination variable of the 
+    executed instruction can become initialized, so it is checked before and after the instruction and the frames
+    are counted only, when the temporary frame is discarded. It is a loop of its own, so the execution without 
+    --stats does not check for it.
+    
+    Parameters
+    ----------
+    program : list
+        The list of compiled instructions.
+    ip : int
+        The index of the first executed instruction.
+    """
+    end = len(program)
+    counts = STATS.counts
+    destinations = STATS.destinations
+    while True:
+        try:
+            while ip < end:
+                PROGRAM.IC += 1
+                counts[ip] += 1
+                destination = destinations[ip]
+                if destination is None:
+                    target = program[ip]()
+                else:
+                    frame = destination[0][destination[1]]
+                    slot = destination[2]
+                    if slot is None:
+                        discarded = initialized_variables(frame)
+                        target = program[ip]()
+                        STATS.variables -= discarded
+                    elif slot < len(frame) and frame[slot] is not None and frame[slot] is not UNDEFINED:
+                        target = program[ip]()
+                    else:
+                        target = program[ip]()
+                        if slot < len(frame) and frame[slot] is not None and frame[slot] is not UNDEFINED:
+                            STATS.variables += 1
+                            if STATS.variables > STATS.peak_variables:
+                                STATS.peak_variables = STATS.variables
+                if target is None:
+                    ip += 1
+                else:
+                    ip = target
+            return
+        except UndecodedInstruction:
+            PROGRAM.IC -= 1
+            counts[ip] -= 1
+            program[ip] = compile_instruction(decode_instruction(image_instruction(ip), ip))
+
+def initialized_variables(frame):
+    """
+    Counts the initialized variables of a frame.
+    
+    Parameters
+    ----------
+    frame : list
+        The frame.
+    
+    Return
+    -------
+    int
+        The number of variables, which were assigned a value.
+    """
+    return sum(1 for value in frame if value is not None and value is not UNDEFINED)
+
+def start_statistics(instructions):
+    """
+    Prepares the collection of the statistics of --stats, see execute_statistics. The destination variable of each
+    instruction is bound to its frame and slot, CREATEFRAME and POPFRAME are bound to the temporary frame, which
+    they discard.
+    
+    Parameters
+    ----------
+    instructions : list
+        The list of decoded instructions.
+    """
+    global STATS
+    destinations = []
+    for inst in instructions:
+        if inst[0] == "CREATEFRAME" or inst[0] == "POPFRAME":
+            destinations.append((FRAMES.frames, FRAME_ROLES["TF"], None))
+        elif len(inst) > 1 and inst[1] == "var" and inst[0] != "DEFVAR":
+            destinations.append(bind_var(inst[2]))
+        else:
+            destinations.append(None)
+    
+    orders = PROGRAM.orders if PROGRAM.orders != None else range(1, len(instructions) + 1)
+    STATS = Statistics([inst[0] for inst in instructions], orders, destinations)
+
+def write_statistics():
+    """
+    Ends the collection of the statistics and writes them to their files, see --stats. Terminates the execution 
+    with an error (12), when a file cannot be written.
+    """
+    global STATS
+    stats, STATS = STATS, None  # a failed write terminates, which must not write the statistics again
+    counted = [index for index, opcode in enumerate(stats.opcodes) if opcode not in UNCOUNTED_OPCODES]
+    values = {"insts": sum(stats.counts[index] for index in counted), "vars": stats.peak_variables, "hot": ""}
+    executed = [index for index in counted if stats.counts[index]]
+    if executed:
+        hot = max(executed, key=lambda index: (stats.counts[index], -stats.orders[index]))
+        values["hot"] = stats.orders[hot]
+    
+    try:
+        for path, names in OPTIONS.stats:
+            with open(path, "w") as f:
+                for name in names:
+                    f.write("%s\n" % values[name])
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
+
+def start_sampler(size):
+    """
+    Starts the sampling of the executed instructions and of the call stacks by the timer signal of the processor 
+    time, see take_sample. Each instruction is named by the label nearest before it, the calls are named by the
+    labels of their CALL instructions.
+    
+    Parameters
+    ----------
+    size : int
+        The number of instructions of the program.
+    """
+    global SAMPLER
+    names = []
+    name = SAMPLE_ROOT
+    for index, label in sorted((index, label) for label, index in PROGRAM.labels.items()):
+        names.extend([name] * (index - len(names)))
+        name = label
+    names.extend([name] * (size + 1 - len(names)))  # the index after the last instruction ends the program
+    
+    SAMPLER = Sampler(names, {execute.__code__, execute_counted.__code__, execute_profiled.__code__, 
+                              execute_translated.__code__})
+    signal.signal(signal.SIGPROF, take_sample)
+    signal.setitimer(signal.ITIMER_PROF, OPTIONS.sample_interval, OPTIONS.sample_interval)
+
+def take_sample(signum, frame):
+    """
+    Handles the timer signal, the index of the executed instruction is read from the dispatch loop, which is found 
+    among the frames of the Python stack, and the return addresses are read from the return stack. Samples taken, 
+    while the program is not executed by a dispatch loop, e.g. while it is being loaded, are left out.
+    
+    Parameters
+    ----------
+    signum : int
+        The number of the signal.
+    frame : frame
+        The Python frame interrupted by the signal.
+    """
+    loops = SAMPLER.loops
+    while frame is not None and frame.f_code not in loops:
+        frame = frame.f_back
+    if frame is None:
+        return
+    
+    names = SAMPLER.names
+    return_stack = PROGRAM.return_stack
+    stack = [names[address - 1] for address in return_stack[-SAMPLE_DEPTH:]]
+    if len(return_stack) > SAMPLE_DEPTH:
+        stack.insert(0, "[...]")
+    stack.append(names[frame.f_locals["ip"]])
+    
+    stack = ";".join(stack)
+    SAMPLER.stacks[stack] = SAMPLER.stacks.get(stack, 0) + 1
+
+def write_samples(path):
+    """
+    Stops the sampling and writes the numbers of samples of the call stacks, a line with the names of the calls 
+    from the outermost one separated by semicolons and the number of samples for each stack. Terminates the 
+    execution with an error (12), when the file cannot be written.
+    
+    Parameters
+    ----------
+    path : string
+        The path to the written file.
+    """
+    global SAMPLER
+    signal.setitimer(signal.ITIMER_PROF, 0)
+    sampler, SAMPLER = SAMPLER, None    # a failed write terminates, which must not write the samples again
+    try:
+        with open(path, "w") as f:
+            for stack, count in sorted(sampler.stacks.items()):
+                f.write("%s %d\n" % (stack, count))
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
+
+def decode_escape(match):
+    """
+    Decodes a single escape sequence of a string literal.
+
+    Parameters
+    -----------
+    match: Match
+        The matched escape sequence in the format \\ddd.
+    
+    Return
+    -------
+    string
+        The character with the decimal code ddd.
+    """
+    return chr(int(match.group(1)))
+
+def check_arg_text(text, typ):
+    """
+    Checks if an instruction argument is in the right format based on its type. Terminates the execution with an error (32) 
+    if not.
+
+    Parameters
+    -----------
+    text: string
+        The text of the instruction argument.
+    typ: {"var", "int", "nil", "bool", "label", "type", "string"}
+        The type of the instruction argument.
+    
+    Return
+    -------
+    string
+        The checked and formated text of the instruction argument.
+    """
+
+    if typ == "string":
+        if text == None:
+            return ""
+        if STRING_INVALID(text) != None:
+            exit_load_error(Error.XML_STRUCTURE_ERR) # wrong string format
+        if '\\' in text:
+            text = STRING_ESCAPES(decode_escape, text)
+        text = INTERNED.setdefault(text, text)
+    elif typ == "int":
+        try:
+            text = int(text)
+        except:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+    elif typ == "float":
+        try:
+            text = float.fromhex(text)
+        except:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+    elif typ == "bool":
+        if text == "true":
+            text = True
+        elif text == "false":
+            text = False
+        else:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+    elif typ == "nil":
+        if text == "nil":
+            text = None
+        else:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+    else:
+        if text == None:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+        if ARG_VALIDATORS[typ](text) == None:
+            exit_load_error(Error.XML_STRUCTURE_ERR)
+        text = INTERNED.setdefault(text, text)
+    
+    return text
+
+def exit_error(error):
+    """
+    Terminates the execution with a run time error. During the pipelined execution, the whole program is waited for 
+    first, so load errors take precedence, and the deferred output is written out.
+
+    Parameters
+    ----------
+    error: Error
+        The error to terminate with.
+    """
+    if PIPELINE != None:
+        wait_for_program()
+    
+    terminate(error.value)
+
+def var_slot(var):
+    """
+    Retrieves the slot of a variable. Slots are assigned to variables in the order, in which they are first
+    resolved, and all frames are extended by the new slot. Local and temporary variables share their slots, as
+    a temporary frame becomes a local frame.
+
+    Parameters
+    ----------
+    var: string
+        The name of the variable.
+
+    Return
+    -------
+    int
+        The index of the variable in its frame.
+    """
+    global FRAMES
+    if var[:2] == "GF":
+        slot = FRAMES.global_slots.get(var)
+        if slot == None:
+            slot = FRAMES.global_slots[var] = len(FRAMES.global_names)
+            FRAMES.global_names.append(var)
+            FRAMES.global_frame.append(None)
+        return slot
+
+    slot = FRAMES.local_slots.get(var[3:])
+    if slot == None:
+        slot = FRAMES.local_slots[var[3:]] = len(FRAMES.local_names)
+        FRAMES.local_names.append(var[3:])
+        frames = FRAMES.local_frame + FRAMES.frames[1:] + [FRAMES.no_frame]
+        for frame in {id(frame): frame for frame in frames}.values():
+            frame.append(None)
+    return slot
+
+def var_frame(var):
+    """
+    Retrieves the frame of a variable. Terminates with an error when the frame does not exist (55).
+
+    Parameters
+    ----------
+    var: string
+        The name of the variable.
+
+    Return
+    -------
+    list
+        The frame of the variable.
+    """
+    global FRAMES
+    if var[:2] == "GF":
+        return FRAMES.global_frame
+    elif (var[:2] == "LF" and FRAMES.LF) or (var[:2] == "TF" and FRAMES.TF):
+        return FRAMES.frames[FRAME_ROLES[var[:2]]]
+
+    exit_error(Error.FRAME_ERR)
+
+def assign_var_value(var, typ, value):
+    """
+    Assigns a variable with a given value. Terminates with an error if the variable does not exist (54) or 
+    when the assigned frame does not exist (55).
+
+    Parameters
+    ----------
+    var: string
+        The variable name
+    typ: int
+        The type tag of the assigned value
+    value: int, string, bool, float, None
+        The value to be assigned
+    """
+    frame = var_frame(var)
+    slot = var_slot(var)
+    if frame[slot] is None:
+        exit_error(Error.VAR_EXIST_ERR)
+    frame[slot] = new_value(typ, value)
+
+def new_value(typ, value):
+    """
+    Creates an immutable value, values of the nil and bool types are shared.
+    
+    Parameters
+    ----------
+    typ: int
+        The type tag of the value.
+    value: int, string, bool, float, None
+        The value.
+    
+    Return
+    -------
+    (int, <value based on the type>)
+    """
+    if typ == BOOL:
+        return TRUE_VALUE if value else FALSE_VALUE
+    elif typ == NIL:
+        return NIL_VALUE
+    
+    return (typ, value)
+
+def literal_value(typ, value):
+    """
+    Creates the value of a literal operand.
+    
+    Parameters
+    ----------
+    typ: {"int", "nil", "bool", "string", "float", "label", "type"}
+        The type of the operand.
+    value: int, string, bool, float, None
+        The value of the operand.
+    
+    Return
+    -------
+    (int, <value based on the type>)
+    """
+    return new_value(TYPE_TAGS[typ], value)
+
+def concat_strings(string1, string2):
+    """
+    Concatenates two strings of values, the result is stored as Text, when it is long, so a repeated CONCAT to
+    the same variable only appends to its buffer.
+    
+    Parameters
+    ----------
+    string1: string, Text
+        The first string.
+    string2: string, Text
+        The second string.
+    
+    Return
+    -------
+    string, Text
+    """
+    if string2.__class__ is Text:
+        string2 = str(string2)
+    if string1.__class__ is Text:
+        return string1.append(string2)
+    
+    string = string1 + string2
+    if len(string) < TEXT_LENGTH:
+        return string
+    return Text(list(string), len(string))
+
+def set_char(string, index, char):
+    """
+    Replaces a character of a string of a value, a long string is stored as Text, so a repeated SETCHAR on the same
+    variable replaces the character in its buffer.
+    
+    Parameters
+    ----------
+    string: string, Text
+        The string.
+    index: int
+        The index of the replaced character, it must be within the string.
+    char: string
+        The new character.
+    
+    Return
+    -------
+    string, Text
+    """
+    if string.__class__ is Text:
+        return string.replace(index, char)
+    if len(string) < TEXT_LENGTH:
+        return string[0:index] + char + string[index + 1:]
+    
+    buffer = list(string)
+    buffer[index] = char
+    return Text(buffer, len(buffer))
+
+def get_var_type(var):
+    """
+    Retrieves the type of a variable. Terminates with an error if the variable does not exist (54) or 
+    when the assigned frame does not exist (55).
+
+    Parameters
+    ----------
+    var: string
+        The name of a variable, which type is to be retrieved.
+    
+    Return
+    -------
+    int
+        The type tag of the variable.
+    """
+    value = var_frame(var)[var_slot(var)]
+    if value is None:
+        exit_error(Error.VAR_EXIST_ERR)
+    return value[0]
+
+def get_var_value(var):
+    """
+    Retrieves the value of a given variable. Terminates with an error if the variable does not exist (54),
+    when the assigned frame does not exist (55) or when the variable was not assigned yet (56).
+
+    Parameters
+    ----------
+    var: string
+        The name of a variable, which value is to be retrieved.
+    
+    Return
+    -------
+    (int, <value based on the type>)
+    """
+    value = var_frame(var)[var_slot(var)]
+    if value is None:
+        exit_error(Error.VAR_EXIST_ERR)
+    elif value is UNDEFINED:
+        exit_error(Error.MISSING_VALUE_ERR)
+    return value
+
+def get_values_math(operands):
+    """
+    Retrieves the values of operands of a given instruction. Terminates with an error (57) if the operands are not of a type 
+    used in mathematical instructions or there is a type missmatch 
+
+    Parameters
+    ----------
+    operands: list
+        A list of operands in a specific format.
+    
+    Return
+    -------
+        List of the operand values with the first element being their data type.
+    """
+
+    if operands[1] != "var":
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    if operands[3] == "var":
+        value1 = get_var_value(operands[4])
+    else:
+        value1 = literal_value(operands[3], operands[4])
+    
+    if operands[5] == "var":
+        value2 = get_var_value(operands[6])
+    else:
+        value2 = literal_value(operands[5], operands[6])
+    
+    if value1[0] != value2[0] or (value1[0] != INT and value1[0] != FLOAT):
+        exit_error(Error.OPERAND_TYPE_ERR)
+       
+    return [value1[0], value1[1], value2[1]]
+
+def get_values_logic(operands, eq = False, typ = "var"):
+    """
+    Retrieves the values of operands of a given instruction. Terminates with an error (57) if there is a type missmatch.
+
+    Parameters
+    ----------
+    operands: list
+        A list of operands in a specific format.
+    eq: bool
+        True when the instruction uses equality comparison
+    typ: string
+        The type of the first operand.
+    Return
+    -------
+        List of the operand values with the first element being their data type.
+    """
+
+    if operands[1] != typ:
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    if operands[3] == "var":
+        value1 = get_var_value(operands[4])
+    elif operands[3] == "int" or operands[3] == "float" or operands[3] == "string" or operands[3] == "bool":
+        value1 = literal_value(operands[3], operands[4])
+    elif operands[3] == "nil" and eq:
+        value1 = NIL_VALUE
+    else:
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    if operands[5] == "var":
+        value2 = get_var_value(operands[6])
+    elif operands[5] == "int" or operands[5] == "float" or operands[5] == "string" or operands[5] == "bool":
+        value2 = literal_value(operands[5], operands[6])
+    elif operands[5] == "nil" and eq:
+        value2 = NIL_VALUE
+    else:
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    if value1[0] != value2[0] and value1[0] != NIL and value2[0] != NIL:
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    return [value1[1], value2[1]]
+
+def get_values_bool(operands):
+    """
+    Retrieves the values of operands of a given instruction. Terminates with an error (57) if any of the operands is not
+    of a boolean type.
+
+    Parameters
+    ----------
+    operands: list
+        A list of operands in a specific format.
+    Return
+    -------
+        List of boolean values.
+    """
+
+    if operands[1] != "var":
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    if operands[3] == "var":
+        value1 = get_var_value(operands[4])
+    else:
+        value1 = literal_value(operands[3], operands[4])
+    
+    if operands[5] == "var":
+        value2 = get_var_value(operands[6])
+    else:
+        value2 = literal_value(operands[5], operands[6])
+    
+    if value1[0] != value2[0] or value1[0] != BOOL:
+        exit_error(Error.OPERAND_TYPE_ERR)
+    
+    return [value1[1], value2[1]]
+
+def get_stack_values_math():
+    global PROGRAM
+    if len(PROGRAM.data_stack) < 2:
+        exit_error(Error.MISSING_VALUE_ERR)
+    
+    val2 = PROGRAM.data_stack.pop()
+    val1 = PROGRAM.data_stack.pop()
+    if val1[0] != val2[0] or (val1[0] != INT and val1[0] != FLOAT):
+        exit_error(Error.OPERAND_TYPE_ERR)
+
+    return [val1[0], val1[1], val2[1]]
+
+def get_satack_values_logic(eq = False):
+    global PROGRAM
+    if len(PROGRAM.data_stack) < 2:
+        exit_error(Error.MISSING_VALUE_ERR)
+    
+    val2 = PROGRAM.data_stack.pop()
+    val1 = PROGRAM.data_stack.pop()
+    if eq:
+        if val1[0] != val2[0] and val1[0] != NIL and val2[0] != NIL:
+            exit_error(Error.OPERAND_TYPE_ERR)
+    else:
+        if val1[0] != val2[0] or val1[0] == NIL:
+            exit_error(Error.OPERAND_TYPE_ERR)
+    
+    return [val1[1], val2[1]]
+
+def get_satack_values_bool():
+    global PROGRAM
+    if len(PROGRAM.data_stack) < 2:
+        exit_error(Error.MISSING_VALUE_ERR)
+    
+    val2 = PROGRAM.data_stack.pop()
+    val1 = PROGRAM.data_stack.pop()
+    if val1[0] != BOOL or val2[0] != BOOL:
+        exit_error(Error.OPERAND_TYPE_ERR)
+
+    return [val1[1], val2[1]]
+
+def compile_program(instructions):
+    """
+    Decodes all instructions of the program to their records, see decode_instruction, compiles the records to
+    closures, see compile_instruction, and fuses common sequences of them to superinstructions, see fuse_program.
+    Programs with BREAK are not fused, as they count each executed instruction, and neither are profiled programs,
+    which time each instruction, nor programs, which statistics are collected. Instructions, which operand types 
+    are proven by infer_types, are compiled without type checks, see compile_unchecked, the others are specialized on
+    the types seen at run time, see compile_quickening.
+    
+    Parameters
+    ----------
+    instructions : list
+        The list of decoded instructions.
+    
+    Return
+    -------
+    list
+        The list of compiled instructions.
+    """
+    PROGRAM.counted = any(inst[0] == "BREAK" for inst in instructions)
+    records = [decode_instruction(inst, index) for index, inst in enumerate(instructions)]
+    types = infer_types(records)
+    program = []
+    unchecked = []
+    for index, record in enumerate(records):
+        compiled = compile_unchecked(record, types[index])
+        if compiled == None:
+            program.append(compile_quickening(record, compile_instruction(record), program, index))
+        else:
+            program.append(compiled[0])
+            unchecked.append((index, compiled[1]))
+    counted = PROGRAM.counted or OPTIONS.profile != None or OPTIONS.stats
+    fused = set() if counted else fuse_program(records, program)
+    
+    for index, checks in unchecked:
+        if index not in fused:  # fused instructions are executed only when their superinstruction falls back
+            PROGRAM.unchecked += 1
+            PROGRAM.eliminated_checks += checks
+    
+    return program
+
+def compile_instruction(record):
+    """
+    Compiles an instruction record to a closure specialized on the kinds of its operands. Literal operands are baked
+    in as constants and variables are bound to their frames. The closure executes only the common case, anything
+    else, including all errors, is left to the generic handler of the instruction, which is called before any side
+    effect, so the semantics and the error codes stay the same. Instructions without a specialized closure are
+    compiled to a call of their generic handler.
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction, see decode_instruction.
+    
+    Return
+    -------
+    function
+        The compiled instruction, which returns the index of the next instruction when it jumps, otherwise None.
+    """
+    slow = functools.partial(record[0], record)
+    compiler = COMPILERS.get(record[0].__name__)
+    if compiler != None:
+        closure = compiler(record, slow)
+        if closure != None:
+            return closure
+    
+    return slow
+
+def bind_var(var):
+    """
+    Binds a variable to the role of its frame and to its slot. Local and temporary frames move between the roles,
+    so the frame is looked up in the roles, when the variable is accessed.
+    
+    Parameters
+    ----------
+    var : string
+        The name of the variable.
+    
+    Return
+    -------
+    frames : list
+        The frames by roles.
+    role : int
+        The role of the frame of the variable.
+    key : int
+        The slot of the variable in the frame.
+    """
+    return FRAMES.frames, FRAME_ROLES[var[:2]], var_slot(var)
+
+def bind_symbol(typ, value):
+    """
+    Binds a symbol operand to the role of the frame holding it, a literal is bound to a frame of its own, so both
+    are read the same way.
+    
+    Parameters
+    ----------
+    typ : string
+        The type of the operand.
+    value : int, string, bool, float, None
+        The value of the operand.
+    
+    Return
+    -------
+    frames : list
+        The frames by roles.
+    role : int
+        The role of the frame of the operand.
+    key : int
+        The slot of the operand in the frame.
+    """
+    if typ == "var":
+        return bind_var(value)
+    
+    return [[literal_value(typ, value)]], 0, 0
+
+def skip():
+    """
+    Compiled LABEL instruction, labels are interpreted at load time.
+    """
+
+def compile_label(record, slow):
+    """
+    Compiles the LABEL instruction, see compile_instruction.
+    """
+    return skip
+
+def compile_move(record, slow):
+    """
+    Compiles the MOVE instruction, see compile_instruction.
+    """
+    if record[1] != "var" or record[3] == "label" or record[3] == "type":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames, role, key = bind_symbol(record[3], record[4])
+    
+    def move():
+        value = frames[role][key]
+        if value is None or value is UNDEFINED or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = value
+    
+    return move
+
+def compile_arithmetic(record, slow, operation):
+    """
+    Compiles the ADD, SUB and MUL instructions, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def arithmetic():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None:
+            return slow()
+        typ = value1[0]
+        if typ != value2[0] or (typ != INT and typ != FLOAT) or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = (typ, operation(value1[1], value2[1]))
+    
+    return arithmetic
+
+def compile_idiv(record, slow):
+    """
+    Compiles the IDIV instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def idiv():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or value1[0] != INT or value2[0] != INT or value2[1] == 0
+            or dest_frames[dest_role][dest] is None):
+            return slow()
+        dest_frames[dest_role][dest] = (INT, int(value1[1] / value2[1]))
+    
+    return idiv
+
+def compile_relation(record, slow, operation):
+    """
+    Compiles the LT and GT instructions, see compile_instruction.
+    """
+    if record[1] != "var" or record[3] in ("nil", "label", "type") or record[5] in ("nil", "label", "type"):
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def relation():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None:
+            return slow()
+        typ = value1[0]
+        if typ != value2[0] or typ == UNSET or typ == NIL or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = TRUE_VALUE if operation(value1[1], value2[1]) else FALSE_VALUE
+    
+    return relation
+
+def compile_eq(record, slow):
+    """
+    Compiles the EQ instruction, see compile_instruction.
+    """
+    if record[1] != "var" or record[3] in ("label", "type") or record[5] in ("label", "type"):
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def eq():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None or value1[0] != value2[0] or value1[0] == UNSET or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = TRUE_VALUE if value1[1] == value2[1] else FALSE_VALUE
+    
+    return eq
+
+def compile_logic(record, slow, operation):
+    """
+    Compiles the AND and OR instructions, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def logic():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or value1[0] != BOOL or value2[0] != BOOL
+            or dest_frames[dest_role][dest] is None):
+            return slow()
+        dest_frames[dest_role][dest] = TRUE_VALUE if operation(value1[1], value2[1]) else FALSE_VALUE
+    
+    return logic
+
+def compile_not(record, slow):
+    """
+    Compiles the NOT instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames, role, key = bind_symbol(record[3], record[4])
+    
+    def not_():
+        value = frames[role][key]
+        if value is None or value[0] != BOOL or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = FALSE_VALUE if value[1] else TRUE_VALUE
+    
+    return not_
+
+def compile_concat(record, slow):
+    """
+    Compiles the CONCAT instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def concat():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or value1[0] != STRING or value2[0] != STRING
+            or dest_frames[dest_role][dest] is None):
+            return slow()
+        dest_frames[dest_role][dest] = (STRING, concat_strings(value1[1], value2[1]))
+    
+    return concat
+
+def compile_strlen(record, slow):
+    """
+    Compiles the STRLEN instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames, role, key = bind_symbol(record[3], record[4])
+    
+    def strlen():
+        value = frames[role][key]
+        if value is None or value[0] != STRING or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = (INT, len(value[1]))
+    
+    return strlen
+
+def compile_int2char(record, slow):
+    """
+    Compiles the INT2CHAR instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames, role, key = bind_symbol(record[3], record[4])
+    
+    def int2char():
+        value = frames[role][key]
+        if value is None or value[0] != INT or not 0 <= value[1] <= 0x10FFFF or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = (STRING, chr(value[1]))
+    
+    return int2char
+
+def compile_stri2int(record, slow):
+    """
+    Compiles the STRI2INT instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def stri2int():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or value1[0] != STRING or value2[0] != INT
+            or not 0 <= value2[1] < len(value1[1]) or dest_frames[dest_role][dest] is None):
+            return slow()
+        dest_frames[dest_role][dest] = (INT, ord(value1[1][value2[1]]))
+    
+    return stri2int
+
+def compile_getchar(record, slow):
+    """
+    Compiles the GETCHAR instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def getchar():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or value1[0] != STRING or value2[0] != INT
+            or not 0 <= value2[1] < len(value1[1]) or dest_frames[dest_role][dest] is None):
+            return slow()
+        dest_frames[dest_role][dest] = (STRING, value1[1][value2[1]])
+    
+    return getchar
+
+def compile_setchar(record, slow):
+    """
+    Compiles the SETCHAR instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def setchar():
+        var = dest_frames[dest_role][dest]
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (var is None or value1 is None or value2 is None or var[0] != STRING or value1[0] != INT
+            or value2[0] != STRING or not 0 <= value1[1] < len(var[1]) or value2[1] == ""):
+            return slow()
+        dest_frames[dest_role][dest] = (STRING, set_char(var[1], value1[1], value2[1][0]))
+    
+    return setchar
+
+def compile_type(record, slow):
+    """
+    Compiles the TYPE instruction with a variable operand, see compile_instruction.
+    """
+    if record[1] != "var" or record[3] != "var":
+        return None
+    dest_frames, dest_role, dest = bind_var(record[2])
+    frames, role, key = bind_var(record[4])
+    
+    def type_():
+        value = frames[role][key]
+        if value is None or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = (STRING, TYPE_NAMES[value[0]])
+    
+    return type_
+
+def literal_text(typ, value):
+    """
+    Formats a literal operand of the WRITE instruction.
+
+    Parameters
+    ----------
+    typ : {"int", "nil", "bool", "string", "float"}
+        The type of the operand.
+    value : int, string, bool, float, None
+        The value of the operand.
+    
+    Return
+    -------
+    string
+        The written text.
+    """
+    if typ == "bool":
+        return "true" if value else "false"
+    elif typ == "float":
+        return float.hex(value)
+    elif typ == "nil":
+        return ""
+    
+    return str(value)
+
+def compile_write(record, slow):
+    """
+    Compiles the WRITE instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        if record[1] == "label" or record[1] == "type":
+            return None
+        text = literal_text(record[1], record[2])
+        output_write = OUTPUT.write
+    
+        def write_literal():
+            output_write(text)
+    
+        return write_literal
+    
+    frames, role, key = bind_var(record[2])
+    output_write = OUTPUT.write
+    
+    def write():
+        value = frames[role][key]
+        if value is None:
+            return slow()
+        typ = value[0]
+        if typ == STRING:
+            output_write(str(value[1]))
+        elif typ == INT:
+            output_write(str(value[1]))
+        elif typ == BOOL:
+            output_write("true" if value[1] else "false")
+        elif typ == FLOAT:
+            output_write(float.hex(value[1]))
+        elif typ != NIL:
+            return slow()
+    
+    return write
+
+def compile_pushs(record, slow):
+    """
+    Compiles the PUSHS instruction, see compile_instruction.
+    """
+    data_stack = PROGRAM.data_stack
+    if record[1] != "var":
+        value = literal_value(record[1], record[2])
+    
+        def pushs_literal():
+            data_stack.append(value)
+    
+        return pushs_literal
+    
+    frames, role, key = bind_var(record[2])
+    
+    def pushs():
+        value = frames[role][key]
+        if value is None or value is UNDEFINED:
+            return slow()
+        data_stack.append(value)
+    
+    return pushs
+
+def compile_pops(record, slow):
+    """
+    Compiles the POPS instruction, see compile_instruction.
+    """
+    if record[1] != "var":
+        return None
+    data_stack = PROGRAM.data_stack
+    dest_frames, dest_role, dest = bind_var(record[2])
+    
+    def pops():
+        if not data_stack or dest_frames[dest_role][dest] is None:
+            return slow()
+        dest_frames[dest_role][dest] = data_stack.pop()
+    
+    return pops
+
+def compile_jump(record, slow):
+    """
+    Compiles the JUMP instruction, see compile_instruction.
+    """
+    if record[1] != "label":
+        return None
+    target = record[3]
+    
+    def jump():
+        return target
+    
+    return jump
+
+def compile_conditional_jump(record, slow, equal):
+    """
+    Compiles the JUMPIFEQ and JUMPIFNEQ instructions, see compile_instruction.
+    """
+    if record[1] != "label" or record[3] in ("label", "type") or record[5] in ("label", "type"):
+        return None
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    target = record[7]
+    
+    def conditional_jump():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None or value1[0] != value2[0] or value1[0] == UNSET:
+            return slow()
+        if (value1[1] == value2[1]) == equal:
+            return target
+    
+    return conditional_jump
+
+def compile_call(record, slow):
+    """
+    Compiles the CALL instruction, see compile_instruction.
+    """
+    if record[1] != "label":
+        return None
+    return_stack = PROGRAM.return_stack
+    target = record[3]
+    next_index = record[4]
+    
+    def call():
+        return_stack.append(next_index)
+        return target
+    
+    return call
+
+def compile_return(record, slow):
+    """
+    Compiles the RETURN instruction, see compile_instruction.
+    """
+    return_stack = PROGRAM.return_stack
+    
+    def return_():
+        if not return_stack:
+            return slow()
+        return return_stack.pop()
+    
+    return return_
+
+def compile_exit(record, slow):
+    """
+    Compiles the EXIT instruction with a literal operand, see compile_instruction.
+    """
+    if record[1] != "int" or not 0 <= record[2] < 50:
+        return None
+    value = record[2]
+    
+    def exit_():
+        exit(value)
+    
+    return exit_
+
+COMPILERS = {"LABEL": compile_label, "MOVE": compile_move,
+             "ADD": lambda record, slow: compile_arithmetic(record, slow, operator.add),
+             "SUB": lambda record, slow: compile_arithmetic(record, slow, operator.sub),
+             "MUL": lambda record, slow: compile_arithmetic(record, slow, operator.mul),
+             "IDIV": compile_idiv, "EQ": compile_eq,
+             "LT": lambda record, slow: compile_relation(record, slow, operator.lt),
+             "GT": lambda record, slow: compile_relation(record, slow, operator.gt),
+             "AND": lambda record, slow: compile_logic(record, slow, operator.and_),
+             "OR": lambda record, slow: compile_logic(record, slow, operator.or_),
+             "NOT": compile_not, "CONCAT": compile_concat, "STRLEN": compile_strlen, "INT2CHAR": compile_int2char,
+             "STRI2INT": compile_stri2int, "GETCHAR": compile_getchar, "SETCHAR": compile_setchar,
+             "TYPE": compile_type, "WRITE": compile_write, "PUSHS": compile_pushs, "POPS": compile_pops,
+             "JUMP": compile_jump, "JUMPIFEQ": lambda record, slow: compile_conditional_jump(record, slow, True),
+             "JUMPIFNEQ": lambda record, slow: compile_conditional_jump(record, slow, False),
+             "CALL": compile_call, "RETURN": compile_return, "EXIT": compile_exit} # compilers of specialized closures
+
+def infer_types(records):
+    """
+    Infers the types of global variables and of the top of the data stack before each instruction by a flow 
+    sensitive analysis of the control flow graph, which follows the jumps and the fall through. A call is followed to 
+    its label and each return to every instruction following a call, so the state at a return point holds only what 
+    all the functions agree on. A type is known only when it is the same on all paths, a variable that is defined on 
+    all paths, but with different types, is DEFINED and the missing variables are not known to be defined at all. 
+    Local and temporary variables move between frames and are never inferred.
+    
+    Parameters
+    ----------
+    records : list
+        The list of instruction records, see decode_instruction.
+    
+    Return
+    -------
+    list
+        The inferred types before each instruction {name: tag, ..., STACK: (tag, ...)}, None when the instruction is 
+        unreachable.
+    """
+    returns = [index + 1 for index, record in enumerate(records) if record[0].__name__ == "CALL"]
+    states = [None] * len(records)
+    if records:
+        states[0] = {}
+    work = [0] if records else []
+    while work:
+        index = work.pop()
+        state = transfer_types(records[index], states[index])
+        for successor in instruction_successors(records[index], index, returns):
+            if successor == None or successor >= len(records):
+                continue
+            old = states[successor]
+            if old == None:
+                states[successor] = state
+            else:
+                merged = meet_types(old, state)
+                if merged == old:
+                    continue
+                states[successor] = merged
+            work.append(successor)
+    
+    return states
+
+def instruction_successors(record, index, returns):
+    """
+    Lists the indices of instructions, which can follow an instruction, see infer_types.
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction.
+    index : int
+        The index of the instruction.
+    returns : list
+        The indices of instructions following the calls.
+    
+    Return
+    -------
+    list
+        The indices of the following instructions, None for a target, which is not known.
+    """
+    opcode = record[0].__name__
+    if opcode == "JUMP" or opcode == "CALL":
+        return [record[3]]
+    elif opcode in ("JUMPIFEQ", "JUMPIFNEQ"):
+        return [index + 1, record[7]]
+    elif opcode in ("JUMPIFEQS", "JUMPIFNEQS"):
+        return [index + 1, record[3]]
+    elif opcode == "RETURN":
+        return returns
+    elif opcode == "EXIT":
+        return []
+    
+    return [index + 1]
+
+def transfer_types(record, state):
+    """
+    Infers the types after an instruction, the state before it is not modified.
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction.
+    state : dict
+        The inferred types before the instruction {name: tag, ..., STACK: (tag, ...)}.
+    
+    Return
+    -------
+    dict
+        The inferred types after the instruction.
+    """
+    opcode = record[0].__name__
+    typ = None
+    if opcode == "PUSHS":
+        typ = symbol_type(record[1], record[2], state)
+        return set_stack_types(state, state.get(STACK, ()) + (typ if typ in VALUE_TAGS else None,))
+    elif opcode == "CLEARS":
+        return set_stack_types(state, ())
+    elif opcode in STACK_RESULTS:
+        count, result = STACK_RESULTS[opcode]
+        stack = state.get(STACK, ())
+        operands = ((None,) * count + stack)[-count:]
+        if opcode == "POPS":
+            typ = operands[0]
+        elif opcode in ("ADDS", "SUBS", "MULS"):
+            result = operands[0] if operands[0] in (INT, FLOAT) else operands[1] if operands[1] in (INT, FLOAT) else None
+        state = set_stack_types(state, stack[:-count] if result == UNSET else stack[:-count] + (result,))
+    
+    if INST_OPERANDS[opcode][:1] != ("var",) or record[1] != "var" or record[2][:3] != "GF@":
+        return state
+    
+    if opcode == "MOVE":
+        typ = symbol_type(record[3], record[4], state)
+    elif opcode in ("ADD", "SUB", "MUL"):
+        typ = symbol_type(record[3], record[4], state)
+        if typ != INT and typ != FLOAT:
+            typ = symbol_type(record[5], record[6], state)
+        if typ != INT and typ != FLOAT:
+            typ = None
+    elif opcode != "POPS":
+        typ = RESULT_TYPES.get(opcode)
+    
+    state = state.copy()
+    if typ == None or typ == UNSET and opcode != "DEFVAR":
+        state.pop(record[2], None)
+    else:
+        state[record[2]] = typ
+    
+    return state
+
+def set_stack_types(state, stack):
+    """
+    Replaces the inferred types of the top of the data stack, the state is not modified.
+    
+    Parameters
+    ----------
+    state : dict
+        The inferred types {name: tag, ..., STACK: (tag, ...)}.
+    stack : tuple
+        The tags of the values on the top of the data stack, None for a value of an unknown type.
+    
+    Return
+    -------
+    dict
+        The inferred types with the replaced stack.
+    """
+    state = state.copy()
+    if stack:
+        state[STACK] = stack
+    else:
+        state.pop(STACK, None)
+    
+    return state
+
+def meet_types(state1, state2):
+    """
+    Joins the types inferred on two paths to the same instruction. The types of the top of the data stack are joined
+    from the top to the depth known on both paths.
+    
+    Return
+    -------
+    dict
+        The types, which hold on both paths {name: tag, ..., STACK: (tag, ...)}.
+    """
+    state = {}
+    for name, typ in state1.items():
+        other = state2.get(name)
+        if name == STACK or other == None:
+            continue
+        state[name] = typ if other == typ else DEFINED
+    
+    stack1 = state1.get(STACK, ())
+    stack2 = state2.get(STACK, ())
+    depth = min(len(stack1), len(stack2))
+    if depth:
+        state[STACK] = tuple(typ if typ == other else None 
+                             for typ, other in zip(stack1[len(stack1) - depth:], stack2[len(stack2) - depth:]))
+    
+    return state
+
+def symbol_type(typ, value, types):
+    """
+    Looks up the inferred type of a symbol operand.
+    
+    Parameters
+    ----------
+    typ : string
+        The type of the operand.
+    value : int, string, bool, float, None
+        The value of the operand.
+    types : dict
+        The inferred types of global variables {name: tag, ...}.
+    
+    Return
+    -------
+    int, None
+        The tag of the type, DEFINED or None, when it is not known.
+    """
+    if typ != "var":
+        return TYPE_TAGS[typ]
+    elif value[:3] == "GF@":
+        return types.get(value)
+    
+    return None
+
+def compile_unchecked(record, types):
+    """
+    Compiles an instruction, which operands have types proven by infer_types, to a closure without any type checks, 
+    see UNCHECKED_COMPILERS. Only instructions with global or literal operands are compiled this way.
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction, see decode_instruction.
+    types : dict, None
+        The inferred types before the instruction, None when it is unreachable.
+    
+    Return
+    -------
+    closure : function
+        The compiled instruction, see compile_instruction.
+    checks : int
+        The number of left out type checks.
+    """
+    if types == None:
+        return None
+    compiler = UNCHECKED_COMPILERS.get(record[0].__name__)
+    if compiler == None:
+        return None
+    
+    return compiler(record, types)
+
+def defined_dest(record, types):
+    """
+    Checks, whether the destination of an instruction is a global variable, which is proven to be defined.
+    """
+    return record[1] == "var" and record[2][:3] == "GF@" and record[2] in types
+
+def unchecked_move(record, types):
+    """
+    Compiles the MOVE instruction without type checks, see compile_unchecked.
+    """
+    if not defined_dest(record, types) or symbol_type(record[3], record[4], types) not in VALUE_TAGS:
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frames, role, key = bind_symbol(record[3], record[4])
+    
+    def move_unchecked():
+        global_frame[dest] = frames[role][key]
+    
+    return move_unchecked, 2
+
+def unchecked_arithmetic(record, types, operation):
+    """
+    Compiles the ADD, SUB and MUL instructions without type checks, see compile_unchecked.
+    """
+    typ = symbol_type(record[3], record[4], types)
+    if not defined_dest(record, types) or typ not in (INT, FLOAT) or symbol_type(record[5], record[6], types) != typ:
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def arithmetic_unchecked():
+        global_frame[dest] = (typ, operation(frames1[role1][key1][1], frames2[role2][key2][1]))
+    
+    return arithmetic_unchecked, 3
+
+def unchecked_relation(record, types, operation):
+    """
+    Compiles the LT and GT instructions without type checks, see compile_unchecked.
+    """
+    typ = symbol_type(record[3], record[4], types)
+    if (not defined_dest(record, types) or typ not in (BOOL, INT, FLOAT, STRING) 
+        or symbol_type(record[5], record[6], types) != typ):
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def relation_unchecked():
+        global_frame[dest] = TRUE_VALUE if operation(frames1[role1][key1][1], frames2[role2][key2][1]) else FALSE_VALUE
+    
+    return relation_unchecked, 3
+
+def unchecked_eq(record, types):
+    """
+    Compiles the EQ instruction without type checks, see compile_unchecked.
+    """
+    if (not defined_dest(record, types) or (symbol_type(record[3], record[4], types), 
+                                            symbol_type(record[5], record[6], types)) not in EQUAL_TYPES):
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def eq_unchecked():
+        global_frame[dest] = TRUE_VALUE if frames1[role1][key1][1] == frames2[role2][key2][1] else FALSE_VALUE
+    
+    return eq_unchecked, 3
+
+def unchecked_concat(record, types):
+    """
+    Compiles the CONCAT instruction without type checks, see compile_unchecked.
+    """
+    if (not defined_dest(record, types) or symbol_type(record[3], record[4], types) != STRING 
+        or symbol_type(record[5], record[6], types) != STRING):
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    
+    def concat_unchecked():
+        global_frame[dest] = (STRING, concat_strings(frames1[role1][key1][1], frames2[role2][key2][1]))
+    
+    return concat_unchecked, 3
+
+def unchecked_write(record, types):
+    """
+    Compiles the WRITE instruction with a global variable operand without type checks, see compile_unchecked.
+    """
+    typ = symbol_type(record[1], record[2], types)
+    if record[1] != "var" or typ not in VALUE_TAGS:
+        return None
+    frames, role, key = bind_symbol(record[1], record[2])
+    output_write = OUTPUT.write
+    
+    def write_unchecked():
+        output_write(str(frames[role][key][1]))
+    
+    def write_int_unchecked():
+        output_write(str(frames[role][key][1]))
+    
+    def write_bool_unchecked():
+        output_write("true" if frames[role][key][1] else "false")
+    
+    def write_float_unchecked():
+        output_write(float.hex(frames[role][key][1]))
+    
+    closures = {NIL: skip, BOOL: write_bool_unchecked, INT: write_int_unchecked, FLOAT: write_float_unchecked, 
+                STRING: write_unchecked}
+    return closures[typ], 1
+
+def unchecked_pushs(record, types):
+    """
+    Compiles the PUSHS instruction with a global variable operand without type checks, see compile_unchecked.
+    """
+    if record[1] != "var" or symbol_type(record[1], record[2], types) not in VALUE_TAGS:
+        return None
+    data_stack = PROGRAM.data_stack
+    frames, role, key = bind_symbol(record[1], record[2])
+    
+    def pushs_unchecked():
+        data_stack.append(frames[role][key])
+    
+    return pushs_unchecked, 1
+
+def unchecked_conditional_jump(record, types, equal):
+    """
+    Compiles the JUMPIFEQ and JUMPIFNEQ instructions without type checks, see compile_unchecked.
+    """
+    if (record[1] != "label" or record[7] == None or (symbol_type(record[3], record[4], types), 
+                                                      symbol_type(record[5], record[6], types)) not in EQUAL_TYPES):
+        return None
+    frames1, role1, key1 = bind_symbol(record[3], record[4])
+    frames2, role2, key2 = bind_symbol(record[5], record[6])
+    target = record[7]
+    
+    def conditional_jump_unchecked():
+        if (frames1[role1][key1][1] == frames2[role2][key2][1]) == equal:
+            return target
+    
+    return conditional_jump_unchecked, 2
+
+def unchecked_stack_arithmetic(record, types, operation):
+    """
+    Compiles the ADDS, SUBS and MULS instructions without type checks, see compile_unchecked.
+    """
+    stack = types.get(STACK, ())
+    if len(stack) < 2 or stack[-1] not in (INT, FLOAT) or stack[-2] != stack[-1]:
+        return None
+    data_stack = PROGRAM.data_stack
+    typ = stack[-1]
+    
+    def stack_arithmetic_unchecked():
+        value2 = data_stack.pop()
+        data_stack[-1] = (typ, operation(data_stack[-1][1], value2[1]))
+    
+    return stack_arithmetic_unchecked, 3
+
+def unchecked_stack_relation(record, types, operation):
+    """
+    Compiles the LTS and GTS instructions without type checks, see compile_unchecked.
+    """
+    stack = types.get(STACK, ())
+    if len(stack) < 2 or stack[-1] not in (BOOL, INT, FLOAT, STRING) or stack[-2] != stack[-1]:
+        return None
+    data_stack = PROGRAM.data_stack
+    
+    def stack_relation_unchecked():
+        value2 = data_stack.pop()
+        data_stack[-1] = TRUE_VALUE if operation(data_stack[-1][1], value2[1]) else FALSE_VALUE
+    
+    return stack_relation_unchecked, 3
+
+def unchecked_stack_eq(record, types):
+    """
+    Compiles the EQS instruction without type checks, see compile_unchecked.
+    """
+    stack = types.get(STACK, ())
+    if len(stack) < 2 or (stack[-2], stack[-1]) not in EQUAL_TYPES:
+        return None
+    data_stack = PROGRAM.data_stack
+    
+    def stack_eq_unchecked():
+        value2 = data_stack.pop()
+        data_stack[-1] = TRUE_VALUE if data_stack[-1][1] == value2[1] else FALSE_VALUE
+    
+    return stack_eq_unchecked, 3
+
+def unchecked_pops(record, types):
+    """
+    Compiles the POPS instruction without checks of the stack depth and of the variable, see compile_unchecked.
+    """
+    if not defined_dest(record, types) or STACK not in types:
+        return None
+    global_frame = FRAMES.global_frame
+    data_stack = PROGRAM.data_stack
+    dest = var_slot(record[2])
+    
+    def pops_unchecked():
+        global_frame[dest] = data_stack.pop()
+    
+    return pops_unchecked, 2
+
+def unchecked_stack_jump(record, types, equal):
+    """
+    Compiles the JUMPIFEQS and JUMPIFNEQS instructions without type checks, see compile_unchecked.
+    """
+    stack = types.get(STACK, ())
+    if record[1] != "label" or record[3] == None or len(stack) < 2 or (stack[-2], stack[-1]) not in EQUAL_TYPES:
+        return None
+    data_stack = PROGRAM.data_stack
+    target = record[3]
+    
+    def stack_jump_unchecked():
+        value2 = data_stack.pop()
+        if (data_stack.pop()[1] == value2[1]) == equal:
+            return target
+    
+    return stack_jump_unchecked, 3
+
+UNCHECKED_COMPILERS = {"MOVE": unchecked_move,
+                       "ADD": lambda record, types: unchecked_arithmetic(record, types, operator.add),
+                       "SUB": lambda record, types: unchecked_arithmetic(record, types, operator.sub),
+                       "MUL": lambda record, types: unchecked_arithmetic(record, types, operator.mul),
+                       "LT": lambda record, types: unchecked_relation(record, types, operator.lt),
+                       "GT": lambda record, types: unchecked_relation(record, types, operator.gt),
+                       "EQ": unchecked_eq, "CONCAT": unchecked_concat, "WRITE": unchecked_write, 
+                       "PUSHS": unchecked_pushs,
+                       "JUMPIFEQ": lambda record, types: unchecked_conditional_jump(record, types, True),
+                       "JUMPIFNEQ": lambda record, types: unchecked_conditional_jump(record, types, False),
+                       "ADDS": lambda record, types: unchecked_stack_arithmetic(record, types, operator.add),
+                       "SUBS": lambda record, types: unchecked_stack_arithmetic(record, types, operator.sub),
+                       "MULS": lambda record, types: unchecked_stack_arithmetic(record, types, operator.mul),
+                       "LTS": lambda record, types: unchecked_stack_relation(record, types, operator.lt),
+                       "GTS": lambda record, types: unchecked_stack_relation(record, types, operator.gt),
+                       "EQS": unchecked_stack_eq, "POPS": unchecked_pops,
+                       "JUMPIFEQS": lambda record, types: unchecked_stack_jump(record, types, True),
+                       "JUMPIFNEQS": lambda record, types: unchecked_stack_jump(record, types, False)
+                      } # compilers of closures without type checks
+RESULT_TYPES = {"DEFVAR": UNSET, "IDIV": INT, "DIV": FLOAT, "LT": BOOL, "GT": BOOL, "EQ": BOOL, "AND": BOOL, 
+                "OR": BOOL, "NOT": BOOL, "INT2CHAR": STRING, "STRI2INT": INT, "CONCAT": STRING, "GETCHAR": STRING,
+                "SETCHAR": STRING, "TYPE": STRING, "STRLEN": INT, "INT2FLOAT": FLOAT, 
+                "FLOAT2INT": INT}   # types of the results of instructions, which do not depend on the operands
+STACK_RESULTS = {"POPS": (1, UNSET), "ADDS": (2, None), "SUBS": (2, None), "MULS": (2, None), "IDIVS": (2, INT), 
+                 "DIVS": (2, FLOAT), "LTS": (2, BOOL), "GTS": (2, BOOL), "EQS": (2, BOOL), "ANDS": (2, BOOL), 
+                 "ORS": (2, BOOL), "NOTS": (1, BOOL), "INT2CHARS": (1, STRING), "STRI2INTS": (2, INT), 
+                 "INT2FLOATS": (1, FLOAT), "FLOAT2INTS": (1, INT), "JUMPIFEQS": (2, UNSET), 
+                 "JUMPIFNEQS": (2, UNSET)}  # numbers of values popped by stack instructions and the types of their 
+                                            # results, UNSET when nothing is pushed
+
+def compile_quickening(record, checked, program, index):
+    """
+    Compiles an instruction to a quickening stub, which rewrites the instruction in place, when it is executed for the
+    first time. The instruction is specialized on the types of the operands seen by the stub, see QUICKENERS, and its 
+    guard rewrites it to the checked closure, once other types are seen. Only instructions with global or literal 
+    operands are quickened, as they are bound directly to their frames and global variables cannot become undefined. 
+    The first operand must be of the type of the opcode, a variable or a label, otherwise the checked closure is kept 
+    and it ends by the error of the operand type. 
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction, see decode_instruction.
+    checked : function
+        The compiled instruction with all checks, see compile_instruction.
+    program : list
+        The list of compiled instructions, which is rewritten.
+    index : int
+        The index of the instruction.
+    
+    Return
+    -------
+    function
+        The quickening stub or the checked instruction, when it cannot be quickened.
+    """
+    opcode = record[0].__name__
+    quickener = QUICKENERS.get(opcode)
+    if (quickener == None or record[1] != INST_OPERANDS[opcode][0] or record[1] == "var" and record[2][:3] != "GF@"
+        or not direct_symbol(record[3], record[4]) or not direct_symbol(record[5], record[6])):
+        return checked
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2]) if record[1] == "var" else None
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    
+    def deoptimize():
+        program[index] = checked
+        return checked()
+    
+    def quicken():
+        if program[index] is quicken:   # the stub is also executed by superinstructions, which fall back
+            value1 = frame1[key1]
+            value2 = frame2[key2]
+            quickened = None
+            if value1 is not None and value2 is not None and (dest == None or global_frame[dest] is not None):
+                quickened = quickener(record, deoptimize, value1[0], value2[0])
+            program[index] = quickened or checked
+        return checked()
+    
+    return quicken
+
+def direct_symbol(typ, value):
+    """
+    Checks, whether a symbol operand is a literal or a global variable, see bind_direct.
+    """
+    return typ != "var" or value[:3] == "GF@"
+
+def bind_direct(typ, value):
+    """
+    Binds a global variable directly to the global frame and a literal to a frame of its own.
+    
+    Parameters
+    ----------
+    typ : string
+        The type of the operand.
+    value : int, string, bool, float, None
+        The value of the operand.
+    
+    Return
+    -------
+    frame : list
+        The frame holding the operand.
+    key : int
+        The slot of the operand in the frame.
+    """
+    if typ == "var":
+        return FRAMES.global_frame, var_slot(value)
+    
+    return [literal_value(typ, value)], 0
+
+def quicken_arithmetic(record, deoptimize, typ1, typ2, operation):
+    """
+    Specializes the ADD, SUB and MUL instructions on the types of their operands, see compile_quickening.
+    
+    Parameters
+    ----------
+    record : list
+        The record of the instruction.
+    deoptimize : function
+        Rewrites the instruction to its checked closure and executes it.
+    typ1 : int
+        The tag of the first operand.
+    typ2 : int
+        The tag of the second operand.
+    
+    Return
+    -------
+    function
+        The specialized instruction, None when the types cannot be specialized on.
+    """
+    if typ1 != typ2 or (typ1 != INT and typ1 != FLOAT):
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    
+    def arithmetic_quickened():
+        value1 = frame1[key1]
+        value2 = frame2[key2]
+        if value1[0] != typ1 or value2[0] != typ1:
+            return deoptimize()
+        global_frame[dest] = (typ1, operation(value1[1], value2[1]))
+    
+    return arithmetic_quickened
+
+def quicken_relation(record, deoptimize, typ1, typ2, operation):
+    """
+    Specializes the LT and GT instructions on the types of their operands, see quicken_arithmetic.
+    """
+    if typ1 != typ2 or typ1 not in (BOOL, INT, FLOAT, STRING):
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    
+    def relation_quickened():
+        value1 = frame1[key1]
+        value2 = frame2[key2]
+        if value1[0] != typ1 or value2[0] != typ1:
+            return deoptimize()
+        global_frame[dest] = TRUE_VALUE if operation(value1[1], value2[1]) else FALSE_VALUE
+    
+    return relation_quickened
+
+def quicken_eq(record, deoptimize, typ1, typ2):
+    """
+    Specializes the EQ instruction on the types of its operands, see quicken_arithmetic.
+    """
+    if (typ1, typ2) not in EQUAL_TYPES:
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    
+    def eq_quickened():
+        value1 = frame1[key1]
+        value2 = frame2[key2]
+        if value1[0] != typ1 or value2[0] != typ2:
+            return deoptimize()
+        global_frame[dest] = TRUE_VALUE if value1[1] == value2[1] else FALSE_VALUE
+    
+    return eq_quickened
+
+def quicken_concat(record, deoptimize, typ1, typ2):
+    """
+    Specializes the CONCAT instruction on string operands, see quicken_arithmetic.
+    """
+    if typ1 != STRING or typ2 != STRING:
+        return None
+    global_frame = FRAMES.global_frame
+    dest = var_slot(record[2])
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    
+    def concat_quickened():
+        value1 = frame1[key1]
+        value2 = frame2[key2]
+        if value1[0] != STRING or value2[0] != STRING:
+            return deoptimize()
+        global_frame[dest] = (STRING, concat_strings(value1[1], value2[1]))
+    
+    return concat_quickened
+
+def quicken_conditional_jump(record, deoptimize, typ1, typ2, equal):
+    """
+    Specializes the JUMPIFEQ and JUMPIFNEQ instructions on the types of their operands, see quicken_arithmetic.
+    """
+    if (typ1, typ2) not in EQUAL_TYPES or record[7] == None:
+        return None
+    frame1, key1 = bind_direct(record[3], record[4])
+    frame2, key2 = bind_direct(record[5], record[6])
+    target = record[7]
+    
+    def conditional_jump_quickened():
+        value1 = frame1[key1]
+        value2 = frame2[key2]
+        if value1[0] != typ1 or value2[0] != typ2:
+            return deoptimize()
+        if (value1[1] == value2[1]) == equal:
+            return target
+    
+    return conditional_jump_quickened
+
+QUICKENERS = {"ADD": lambda record, deoptimize, typ1, typ2: 
+                  quicken_arithmetic(record, deoptimize, typ1, typ2, operator.add),
+              "SUB": lambda record, deoptimize, typ1, typ2: 
+                  quicken_arithmetic(record, deoptimize, typ1, typ2, operator.sub),
+              "MUL": lambda record, deoptimize, typ1, typ2: 
+                  quicken_arithmetic(record, deoptimize, typ1, typ2, operator.mul),
+              "LT": lambda record, deoptimize, typ1, typ2: 
+                  quicken_relation(record, deoptimize, typ1, typ2, operator.lt),
+              "GT": lambda record, deoptimize, typ1, typ2: 
+                  quicken_relation(record, deoptimize, typ1, typ2, operator.gt),
+              "EQ": quicken_eq, "CONCAT": quicken_concat,
+              "JUMPIFEQ": lambda record, deoptimize, typ1, typ2: 
+                  quicken_conditional_jump(record, deoptimize, typ1, typ2, True),
+              "JUMPIFNEQ": lambda record, deoptimize, typ1, typ2: 
+                  quicken_conditional_jump(record, deoptimize, typ1, typ2, False)
+             } # specializers of instructions on the types of their operands
+
+def fuse_program(records, program):
+    """
+    Fuses common sequences of instructions to superinstructions, see FUSERS. The superinstruction replaces the first
+    instruction of its sequence and returns the index of the instruction following the sequence. The rest of the
+    sequence stays compiled, so the execution can still start in its middle, while no jump can target it, as the
+    sequences contain neither labels nor calls. The fused sequences are counted in PROGRAM.superinstructions.
+    
+    Parameters
+    ----------
+    records : list
+        The list of instruction records, see decode_instruction.
+    program : list
+        The list of compiled instructions, which is fused in place.
+    
+    Return
+    -------
+    set
+        The indices of the fused instructions.
+    """
+    fused = set()
+    index = 0
+    while index < len(records):
+        fuser = FUSERS.get(records[index][0].__name__)
+        match = None if fuser == None else fuser(records, program, index)
+        if match != None:
+            pattern, program[index], length = match
+            PROGRAM.superinstructions[pattern] = PROGRAM.superinstructions.get(pattern, 0) + 1
+            fused.update(range(index, index + length))
+            index += length
         else:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-    else:
-        if text == None:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
-        if re.match(regexes[typ], text) == None:
-            os._exit(Error.XML_STRUCTURE_ERR.value)
+            index += 1
     
-    return text
+    return fused
 
-def assign_var_value(var, typ, value):
+def execute_steps(steps, start, end):
     """
-    Assigns a variable with a given value. Terminates with an error if the variable does not exist (54) or 
-    when the assigned frame does not exist (55).
-
+    Executes the compiled instructions of a fused sequence one by one, when the superinstruction cannot handle its
+    operands. The instructions preceding the failing one have not had any side effect yet, so each error is raised by
+    the same instruction as without the fusion.
+    
     Parameters
     ----------
-    var: string
-        The variable name
-    typ: {"int", "nil", "bool", "string"}
-        The type of the assigned variable
-    value: int, string, bool, None
-        The value to be assigned
+    steps : list
+        The compiled instructions of the sequence.
+    start : int
+        The position of the first executed instruction in the sequence.
+    end : int
+        The index of the instruction following the sequence.
+    
+    Return
+    -------
+    int
+        The index of the next instruction.
     """
-    global FRAMES
-    if var[:2] == "GF" and var in FRAMES.global_frame:
-        FRAMES.global_frame[var] = [typ, value]
-        return
-    elif var[:2] == "LF" and var in FRAMES.current_frame:
-        FRAMES.current_frame[var] = [typ, value]
-        return
-    elif var[:2] == "TF" and var in FRAMES.temporary_frame:
-        FRAMES.temporary_frame[var] = [typ, value]
-        return
-
-    if (not FRAMES.TF and var[:2] == "TF") or (not FRAMES.LF and var[:2] == "LF"):
-        os._exit(Error.FRAME_ERR.value)
-    else:
-        os._exit(Error.VAR_EXIST_ERR.value)
+    for step in steps[start:]:
+        target = step()
+        if target is not None:
+            return target
+    
+    return end
 
-def get_var_type(var):
+def sequence_opcodes(records, index, length):
     """
-    Retrieves the type of a variable. Terminates with an error if the variable does not exist (54) or 
-    when the assigned frame does not exist (55).
+    Looks up the opcodes of a sequence of instructions.
+    
+    Return
+    -------
+    tuple
+        The opcodes of the instructions, the sequence is shorter than the length at the end of the program.
+    """
+    return tuple(record[0].__name__ for record in records[index:index + length])
 
+def fuse_stack_operation(records, program, index):
+    """
+    Fuses PUSHS a; PUSHS b; <operation>; POPS x, where the operation is one of STACK_OPERATIONS, the result is assigned
+    to x directly and the data stack is left untouched.
+    
     Parameters
     ----------
-    var: string
-        The name of a variable, which type is to be retrieved.
+    records : list
+        The list of instruction records.
+    program : list
+        The list of compiled instructions.
+    index : int
+        The index of the first instruction of the sequence.
     
     Return
     -------
-    {"int", "nil", "bool", "string"}
+    pattern : string
+        The pattern of the fused sequence.
+    closure : function
+        The superinstruction.
+    length : int
+        The number of the fused instructions.
     """
-    global FRAMES
-    if var[:2] == "GF" and var in FRAMES.global_frame:
-        return FRAMES.global_frame[var][0]
-    elif var[:2] == "LF" and var in FRAMES.current_frame:
-        return FRAMES.current_frame[var][0]
-    elif var[:2] == "TF" and var in FRAMES.temporary_frame:
-        return FRAMES.temporary_frame[var][0]
-    
-    if var[:2] == "GF" or (var[:2] == "LF" and FRAMES.LF) or (var[:2] == "TF" and FRAMES.TF):
-        os._exit(Error.VAR_EXIST_ERR.value)
+    opcodes = sequence_opcodes(records, index, 4)
+    if (opcodes[:2] != ("PUSHS", "PUSHS") or opcodes[3:] != ("POPS",) or opcodes[2] not in STACK_OPERATIONS 
+        or records[index][1] in ("label", "type") or records[index + 1][1] in ("label", "type") 
+        or records[index + 3][1] != "var"):
+        return None
+    frames1, role1, key1 = bind_symbol(records[index][1], records[index][2])
+    frames2, role2, key2 = bind_symbol(records[index + 1][1], records[index + 1][2])
+    dest_frames, dest_role, dest = bind_var(records[index + 3][2])
+    kind, operation = STACK_OPERATIONS[opcodes[2]]
+    steps = program[index:index + 4]
+    end = index + 4
+    
+    def stack_arithmetic():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None:
+            return execute_steps(steps, 0, end)
+        typ = value1[0]
+        if typ != value2[0] or (typ != INT and typ != FLOAT) or dest_frames[dest_role][dest] is None:
+            return execute_steps(steps, 0, end)
+        dest_frames[dest_role][dest] = (typ, operation(value1[1], value2[1]))
+        return end
+    
+    def stack_relation():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None:
+            return execute_steps(steps, 0, end)
+        typ = value1[0]
+        if typ != value2[0] or typ == UNSET or typ == NIL or dest_frames[dest_role][dest] is None:
+            return execute_steps(steps, 0, end)
+        dest_frames[dest_role][dest] = TRUE_VALUE if operation(value1[1], value2[1]) else FALSE_VALUE
+        return end
+    
+    def stack_eq():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or (value1[0], value2[0]) not in EQUAL_TYPES 
+            or dest_frames[dest_role][dest] is None):
+            return execute_steps(steps, 0, end)
+        dest_frames[dest_role][dest] = TRUE_VALUE if value1[1] == value2[1] else FALSE_VALUE
+        return end
+    
+    closures = {"arithmetic": stack_arithmetic, "relation": stack_relation, "eq": stack_eq}
+    return " ".join(opcodes), closures[kind], 4
+
+def fuse_compare_jump(records, program, index):
+    """
+    Fuses LT, GT or EQ tmp a b; JUMPIFEQ or JUMPIFNEQ L tmp bool@b, the result is still assigned to tmp, but the jump
+    is decided without reading it back. See fuse_stack_operation for the parameters and the returned values.
+    """
+    opcodes = sequence_opcodes(records, index, 2)
+    if len(opcodes) != 2 or opcodes[0] not in ("LT", "GT", "EQ") or opcodes[1] not in ("JUMPIFEQ", "JUMPIFNEQ"):
+        return None
+    compare, jump = records[index], records[index + 1]
+    if (compare[1] != "var" or compare[3] in ("label", "type") or compare[5] in ("label", "type") 
+        or jump[1] != "label" or jump[7] == None):
+        return None
+    if jump[3] == "var" and jump[4] == compare[2] and jump[5] == "bool":
+        expected = jump[6]
+    elif jump[5] == "var" and jump[6] == compare[2] and jump[3] == "bool":
+        expected = jump[4]
     else:
-        os._exit(Error.FRAME_ERR.value)
+        return None
+    dest_frames, dest_role, dest = bind_var(compare[2])
+    frames1, role1, key1 = bind_symbol(compare[3], compare[4])
+    frames2, role2, key2 = bind_symbol(compare[5], compare[6])
+    operation = {"LT": operator.lt, "GT": operator.gt}.get(opcodes[0])
+    jumps_on = expected == (opcodes[1] == "JUMPIFEQ")   # the result, on which the jump is taken
+    target = jump[7]
+    steps = program[index:index + 2]
+    end = index + 2
+    
+    def relation_jump():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if value1 is None or value2 is None:
+            return execute_steps(steps, 0, end)
+        typ = value1[0]
+        if typ != value2[0] or typ == UNSET or typ == NIL or dest_frames[dest_role][dest] is None:
+            return execute_steps(steps, 0, end)
+        result = operation(value1[1], value2[1])
+        dest_frames[dest_role][dest] = TRUE_VALUE if result else FALSE_VALUE
+        return target if result == jumps_on else end
+    
+    def eq_jump():
+        value1 = frames1[role1][key1]
+        value2 = frames2[role2][key2]
+        if (value1 is None or value2 is None or (value1[0], value2[0]) not in EQUAL_TYPES 
+            or dest_frames[dest_role][dest] is None):
+            return execute_steps(steps, 0, end)
+        result = value1[1] == value2[1]
+        dest_frames[dest_role][dest] = TRUE_VALUE if result else FALSE_VALUE
+        return target if result == jumps_on else end
+    
+    return " ".join(opcodes), eq_jump if operation == None else relation_jump, 2
 
-def get_var_value(var):
+def fuse_defvar_moves(records, program, index):
     """
-    Retrieves the value of a given variable. Terminates with an error if the variable does not exist (54) or 
-    when the assigned frame does not exist (55).
+    Fuses a run of DEFVAR x; MOVE x symb pairs, each variable is defined directly with its initial value. See
+    fuse_stack_operation for the parameters and the returned values.
+    """
+    pairs = []
+    position = index
+    while (sequence_opcodes(records, position, 2) == ("DEFVAR", "MOVE") and records[position][1] == "var" 
+           and records[position + 1][1] == "var" and records[position + 1][2] == records[position][2]
+           and records[position + 1][3] not in ("label", "type")):
+        pairs.append(bind_var(records[position][2]) + bind_symbol(records[position + 1][3], records[position + 1][4]))
+        position += 2
+    if not pairs:
+        return None
+    no_frame = FRAMES.no_frame
+    steps = program[index:position]
+    end = position
+    
+    def defvar_moves():
+        start = 0
+        for dest_frames, dest_role, dest, frames, role, key in pairs:
+            frame = dest_frames[dest_role]
+            value = frames[role][key]
+            if frame is no_frame or frame[dest] is not None or value is None or value is UNDEFINED:
+                return execute_steps(steps, start, end)
+            frame[dest] = value
+            start += 2
+        return end
+    
+    return "DEFVAR MOVE", defvar_moves, end - index
+
+def fuse_writes(records, program, index):
+    """
+    Fuses a run of WRITE instructions with literal operands to a single write of their joined texts. See
+    fuse_stack_operation for the parameters and the returned values.
+    """
+    texts = []
+    position = index
+    while (position < len(records) and records[position][0].__name__ == "WRITE" 
+           and records[position][1] not in ("var", "label", "type")):
+        texts.append(literal_text(records[position][1], records[position][2]))
+        position += 1
+    if len(texts) < 2:
+        return None
+    text = "".join(texts)
+    output_write = OUTPUT.write
+    end = position
+    
+    def write_literals():
+        output_write(text)
+        return end
+    
+    return "WRITE WRITE", write_literals, end - index
 
+STACK_OPERATIONS = {"ADDS": ("arithmetic", operator.add), "SUBS": ("arithmetic", operator.sub),
+                    "MULS": ("arithmetic", operator.mul), "LTS": ("relation", operator.lt),
+                    "GTS": ("relation", operator.gt), "EQS": ("eq", None)}  # stack instructions, which can be fused
+FUSERS = {"PUSHS": fuse_stack_operation, "LT": fuse_compare_jump, "GT": fuse_compare_jump, "EQ": fuse_compare_jump,
+          "DEFVAR": fuse_defvar_moves, "WRITE": fuse_writes} # matchers of fused sequences by their first opcodes
+
+def write_report(path):
+    """
+    Writes the statistics of the load time optimizations. Terminates the execution with an error (12), when the file
+    cannot be written.
+    
     Parameters
     ----------
-    var: string
-        The name of a variable, which value is to be retrieved.
+    path : string
+        The path to the written file.
+    """
+    try:
+        with open(path, "w") as f:
+            for pattern, count in sorted(PROGRAM.superinstructions.items(), key=lambda item: (-item[1], item[0])):
+                f.write("superinstruction %s: %d\n" % (pattern, count))
+            f.write("type checks eliminated: %d in %d instructions\n" % (PROGRAM.eliminated_checks, PROGRAM.unchecked))
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
+
+def write_profile(path):
+    """
+    Ends the profiling and writes the profile of the executed program as JSON, the executed instructions by their 
+    indexes and the opcodes are both sorted by their cumulative time from the most expensive one. Terminates the 
+    execution with an error (12), when the file cannot be written.
     
-    Return
-    -------
-    [{"int", "nil", "bool", "string"}, <value based on the type>]
+    Parameters
+    ----------
+    path : string
+        The path to the written file.
     """
-    global FRAMES
-    if var[:2] == "GF" and var in FRAMES.global_frame:
-        if FRAMES.global_frame[var][0] == "":
-            os._exit(Error.MISSING_VALUE_ERR.value)
-        return FRAMES.global_frame[var]
-    elif var[:2] == "LF" and var in FRAMES.current_frame:
-        if FRAMES.current_frame[var][0] == "":
-            os._exit(Error.MISSING_VALUE_ERR.value)
-        return FRAMES.current_frame[var]
-    elif var[:2] == "TF" and var in FRAMES.temporary_frame:
-        if FRAMES.temporary_frame[var][0] == "":
-            os._exit(Error.MISSING_VALUE_ERR.value)
-        return FRAMES.temporary_frame[var]
-    
-    if var[:2] == "GF" or (var[:2] == "LF" and FRAMES.LF) or (var[:2] == "TF" and FRAMES.TF):
-        os._exit(Error.VAR_EXIST_ERR.value)
-    else:
-        os._exit(Error.FRAME_ERR.value)
+    global PROFILE
+    profile, PROFILE = PROFILE, None    # a failed write terminates, which must not write the profile again
+    instructions = []
+    opcodes = {}
+    for index, count in enumerate(profile.counts):
+        if count:
+            opcode = profile.opcodes[index]
+            instructions.append({"index": index, "opcode": opcode, "count": count, "time_ns": profile.times[index]})
+            total = opcodes.setdefault(opcode, {"opcode": opcode, "count": 0, "time_ns": 0})
+            total["count"] += count
+            total["time_ns"] += profile.times[index]
+    
+    report = {"executed": sum(profile.counts), "time_ns": sum(profile.times),
+              "opcodes": sorted(opcodes.values(), key=lambda item: (-item["time_ns"], -item["count"])),
+              "instructions": sorted(instructions, key=lambda item: (-item["time_ns"], -item["count"]))}
+    try:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+            f.write("\n")
+    except OSError:
+        terminate(Error.OUT_FILE_ERR.value)
 
-def get_values_math(operands):
+def translate_program(instructions):
     """
-    Retrieves the values of operands of a given instruction. Terminates with an error (57) if the operands are not of a type 
-    used in mathematical instructions or there is a type missmatch 
-
+    Translates the program ahead of time to Python functions. The program is split to basic blocks, which start at
+    the beginning of the program, after each jump target label, after each instruction, which can jump, and at the
+    instruction, where the execution continues. Python source code is generated for each block and all blocks are
+    compiled at once, so straight-line code runs as Python bytecode. As in compiled closures, see compile_instruction,
+    the generated code executes only the common case and leaves anything else to the generic handler.
+    
     Parameters
     ----------
-    operands: list
-        A list of operands in a specific format.
+    instructions : list
+        The list of decoded instructions.
     
     Return
     -------
-        List of the operand values with the first element being their data type.
+    list
+        The translated block starting at each index, None at indexes inside a block.
     """
-
-    if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    records = [decode_instruction(inst, index) for index, inst in enumerate(instructions)]
+    PROGRAM.counted = any(inst[0] == "BREAK" for inst in instructions)
+    namespace = {"GF": FRAMES.global_frame, "FR": FRAMES.frames,
+                 "DS": PROGRAM.data_stack, "RS": PROGRAM.return_stack, "PROGRAM": PROGRAM, "FRAMES": FRAMES,
+                 "EQUAL_TYPES": EQUAL_TYPES, "UNDEFINED": UNDEFINED, "TYPE_NAMES": TYPE_NAMES,
+                 "TRUE_VALUE": TRUE_VALUE, "FALSE_VALUE": FALSE_VALUE, "UNSET": UNSET, "NIL": NIL, "BOOL": BOOL,
+                 "INT": INT, "FLOAT": FLOAT, "STRING": STRING, "write": OUTPUT.write,
+                 "concat_strings": concat_strings, "set_char": set_char}
     
-    if operands[3] == "var":
-        value1 = get_var_value(operands[4])
-    else:
-        value1 = [operands[3], operands[4]]
+    leaders = {0, PROGRAM.IP, len(records)}
+    for index, record in enumerate(records):
+        opcode = record[0].__name__
+        if opcode in TARGET_OPCODES or opcode == "RETURN" or opcode == "EXIT":
+            leaders.add(index + 1)
+        if opcode in TARGET_OPCODES:
+            target = record[3] if opcode == "CALL" else record[-1]
+            if target != None:
+                leaders.add(target)
+    leaders = sorted(leaders)
     
-    if operands[5] == "var":
-        value2 = get_var_value(operands[6])
-    else:
-        value2 = [operands[5], operands[6]]
+    source = []
+    for start, end in zip(leaders, leaders[1:]):
+        block = []
+        for index in range(start, end):
+            if PROGRAM.counted:
+                block.append("    PROGRAM.IC += 1")
+            block.extend("    " + line for line in translate_instruction(records[index], index, namespace))
+            if records[index][0].__name__ in FRAME_OPCODES:
+                block.extend(["    LF = FR[1]", "    TF = FR[2]"])
+        # the local and temporary frames are kept in locals, they move only by the instructions reloading them
+        used = "".join(block)
+        source.append("def B%d():" % start)
+        source.extend("    %s = FR[%d]" % (frame, FRAME_ROLES[frame]) for frame in ("LF", "TF") if frame + "[" in used)
+        source.extend(block)
+        source.append("    return %d" % end)
     
-    if value1[0] != value2[0] or (value1[0] != "int" and value1[0] != "float"):
-        os._exit(Error.OPERAND_TYPE_ERR.value)
-       
-    return [value1[0], value1[1], value2[1]]
+    exec(compile("\n".join(source) + "\n", "<translated>", "exec"), namespace)
+    blocks = [None] * (len(records) + 1)
+    for start in leaders[:-1]:
+        blocks[start] = namespace["B%d" % start]
+    
+    return blocks
 
-def get_values_logic(operands, eq = False, typ = "var"):
+def translate_instruction(record, index, namespace):
     """
-    Retrieves the values of operands of a given instruction. Terminates with an error (57) if there is a type missmatch.
-
+    Translates a single instruction to Python source code. The generic handler of the instruction and literal
+    operands are stored to the namespace of the generated code.
+    
     Parameters
     ----------
-    operands: list
-        A list of operands in a specific format.
-    eq: bool
-        True when the instruction uses equality comparison
-    typ: string
-        The type of the first operand.
+    record : list
+        The record of the instruction, see decode_instruction.
+    index : int
+        The index of the instruction.
+    namespace : dict
+        The global namespace of the generated code.
+    
     Return
     -------
-        List of the operand values with the first element being their data type.
+    list
+        The lines of the generated code.
     """
-
-    if operands[1] != typ:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    slow = "S%d" % index
+    namespace[slow] = functools.partial(record[0], record)
+    translator = TRANSLATORS.get(record[0].__name__)
+    if translator != None:
+        lines = translator(record, index, namespace, slow)
+        if lines != None:
+            return lines
     
-    if operands[3] == "var":
-        value1 = get_var_value(operands[4])
-    elif operands[3] == "int" or operands[3] == "float" or operands[3] == "string" or operands[3] == "bool":
-        value1 = [operands[3], operands[4]]
-    elif operands[3] == "nil" and eq:
-        value1 = [operands[3], None]
-    else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if record[0].__name__ in TARGET_OPCODES or record[0].__name__ == "RETURN":
+        return ["target = %s()" % slow, "if target is not None:", "    return target"]
     
-    if operands[5] == "var":
-        value2 = get_var_value(operands[6])
-    elif operands[5] == "int" or operands[5] == "float" or operands[5] == "string" or operands[5] == "bool":
-        value2 = [operands[5], operands[6]]
-    elif operands[5] == "nil" and eq:
-        value2 = [operands[5], None]
-    else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    return ["%s()" % slow]
+
+def translate_var(var):
+    """
+    Translates a variable to the frame holding it and its slot.
     
-    if value1[0] != value2[0] and value1[0] != "nil" and value2[0] != "nil":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    Parameters
+    ----------
+    var : string
+        The name of the variable.
     
-    return [value1[1], value2[1]]
-
-def get_values_bool(operands):
+    Return
+    -------
+    frame : string
+        The name of the frame in the generated code.
+    key : int
+        The slot of the variable.
     """
-    Retrieves the values of operands of a given instruction. Terminates with an error (57) if any of the operands is not
-    of a boolean type.
+    return var[:2], var_slot(var)
 
+def translate_symbol(typ, value, index, position, namespace):
+    """
+    Translates a symbol operand to an expression, which evaluates to its [type, value] list or to None, when the
+    variable is not defined. Literals are stored to the namespace of the generated code.
+    
     Parameters
     ----------
-    operands: list
-        A list of operands in a specific format.
+    typ : string
+        The type of the operand.
+    value : int, string, bool, float, None
+        The value of the operand.
+    index : int
+        The index of the instruction.
+    position : int
+        The position of the operand in the instruction.
+    namespace : dict
+        The global namespace of the generated code.
+    
     Return
     -------
-        List of boolean values.
+    string
+        The expression.
     """
+    if typ == "var":
+        return "%s[%d]" % translate_var(value)
+    
+    name = "K%d_%d" % (index, position)
+    namespace[name] = literal_value(typ, value)
+    return name
 
-    if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+def translate_operands(record, index, namespace):
+    """
+    Translates the destination variable and the symbol operands of an instruction.
     
-    if operands[3] == "var":
-        value1 = get_var_value(operands[4])
-    else:
-        value1 = [operands[3], operands[4]]
+    Parameters
+    ----------
+    record : list
+        The record of the instruction, see decode_instruction.
+    index : int
+        The index of the instruction.
+    namespace : dict
+        The global namespace of the generated code.
     
-    if operands[5] == "var":
-        value2 = get_var_value(operands[6])
-    else:
-        value2 = [operands[5], operands[6]]
+    Return
+    -------
+    lines : list
+        The lines reading the symbols to the v1 and v2 locals.
+    frame : string
+        The frame of the destination.
+    key : int
+        The slot of the destination.
+    """
+    frame, key = translate_var(record[2])
+    lines = ["v1 = " + translate_symbol(record[3], record[4], index, 1, namespace)]
+    if len(record) > 5:
+        lines.append("v2 = " + translate_symbol(record[5], record[6], index, 2, namespace))
     
-    if value1[0] != value2[0] or value1[0] != "bool":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    return lines, frame, key
+
+def translate_assignment(record, index, namespace, slow, condition, value):
+    """
+    Translates an instruction assigning the destination variable, when the condition on the v1 and v2 locals holds.
+    The generic handler is called otherwise, see translate_instruction.
     
-    return [value1[1], value2[1]]
+    Parameters
+    ----------
+    condition : string
+        The condition on the v1 and v2 locals.
+    value : string
+        The expression of the assigned [type, value] list.
+    """
+    if record[1] != "var":
+        return None
+    lines, frame, key = translate_operands(record, index, namespace)
+    return lines + ["if %s and %s[%d] is not None:" % (condition, frame, key), "    %s[%s] = %s" % (frame, key, value),
+                    "else:", "    %s()" % slow]
 
-def get_stack_values_math():
-    global PROGRAM
-    if len(PROGRAM.data_stack) < 2:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+def translate_binary(condition, value, excluded = ("label", "type")):
+    """
+    Creates a translator of an instruction with a destination and two symbols.
     
-    val2 = PROGRAM.data_stack.pop()
-    val1 = PROGRAM.data_stack.pop()
-    if val1[0] != val2[0] or (val1[0] != "int" and val1[0] != "float"):
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    Parameters
+    ----------
+    condition : string
+        The condition on the v1 and v2 locals, under which the value is assigned.
+    value : string
+        The expression of the assigned [type, value] list.
+    excluded : tuple
+        Types of literals, which are left to the generic handler.
+    """
+    def translator(record, index, namespace, slow):
+        if record[3] in excluded or record[5] in excluded:
+            return None
+        return translate_assignment(record, index, namespace, slow,
+                                    "v1 is not None and v2 is not None and " + condition, value)
+    
+    return translator
 
-    return [val1[0], val1[1], val2[1]]
+def translate_unary(condition, value, excluded = ("label", "type")):
+    """
+    Creates a translator of an instruction with a destination and a symbol, see translate_binary.
+    """
+    def translator(record, index, namespace, slow):
+        if record[3] in excluded:
+            return None
+        return translate_assignment(record, index, namespace, slow, "v1 is not None and " + condition, value)
+    
+    return translator
 
-def get_satack_values_logic(eq = False):
-    global PROGRAM
-    if len(PROGRAM.data_stack) < 2:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+def translate_write(record, index, namespace, slow):
+    """
+    Translates the WRITE instruction, see translate_instruction.
+    """
+    if record[1] == "label" or record[1] == "type":
+        return None
+    elif record[1] != "var":
+        namespace["K%d_1" % index] = literal_text(record[1], record[2])
+        return ["write(K%d_1)" % index]
     
-    val2 = PROGRAM.data_stack.pop()
-    val1 = PROGRAM.data_stack.pop()
-    if eq:
-        if val1[0] != val2[0] and val1[0] != "nil" and val2[0] != "nil":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
-    else:
-        if val1[0] != val2[0] or val1[0] == "nil":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+    return ["v1 = %s[%d]" % translate_var(record[2]),
+            "if v1 is None or v1 is UNDEFINED:",
+            "    %s()" % slow,
+            "elif v1[0] == STRING:",
+            "    write(str(v1[1]))",
+            "elif v1[0] == INT:",
+            "    write(str(v1[1]))",
+            "elif v1[0] == BOOL:",
+            "    write('true' if v1[1] else 'false')",
+            "elif v1[0] == FLOAT:",
+            "    write(float.hex(v1[1]))"]
+
+def translate_pushs(record, index, namespace, slow):
+    """
+    Translates the PUSHS instruction, see translate_instruction.
+    """
+    if record[1] != "var":
+        namespace["K%d_1" % index] = literal_value(record[1], record[2])
+        return ["DS.append(K%d_1)" % index]
     
-    return [val1[1], val2[1]]
+    return ["v1 = %s[%d]" % translate_var(record[2]),
+            "if v1 is None or v1 is UNDEFINED:",
+            "    %s()" % slow,
+            "else:",
+            "    DS.append(v1)"]
 
-def get_satack_values_bool():
-    global PROGRAM
-    if len(PROGRAM.data_stack) < 2:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+def translate_pops(record, index, namespace, slow):
+    """
+    Translates the POPS instruction, see translate_instruction.
+    """
+    if record[1] != "var":
+        return None
+    frame, key = translate_var(record[2])
+    return ["if DS and %s[%d] is not None:" % (frame, key),
+            "    %s[%s] = DS.pop()" % (frame, key),
+            "else:",
+            "    %s()" % slow]
+
+def translate_setchar(record, index, namespace, slow):
+    """
+    Translates the SETCHAR instruction, see translate_instruction.
+    """
+    if record[1] != "var":
+        return None
+    lines, frame, key = translate_operands(record, index, namespace)
+    return lines + ["v0 = %s[%d]" % (frame, key),
+                    "if (v0 is not None and v1 is not None and v2 is not None and v0[0] == STRING and v1[0] == INT "
+                    "and v2[0] == STRING and 0 <= v1[1] < len(v0[1]) and v2[1] != ''):",
+                    "    %s[%s] = (STRING, set_char(v0[1], v1[1], v2[1][0]))" % (frame, key),
+                    "else:",
+                    "    %s()" % slow]
+
+def translate_conditional_jump(equal):
+    """
+    Creates a translator of the JUMPIFEQ or the JUMPIFNEQ instruction.
     
-    val2 = PROGRAM.data_stack.pop()
-    val1 = PROGRAM.data_stack.pop()
-    if val1[0] != "bool" or val2[0] != "bool":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    Parameters
+    ----------
+    equal : bool
+        The jump is taken, when the operands are equal.
+    """
+    def translator(record, index, namespace, slow):
+        if record[1] != "label" or record[3] in ("label", "type") or record[5] in ("label", "type"):
+            return None
+        return ["v1 = " + translate_symbol(record[3], record[4], index, 1, namespace),
+                "v2 = " + translate_symbol(record[5], record[6], index, 2, namespace),
+                "if v1 is None or v2 is None or (v1[0], v2[0]) not in EQUAL_TYPES:",
+                "    target = %s()" % slow,
+                "    if target is not None:",
+                "        return target",
+                "elif v1[1] %s v2[1]:" % ("==" if equal else "!="),
+                "    return %d" % record[7]]
+    
+    return translator
 
-    return [val1[1], val2[1]]
+def translate_stack_jump(equal):
+    """
+    Creates a translator of the JUMPIFEQS or the JUMPIFNEQS instruction.
+
+    Parameters
+    ----------
+    equal : bool
+        The jump is taken, when the operands are equal.
+    """
+    def translator(record, index, namespace, slow):
+        if record[1] != "label" or record[3] == None:
+            return None
+        return ["if len(DS) >= 2 and (DS[-2][0], DS[-1][0]) in EQUAL_TYPES:",
+                "    v2 = DS.pop()",
+                "    v1 = DS.pop()",
+                "    if v1[1] %s v2[1]:" % ("==" if equal else "!="),
+                "        return %d" % record[3],
+                "else:",
+                "    target = %s()" % slow,
+                "    if target is not None:",
+                "        return target"]
+
+    return translator
+
+def translate_defvar(record, index, namespace, slow):
+    """
+    Translates the DEFVAR instruction, see translate_instruction.
+    """
+    if record[1] != "var":
+        return None
+    frame, key = translate_var(record[2])
+    condition = "%s[%d] is not None" % (frame, key)
+    if frame != "GF":
+        condition = "not FRAMES.%s or %s" % (frame, condition)
+    return ["if %s:" % condition, "    %s()" % slow, "else:", "    %s[%d] = UNDEFINED" % (frame, key)]
+
+def translate_jump(record, index, namespace, slow):
+    """
+    Translates the JUMP instruction, see translate_instruction.
+    """
+    if record[1] != "label":
+        return None
+    return ["return %d" % record[3]]
+
+def translate_call(record, index, namespace, slow):
+    """
+    Translates the CALL instruction, see translate_instruction.
+    """
+    if record[1] != "label":
+        return None
+    return ["RS.append(%d)" % record[4], "return %d" % record[3]]
+
+def translate_return(record, index, namespace, slow):
+    """
+    Translates the RETURN instruction, see translate_instruction.
+    """
+    return ["if RS:", "    return RS.pop()", "%s()" % slow]
+
+def translate_exit(record, index, namespace, slow):
+    """
+    Translates the EXIT instruction with a literal operand, see translate_instruction.
+    """
+    if record[1] != "int" or not 0 <= record[2] < 50:
+        return None
+    return ["exit(%d)" % record[2]]
+
+TRANSLATORS = {"LABEL": lambda record, index, namespace, slow: [],
+               "MOVE": translate_unary("v1 is not UNDEFINED", "v1"),
+               "ADD": translate_binary("v1[0] == v2[0] and (v1[0] == INT or v1[0] == FLOAT)", "(v1[0], v1[1] + v2[1])"),
+               "SUB": translate_binary("v1[0] == v2[0] and (v1[0] == INT or v1[0] == FLOAT)", "(v1[0], v1[1] - v2[1])"),
+               "MUL": translate_binary("v1[0] == v2[0] and (v1[0] == INT or v1[0] == FLOAT)", "(v1[0], v1[1] * v2[1])"),
+               "IDIV": translate_binary("v1[0] == INT and v2[0] == INT and v2[1] != 0",
+                                        "(INT, int(v1[1] / v2[1]))"),
+               "LT": translate_binary("v1[0] == v2[0] and v1[0] != UNSET and v1[0] != NIL",
+                                      "TRUE_VALUE if v1[1] < v2[1] else FALSE_VALUE",
+                                      ("nil", "label", "type")),
+               "GT": translate_binary("v1[0] == v2[0] and v1[0] != UNSET and v1[0] != NIL",
+                                      "TRUE_VALUE if v1[1] > v2[1] else FALSE_VALUE",
+                                      ("nil", "label", "type")),
+               "EQ": translate_binary("(v1[0], v2[0]) in EQUAL_TYPES", "TRUE_VALUE if v1[1] == v2[1] else FALSE_VALUE"),
+               "AND": translate_binary("v1[0] == BOOL and v2[0] == BOOL",
+                                       "TRUE_VALUE if v1[1] and v2[1] else FALSE_VALUE"),
+               "OR": translate_binary("v1[0] == BOOL and v2[0] == BOOL", "TRUE_VALUE if v1[1] or v2[1] else FALSE_VALUE"),
+               "NOT": translate_unary("v1[0] == BOOL", "FALSE_VALUE if v1[1] else TRUE_VALUE"),
+               "CONCAT": translate_binary("v1[0] == STRING and v2[0] == STRING",
+                                          "(STRING, concat_strings(v1[1], v2[1]))"),
+               "STRLEN": translate_unary("v1[0] == STRING", "(INT, len(v1[1]))"),
+               "INT2CHAR": translate_unary("v1[0] == INT and 0 <= v1[1] <= 0x10FFFF", "(STRING, chr(v1[1]))"),
+               "STRI2INT": translate_binary("v1[0] == STRING and v2[0] == INT and 0 <= v2[1] < len(v1[1])",
+                                            "(INT, ord(v1[1][v2[1]]))"),
+               "GETCHAR": translate_binary("v1[0] == STRING and v2[0] == INT and 0 <= v2[1] < len(v1[1])",
+                                           "(STRING, v1[1][v2[1]])"),
+               "SETCHAR": translate_setchar,
+               "TYPE": lambda record, index, namespace, slow: None if record[3] != "var" else \
+                       translate_assignment(record, index, namespace, slow, "v1 is not None",
+                                            "(STRING, TYPE_NAMES[v1[0]])"),
+               "WRITE": translate_write, "PUSHS": translate_pushs, "POPS": translate_pops,
+               "JUMP": translate_jump, "JUMPIFEQ": translate_conditional_jump(True),
+               "JUMPIFNEQ": translate_conditional_jump(False), "CALL": translate_call, "RETURN": translate_return,
+               "EXIT": translate_exit, "DEFVAR": translate_defvar, "JUMPIFEQS": translate_stack_jump(True),
+               "JUMPIFNEQS": translate_stack_jump(False),
+               "INT2FLOAT": translate_unary("v1[0] == INT", "(FLOAT, float(v1[1]))"),
+               "FLOAT2INT": translate_unary("v1[0] == FLOAT", "(INT, int(v1[1]))")} # translators of instructions
+
+def execute_translated(blocks, ip):
+    """
+    Executes the translated program from the block starting at the index ip to its end, see translate_program.
+    
+    Parameters
+    ----------
+    blocks : list
+        The translated block starting at each index.
+    ip : int
+        The index of the first executed instruction.
+    """
+    end = len(blocks) - 1
+    while ip < end:
+        ip = blocks[ip]()
 
 def CREATEFRAME(operands):
     """
@@ -529,7 +4112,7 @@ def CREATEFRAME(operands):
         A list of operands in a specific format.
     """
     global FRAMES
-    FRAMES.temporary_frame.clear()
+    FRAMES.frames[FRAME_ROLES["TF"]] = [None] * len(FRAMES.local_names)
     FRAMES.TF = True
 
 def PUSHFRAME(operands):
@@ -543,20 +4126,12 @@ def PUSHFRAME(operands):
     """
     global FRAMES
     if not FRAMES.TF:
-        os._exit(Error.FRAME_ERR.value)
-
-    copy_dict = {}
-    for key, value in FRAMES.current_frame.items():
-        copy_dict[key] = value
+        exit_error(Error.FRAME_ERR)
 
-    FRAMES.local_frame.append(copy_dict)
-    FRAMES.current_frame.clear()
-
-    for key, value in FRAMES.temporary_frame.items():
-        key = 'L' + key[1:]
-        FRAMES.current_frame[key] = value
-    
-    FRAMES.temporary_frame.clear()
+    frames = FRAMES.frames
+    FRAMES.local_frame.append(frames[FRAME_ROLES["LF"]])
+    frames[FRAME_ROLES["LF"]] = frames[FRAME_ROLES["TF"]]
+    frames[FRAME_ROLES["TF"]] = FRAMES.no_frame
     FRAMES.TF = False
     FRAMES.LF += 1
 
@@ -571,17 +4146,13 @@ def POPFRAME(operands):
     """
     global FRAMES
     if not FRAMES.LF:
-        os._exit(Error.FRAME_ERR.value)
+        exit_error(Error.FRAME_ERR)
     
-    FRAMES.temporary_frame.clear()
+    frames = FRAMES.frames
+    frames[FRAME_ROLES["TF"]] = frames[FRAME_ROLES["LF"]]
+    frames[FRAME_ROLES["LF"]] = FRAMES.local_frame.pop()
     FRAMES.TF = True
-    for key, value in FRAMES.current_frame.items():
-        key = 'T' + key[1:]
-        FRAMES.temporary_frame[key] = value
-    
-    FRAMES.current_frame.clear()
     FRAMES.LF -= 1
-    FRAMES.current_frame.update(FRAMES.local_frame.pop())
 
 def PUSHS(operands):
     """
@@ -596,7 +4167,7 @@ def PUSHS(operands):
     if operands[1] == "var":
         value = get_var_value(operands[2])
     else:
-        value = [operands[1], operands[2]]
+        value = literal_value(operands[1], operands[2])
 
     PROGRAM.data_stack.append(value)
 
@@ -612,12 +4183,12 @@ def POPS(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     try:
         value = PROGRAM.data_stack.pop()
     except:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
     
     assign_var_value(operands[2], value[0], value[1])
 
@@ -637,10 +4208,10 @@ def CALL(operands):
     """
     global PROGRAM
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    PROGRAM.return_stack.append(PROGRAM.IP)
-    PROGRAM.IP = PROGRAM.labels[operands[2]]
+    PROGRAM.return_stack.append(operands[4])
+    return operands[3] or label_target(operands[2])
 
 def RETURN(operands):
     """
@@ -655,9 +4226,9 @@ def RETURN(operands):
     global PROGRAM
 
     try:
-        PROGRAM.IP = PROGRAM.return_stack.pop()
+        return PROGRAM.return_stack.pop()
     except:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
 def JUMP(operands):
     """
@@ -671,9 +4242,9 @@ def JUMP(operands):
     global PROGRAM
 
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    PROGRAM.IP = PROGRAM.labels[operands[2]]
+    return operands[3] or label_target(operands[2])
 
 def JUMPIFEQ(operands):
     """
@@ -686,13 +4257,13 @@ def JUMPIFEQ(operands):
     """
 
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     global PROGRAM
 
     values = get_values_logic(operands, True, "label")
-
+    
     if values[0] == values[1]:
-        PROGRAM.IP = PROGRAM.labels[operands[2]]
+        return operands[7] or label_target(operands[2])
 
 
 def JUMPIFNEQ(operands):
@@ -707,11 +4278,11 @@ def JUMPIFNEQ(operands):
     global PROGRAM
 
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     values = get_values_logic(operands, True, "label")
     if values[0] != values[1]:
-        PROGRAM.IP = PROGRAM.labels[operands[2]]
+        return operands[7] or label_target(operands[2])
 
 def DEFVAR(operands):
     """
@@ -725,26 +4296,13 @@ def DEFVAR(operands):
     """
     global FRAMES
     if operands[1] != "var":
-        os._exit(Error.SEMANTIC_ERR.value)
-
-    var = operands[2]
-    if var[:2] == "GF":
-        if var in FRAMES.global_frame:
-            os._exit(Error.SEMANTIC_ERR.value)
-        FRAMES.global_frame[var] = ["", ""]
-        return
-    elif var[:2] == "LF" and FRAMES.LF:
-        if var in FRAMES.current_frame:
-            os._exit(Error.SEMANTIC_ERR.value)
-        FRAMES.current_frame[var] = ["", ""]
-        return
-    elif var[:2] == "TF" and FRAMES.TF:
-        if var in FRAMES.temporary_frame:
-            os._exit(Error.SEMANTIC_ERR.value)
-        FRAMES.temporary_frame[var] = ["", ""]
-        return
+        exit_error(Error.SEMANTIC_ERR)
 
-    os._exit(Error.FRAME_ERR.value)
+    frame = var_frame(operands[2])
+    slot = var_slot(operands[2])
+    if frame[slot] is not None:
+        exit_error(Error.SEMANTIC_ERR)
+    frame[slot] = UNDEFINED
 
 def MOVE(operands):
     """
@@ -757,13 +4315,13 @@ def MOVE(operands):
     """
 
     if operands[1] != "var" or operands[3] == "label" or operands[3] == "type":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
         assign_var_value(operands[2], value[0], value[1])
     else:
-        assign_var_value(operands[2], operands[3], operands[4])
+        assign_var_value(operands[2], TYPE_TAGS[operands[3]], operands[4])
     
 def ADD(operands):
     """
@@ -816,11 +4374,11 @@ def IDIV(operands):
 
     values = get_values_math(operands)
 
-    if values[0] != "int":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if values[0] != INT:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     if int(values[2]) == 0:
-        os._exit(Error.OPERAND_VALUE_ERR.value)
+        exit_error(Error.OPERAND_VALUE_ERR)
 
     assign_var_value(operands[2], values[0], int(values[1] / values[2])) #TODO
 
@@ -836,11 +4394,11 @@ def DIV(operands):
 
     values = get_values_math(operands)
 
-    if values[0] != "float":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if values[0] != FLOAT:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     if values[2] == 0.0:
-        os._exit(Error.OPERAND_VALUE_ERR.value)
+        exit_error(Error.OPERAND_VALUE_ERR)
 
     assign_var_value(operands[2], values[0], values[1] / values[2]) 
 
@@ -855,30 +4413,30 @@ def WRITE(operands):
     """
 
     if operands[1] == "label" or operands[1] == "type":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[1] == "var":
         value = get_var_value(operands[2])
-        if value[0] == "bool":
+        if value[0] == BOOL:
             if value[1]:
-                print("true", end="")
+                OUTPUT.write("true")
             else:
-                print("false", end="")
-        elif value[0] == "float":
-            print(float.hex(value[1]), end='')
-        elif value[0] != "nil":
-            print(value[1], end="")
+                OUTPUT.write("false")
+        elif value[0] == FLOAT:
+            OUTPUT.write(float.hex(value[1]))
+        elif value[0] != NIL:
+            OUTPUT.write(str(value[1]))
     elif operands[1] == "bool":
         if operands[2] == "false":
-            print("false", end="")
+            OUTPUT.write("false")
         elif operands[2]:
-            print("true", end="")
+            OUTPUT.write("true")
         else:
-            print("false", end="")
+            OUTPUT.write("false")
     elif operands[1] == "float":
-        print(float.hex(operands[2]), end="")
+        OUTPUT.write(float.hex(operands[2]))
     elif operands[1] != "nil":
-        print(operands[2], end="")
+        OUTPUT.write(str(operands[2]))
 
 def READ(operands):
     """
@@ -891,15 +4449,15 @@ def READ(operands):
     """
 
     if operands[1] != "var" or operands[3] != "type":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     typ = operands[4]
+
+    if PIPELINE != None:
+        wait_for_program() # input consumed by a speculatively executed instruction could not be given back
     
     try:
-        if IN_BUFFER == None:
-            line = input()
-        else:
-            line = IN_BUFFER.pop(0)
+        line = INPUT.read_line()
     except:
         if typ == "bool":
             line = "false"
@@ -918,7 +4476,7 @@ def READ(operands):
         line = None
         typ = "nil"
     
-    assign_var_value(operands[2], typ, line)
+    assign_var_value(operands[2], TYPE_TAGS[typ], line)
 
 def CONCAT(operands):
     """
@@ -931,22 +4489,22 @@ def CONCAT(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value1 = get_var_value(operands[4])
     else:
-        value1 = [operands[3], operands[4]]
+        value1 = literal_value(operands[3], operands[4])
     
     if operands[5] == "var":
         value2 = get_var_value(operands[6])
     else:
-        value2 = [operands[5], operands[6]]
+        value2 = literal_value(operands[5], operands[6])
     
-    if value1[0] != value2[0] or value1[0] != "string":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if value1[0] != value2[0] or value1[0] != STRING:
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    assign_var_value(operands[2], "string", value1[1] + value2[1])
+    assign_var_value(operands[2], STRING, concat_strings(value1[1], value2[1]))
 
 def LT(operands):
     """
@@ -959,7 +4517,7 @@ def LT(operands):
     """
 
     values = get_values_logic(operands)
-    assign_var_value(operands[2], "bool", values[0] < values[1])
+    assign_var_value(operands[2], BOOL, values[0] < values[1])
 
 def GT(operands):
     """
@@ -972,7 +4530,7 @@ def GT(operands):
     """
 
     values = get_values_logic(operands)
-    assign_var_value(operands[2], "bool", values[0] > values[1])
+    assign_var_value(operands[2], BOOL, values[0] > values[1])
 
 def EQ(operands):
     """
@@ -984,7 +4542,7 @@ def EQ(operands):
         A list of operands in a specific format.
     """
     values = get_values_logic(operands, True)
-    assign_var_value(operands[2], "bool", values[0] == values[1])
+    assign_var_value(operands[2], BOOL, values[0] == values[1])
 
 def AND(operands):
     """
@@ -997,7 +4555,7 @@ def AND(operands):
     """
 
     values = get_values_bool(operands)
-    assign_var_value(operands[2], "bool", values[0] and values[1])
+    assign_var_value(operands[2], BOOL, values[0] and values[1])
 
 def OR(operands):
     """
@@ -1010,7 +4568,7 @@ def OR(operands):
     """
 
     values = get_values_bool(operands)
-    assign_var_value(operands[2], "bool", values[0] or values[1])
+    assign_var_value(operands[2], BOOL, values[0] or values[1])
 
 def STRLEN(operands):
     """
@@ -1023,19 +4581,19 @@ def STRLEN(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "string":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != STRING:
+            exit_error(Error.OPERAND_TYPE_ERR)
         string = value[1]
     elif operands[3] == "string":
         string = operands[4]
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    assign_var_value(operands[2], "int", len(string))
+    assign_var_value(operands[2], INT, len(string))
 
 def NOT(operands):
     """
@@ -1048,19 +4606,19 @@ def NOT(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "bool":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != BOOL:
+            exit_error(Error.OPERAND_TYPE_ERR)
         value = value[1]
     elif operands[3] == "bool":
         value = operands[4]
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    assign_var_value(operands[2], "bool", not value)
+    assign_var_value(operands[2], BOOL, not value)
 
 def INT2CHAR(operands):
     """
@@ -1074,22 +4632,24 @@ def INT2CHAR(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         value = value[1]
     elif operands[3] == "int":
         value = int(operands[4])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     try:
-        assign_var_value(operands[2], "string", chr(value))
+        char = chr(value)
     except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR)
+    
+    assign_var_value(operands[2], STRING, char)
 
 def STRI2INT(operands):
     """
@@ -1103,34 +4663,36 @@ def STRI2INT(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "string":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != STRING:
+            exit_error(Error.OPERAND_TYPE_ERR)
         string = value[1]
     elif operands[3] == "string":
         string = operands[4]
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[5] == "var":
         value = get_var_value(operands[6])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         index = value[1]
     elif operands[5] == "int":
         index = int(operands[6])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     if index < 0:
-        os._exit(Error.STRING_ERR.value)    
+        exit_error(Error.STRING_ERR)    
     try:
-        assign_var_value(operands[2], "int", ord(string[index]))
+        code = ord(string[index])
     except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR)
+    
+    assign_var_value(operands[2], INT, code)
 
 def GETCHAR(operands):
     """
@@ -1144,34 +4706,31 @@ def GETCHAR(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "string":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != STRING:
+            exit_error(Error.OPERAND_TYPE_ERR)
         string = value[1]
     elif operands[3] == "string":
         string = operands[4]
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[5] == "var":
         value = get_var_value(operands[6])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         index = value[1]
     elif operands[5] == "int":
         index = int(operands[6])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     if index < 0 or index >= len(string):
-        os._exit(Error.STRING_ERR.value) 
-    try:
-        assign_var_value(operands[2], "string", string[index])
-    except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR) 
+    assign_var_value(operands[2], STRING, string[index])
 
 def SETCHAR(operands):
     """
@@ -1185,41 +4744,40 @@ def SETCHAR(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     var = get_var_value(operands[2])
-    if var[0] != "string":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if var[0] != STRING:
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     string = var[1]
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         index = value[1]
     elif operands[3] == "int":
         index = int(operands[4])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[5] == "var":
         value = get_var_value(operands[6])
-        if value[0] != "string":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != STRING:
+            exit_error(Error.OPERAND_TYPE_ERR)
         replacement = value[1]
     elif operands[5] == "string":
         replacement = operands[6]
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if len(string) == 0 or index < 0 or len(string) <= index:
-        os._exit(Error.STRING_ERR.value)
-    try:
-        string = string[0:index] + replacement[0] + string[index + 1:]
-        assign_var_value(operands[2], "string", string)
-    except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR)
+    if len(replacement) == 0:
+        exit_error(Error.STRING_ERR)
+    
+    assign_var_value(operands[2], STRING, set_char(string, index, replacement[0]))
     
 def TYPE(operands):
     """
@@ -1232,14 +4790,14 @@ def TYPE(operands):
     """
 
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
-        typ = get_var_type(operands[4])
+        typ = TYPE_NAMES[get_var_type(operands[4])]
     elif operands[3] == "int" or operands[3] == "string" or operands[3] == "bool" or operands[3] == "nil":
         typ = operands[3]
     
-    assign_var_value(operands[2], "string", typ)
+    assign_var_value(operands[2], STRING, typ)
 
 def EXIT(operands):
     """
@@ -1253,26 +4811,26 @@ def EXIT(operands):
     """
     if operands[1] == "var":
         value = get_var_value(operands[2])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         value = value[1]
     elif operands[1] == "int":
         value = int(operands[2])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if value >= 0 and value < 50:
         exit(value)
     else:
-        os._exit(Error.OPERAND_VALUE_ERR.value)
+        exit_error(Error.OPERAND_VALUE_ERR)
 
 def DPRINT(operands):
     if operands[1] == "var":
         value = get_var_value(operands[2])
     else:
-        value = [operands[1], operands[2]]
+        value = literal_value(operands[1], operands[2])
     
-    if value[0] == "bool":
+    if value[0] == BOOL:
         if value[1] == "true":
             print("true", file=sys.stderr)
         elif value[1] == "false":
@@ -1281,10 +4839,30 @@ def DPRINT(operands):
             print("true", file=sys.stderr)
         else:
             print("false", file=sys.stderr)
-    elif value[0] == "int" or value[0] == "string":
+    elif value[0] == INT or value[0] == STRING:
         print(value[1], file=sys.stderr)
     
 
+def frame_variables(frame, names, prefix):
+    """
+    Lists the defined variables of a frame.
+
+    Parameters
+    ----------
+    frame: list
+        The frame indexed by slots.
+    names: list
+        The names of the variables by slots.
+    prefix: string
+        The prefix of the names.
+
+    Return
+    -------
+    list
+        The list of pairs (name, (type, value)).
+    """
+    return [(prefix + names[slot], value) for slot, value in enumerate(frame) if value is not None]
+
 def BREAK(operands):
     global PROGRAM, FRAMES
     print("Number of executed isntructions including this one:", PROGRAM.IC, file=sys.stderr)
@@ -1292,13 +4870,14 @@ def BREAK(operands):
 
     print("Values pushed on the stack from the top to bottom:", file=sys.stderr)
     for value in reversed(PROGRAM.data_stack):
-        print("type: ", value[0], ", value: ", value[1], sep='', file=sys.stderr)
+        print("type: ", TYPE_NAMES[value[0]], ", value: ", value[1], sep='', file=sys.stderr)
     print(file=sys.stderr)
 
-    if len(FRAMES.global_frame) > 0:
+    variables = frame_variables(FRAMES.global_frame, FRAMES.global_names, "")
+    if len(variables) > 0:
         print("Variables on the global frame:", file=sys.stderr)
-        for key in FRAMES.global_frame:
-            print("name: ", key, ", type: ", FRAMES.global_frame[key][0], ", value: ", FRAMES.global_frame[key][1], sep='', file=sys.stderr)
+        for key, value in variables:
+            print("name: ", key, ", type: ", TYPE_NAMES[value[0]], ", value: ", value[1], sep='', file=sys.stderr)
         
         print(file=sys.stderr)
     else:
@@ -1308,15 +4887,16 @@ def BREAK(operands):
         print("Variables on the local frame:", file=sys.stderr)
         i = 1
         print("Local frame immersion level 1:", file=sys.stderr)
-        for key in FRAMES.current_frame:
-            print("name: ", key, ", type: ", FRAMES.current_frame[key][0], ", value: ", FRAMES.current_frame[key][1], sep='', file=sys.stderr)
+        for key, value in frame_variables(FRAMES.frames[FRAME_ROLES["LF"]], FRAMES.local_names, "LF@"):
+            print("name: ", key, ", type: ", TYPE_NAMES[value[0]], ", value: ", value[1], sep='', file=sys.stderr)
         
         for frame in reversed(FRAMES.local_frame):
             i += 1
-            if len(frame):
+            variables = frame_variables(frame, FRAMES.local_names, "LF@")
+            if len(variables):
                 print("Local frame immersion level ", i, ":", sep="", file=sys.stderr)
-                for key in frame:
-                    print("name: ", key, ", type: ", frame[key][0], ", value: ", frame[key][1], sep='', file=sys.stderr)
+                for key, value in variables:
+                    print("name: ", key, ", type: ", TYPE_NAMES[value[0]], ", value: ", value[1], sep='', file=sys.stderr)
         
         print(file=sys.stderr)
     else:
@@ -1324,42 +4904,42 @@ def BREAK(operands):
     
     if FRAMES.TF:
         print("Variables on the temporary frame:", file=sys.stderr)
-        for key in FRAMES.temporary_frame:
-            print("name: ", key, ", type: ", FRAMES.temporary_frame[key][0], ", value: ", FRAMES.temporary_frame[key][1], sep='', file=sys.stderr)
+        for key, value in frame_variables(FRAMES.frames[FRAME_ROLES["TF"]], FRAMES.local_names, "TF@"):
+            print("name: ", key, ", type: ", TYPE_NAMES[value[0]], ", value: ", value[1], sep='', file=sys.stderr)
     else:
         print("There are no variables on the temporary frame.", file=sys.stderr)
 
 def INT2FLOAT(operands):
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "int":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != INT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         value = value[1]
     elif operands[3] == "int":
         value = int(operands[4])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    assign_var_value(operands[2], "float", float(value))
+    assign_var_value(operands[2], FLOAT, float(value))
 
 def FLOAT2INT(operands):
     if operands[1] != "var":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if operands[3] == "var":
         value = get_var_value(operands[4])
-        if value[0] != "float":
-            os._exit(Error.OPERAND_TYPE_ERR.value)
+        if value[0] != FLOAT:
+            exit_error(Error.OPERAND_TYPE_ERR)
         value = value[1]
     elif operands[3] == "float":
         value = float(operands[4])
     else:
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
     
-    assign_var_value(operands[2], "int", int(value))
+    assign_var_value(operands[2], INT, int(value))
 
 def CLEARS(operands):
     """
@@ -1385,7 +4965,7 @@ def ADDS(operands):
     global PROGRAM
     vals = get_stack_values_math()
 
-    PROGRAM.data_stack.append([vals[0], vals[1] + vals[2]])
+    PROGRAM.data_stack.append((vals[0], vals[1] + vals[2]))
 
 def SUBS(operands):
     """
@@ -1399,7 +4979,7 @@ def SUBS(operands):
     global PROGRAM
     vals = get_stack_values_math()
     
-    PROGRAM.data_stack.append([vals[0], vals[1] - vals[2]])
+    PROGRAM.data_stack.append((vals[0], vals[1] - vals[2]))
 
 def MULS(operands):
     """
@@ -1413,7 +4993,7 @@ def MULS(operands):
     global PROGRAM
     vals = get_stack_values_math()
     
-    PROGRAM.data_stack.append([vals[0], vals[1] * vals[2]])
+    PROGRAM.data_stack.append((vals[0], vals[1] * vals[2]))
 
 def IDIVS(operands):
     """
@@ -1427,13 +5007,13 @@ def IDIVS(operands):
     global PROGRAM
     vals = get_stack_values_math()
     
-    if vals[0] != "int":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if vals[0] != INT:
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if vals[2] == 0:
-        os._exit(Error.OPERAND_VALUE_ERR.value)
+        exit_error(Error.OPERAND_VALUE_ERR)
 
-    PROGRAM.data_stack.append([vals[0], int(vals[1] / vals[2])])
+    PROGRAM.data_stack.append((vals[0], int(vals[1] / vals[2])))
 
 def DIVS(operands):
     """
@@ -1447,13 +5027,13 @@ def DIVS(operands):
     global PROGRAM
     vals = get_stack_values_math()
     
-    if vals[0] != "float":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if vals[0] != FLOAT:
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     if vals[2] == 0.0:
-        os._exit(Error.OPERAND_VALUE_ERR.value)
+        exit_error(Error.OPERAND_VALUE_ERR)
 
-    PROGRAM.data_stack.append([vals[0], vals[1] / vals[2]])
+    PROGRAM.data_stack.append((vals[0], vals[1] / vals[2]))
 
 def LTS(operands):
     """
@@ -1467,7 +5047,7 @@ def LTS(operands):
     global PROGRAM
     vals = get_satack_values_logic()
     
-    PROGRAM.data_stack.append(["bool", vals[0] < vals[1]])
+    PROGRAM.data_stack.append(new_value(BOOL, vals[0] < vals[1]))
 
 def GTS(operands):
     """
@@ -1481,7 +5061,7 @@ def GTS(operands):
     global PROGRAM
     vals = get_satack_values_logic()
     
-    PROGRAM.data_stack.append(["bool", vals[0] > vals[1]])
+    PROGRAM.data_stack.append(new_value(BOOL, vals[0] > vals[1]))
 
 def EQS(operands):
     """
@@ -1495,7 +5075,7 @@ def EQS(operands):
     global PROGRAM
     vals = get_satack_values_logic(True)
     
-    PROGRAM.data_stack.append(["bool", vals[0] == vals[1]])
+    PROGRAM.data_stack.append(new_value(BOOL, vals[0] == vals[1]))
 
 def ANDS(operands):
     """
@@ -1509,7 +5089,7 @@ def ANDS(operands):
     global PROGRAM
     vals = get_satack_values_bool()
     
-    PROGRAM.data_stack.append(["bool", vals[0] and vals[1]])
+    PROGRAM.data_stack.append(new_value(BOOL, vals[0] and vals[1]))
 
 def ORS(operands):
     """
@@ -1523,7 +5103,7 @@ def ORS(operands):
     global PROGRAM
     vals = get_satack_values_bool()
     
-    PROGRAM.data_stack.append(["bool", vals[0] or vals[1]])
+    PROGRAM.data_stack.append(new_value(BOOL, vals[0] or vals[1]))
 
 def NOTS(operands):
     """
@@ -1536,12 +5116,12 @@ def NOTS(operands):
     """
     global PROGRAM
     if len(PROGRAM.data_stack) == 0:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
-    if PROGRAM.data_stack[-1][0] != "bool":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if PROGRAM.data_stack[-1][0] != BOOL:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
-    PROGRAM.data_stack[-1][1] = not PROGRAM.data_stack[-1][1]
+    PROGRAM.data_stack[-1] = FALSE_VALUE if PROGRAM.data_stack[-1][1] else TRUE_VALUE
 
 def STRI2INTS(operands):
     """
@@ -1554,18 +5134,18 @@ def STRI2INTS(operands):
     """
     global PROGRAM
     if len(PROGRAM.data_stack) < 2:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
     val2 = PROGRAM.data_stack.pop()
     val1 = PROGRAM.data_stack.pop()
 
-    if val1[0] != "string" or val2[0] != "int":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if val1[0] != STRING or val2[0] != INT:
+        exit_error(Error.OPERAND_TYPE_ERR)
     
     try:
-        PROGRAM.data_stack.append(["int", ord(val1[1][val2[1]])])
+        PROGRAM.data_stack.append((INT, ord(val1[1][val2[1]])))
     except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR)
     
 
 def INT2CHARS(operands):
@@ -1579,16 +5159,15 @@ def INT2CHARS(operands):
     """
     global PROGRAM
     if len(PROGRAM.data_stack) == 0:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
-    if PROGRAM.data_stack[-1][0] != "int":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if PROGRAM.data_stack[-1][0] != INT:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
-    PROGRAM.data_stack[-1][0] = "string"
     try:
-        PROGRAM.data_stack[-1][1] = chr(PROGRAM.data_stack[-1][1])
+        PROGRAM.data_stack[-1] = (STRING, chr(PROGRAM.data_stack[-1][1]))
     except:
-        os._exit(Error.STRING_ERR.value)
+        exit_error(Error.STRING_ERR)
 
 def JUMPIFEQS(operands):
     """
@@ -1601,11 +5180,11 @@ def JUMPIFEQS(operands):
     """
     global PROGRAM
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     values = get_satack_values_logic(True)
     if values[0] == values[1]:
-        PROGRAM.IP = PROGRAM.labels[operands[2]]
+        return operands[3] or label_target(operands[2])
 
 def JUMPIFNEQS(operands):
     """
@@ -1618,11 +5197,11 @@ def JUMPIFNEQS(operands):
     """
     global PROGRAM
     if operands[1] != "label":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+        exit_error(Error.OPERAND_TYPE_ERR)
 
     values = get_satack_values_logic(True)
     if values[0] != values[1]:
-        PROGRAM.IP = PROGRAM.labels[operands[2]]
+        return operands[3] or label_target(operands[2])
 
 def INT2FLOATS(operands):
     """
@@ -1635,13 +5214,12 @@ def INT2FLOATS(operands):
     """
     global PROGRAM
     if len(PROGRAM.data_stack) == 0:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
-    if PROGRAM.data_stack[-1][0] != "int":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if PROGRAM.data_stack[-1][0] != INT:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
-    PROGRAM.data_stack[-1][0] = "float"
-    PROGRAM.data_stack[-1][1] = float(PROGRAM.data_stack[-1][1])
+    PROGRAM.data_stack[-1] = (FLOAT, float(PROGRAM.data_stack[-1][1]))
 
 def FLOAT2INTS(operands):
     """
@@ -1654,24 +5232,12 @@ def FLOAT2INTS(operands):
     """
     global PROGRAM
     if len(PROGRAM.data_stack) == 0:
-        os._exit(Error.MISSING_VALUE_ERR.value)
+        exit_error(Error.MISSING_VALUE_ERR)
 
-    if PROGRAM.data_stack[-1][0] != "float":
-        os._exit(Error.OPERAND_TYPE_ERR.value)
+    if PROGRAM.data_stack[-1][0] != FLOAT:
+        exit_error(Error.OPERAND_TYPE_ERR)
 
-    PROGRAM.data_stack[-1][0] = "int"
-    PROGRAM.data_stack[-1][1] = int(PROGRAM.data_stack[-1][1])
-
-def NOP(operands):
-    """
-    Interprets missing intruction
-
-    Parameters
-    ----------
-    operands: list
-        A list of operands in a specific format.
-    """
-    pass
+    PROGRAM.data_stack[-1] = (INT, int(PROGRAM.data_stack[-1][1]))
 
 # ========================================= end functions ============================================
 
@@ -1681,16 +5247,64 @@ functions = {"MOVE" : MOVE, "DEFVAR" : DEFVAR, "ADD" : ADD, "SUB": SUB, "MUL": M
              "NOT": NOT, "GETCHAR": GETCHAR, "SETCHAR": SETCHAR, "TYPE": TYPE, "CALL": CALL, "RETURN": RETURN, "JUMP": JUMP, 
              "LABEL": LABEL, "JUMPIFEQ": JUMPIFEQ, "JUMPIFNEQ": JUMPIFNEQ, "CREATEFRAME": CREATEFRAME, "PUSHFRAME": PUSHFRAME, 
              "POPFRAME": POPFRAME, "EXIT": EXIT, "PUSHS": PUSHS, "POPS": POPS, "STRLEN": STRLEN, "BREAK": BREAK, 
-             "DPRINT": DPRINT, "NOP": NOP, "ADDS": ADDS, "SUBS": SUBS, "MULS": MULS, "IDIVS": IDIVS, "ANDS": ANDS, "ORS": ORS,
+             "DPRINT": DPRINT, "ADDS": ADDS, "SUBS": SUBS, "MULS": MULS, "IDIVS": IDIVS, "ANDS": ANDS, "ORS": ORS,
              "NOTS": NOTS, "JUMPIFEQS": JUMPIFEQS, "JUMPIFNEQS": JUMPIFNEQS, "STRI2INTS": STRI2INTS, "INT2CHARS": INT2CHARS,
              "CLEARS": CLEARS, "DIV": DIV, "DIVS": DIVS, "FLOAT2INTS": FLOAT2INTS, "INT2FLOATS": INT2FLOATS, "LTS": LTS,
              "GTS": GTS, "EQS": EQS, "FLOAT2INT": FLOAT2INT, "INT2FLOAT": INT2FLOAT}
 
 xml_input = parse_prog_arguments()
 
-instructions = parse_XML_input(xml_input)
-
-while PROGRAM.IP < len(instructions):
-    PROGRAM.IC += 1
-    functions[instructions[PROGRAM.IP][0]](instructions[PROGRAM.IP])
-    PROGRAM.IP += 1
+if OPTIONS.save_image != None:
+    write_image(OPTIONS.save_image, load_program(xml_input))
+    terminate(0)
+
+if OPTIONS.profile != None or OPTIONS.stats:
+    OPTIONS.pipeline = OPTIONS.translate = False
+if OPTIONS.stats:
+    OPTIONS.cache = None    # the cached programs do not keep the orders of the instructions
+
+try:
+    if OPTIONS.image != None:
+        program = load_image(OPTIONS.image)
+        if OPTIONS.translate:
+            instructions = [image_instruction(index) for index in range(len(program))]
+        elif OPTIONS.profile != None:
+            PROFILE = Profile([IMAGE_OPCODES[number] for number in IMAGE.opcodes])
+        elif OPTIONS.stats:
+            start_statistics([image_instruction(index) for index in range(len(program))])
+    else:
+        if OPTIONS.pipeline:
+            instructions = run_pipelined(xml_input)
+        else:
+            instructions = load_program(xml_input)
+        if not OPTIONS.translate:
+            program = compile_program(instructions)
+        if OPTIONS.profile != None:
+            PROFILE = Profile([inst[0] for inst in instructions])
+        elif OPTIONS.stats:
+            start_statistics(instructions)
+
+    if OPTIONS.report != None:
+        write_report(OPTIONS.report)
+    if OPTIONS.sample != None:
+        start_sampler(len(instructions) if OPTIONS.translate else len(program))
+
+    if OPTIONS.translate:
+        execute_translated(translate_program(instructions), PROGRAM.IP)
+    elif PROFILE != None:
+        execute_profiled(program, PROGRAM.IP)
+    elif STATS != None:
+        execute_statistics(program, PROGRAM.IP)
+    elif PROGRAM.counted:
+        execute_counted(program, PROGRAM.IP)
+    else:
+        execute(program, PROGRAM.IP)
+finally:
+    # also when the program ends by EXIT, the run time errors write them in terminate
+    if PROFILE != None:
+        write_profile(OPTIONS.profile)
+    if SAMPLER != None:
+        write_samples(OPTIONS.sample)
+    if STATS != None:
+        write_statistics()
+    OUTPUT.flush()